@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
@@ -17,6 +17,14 @@ class DataPaths:
     processed: Path = PROJECT_ROOT / "data" / "processed"
     artifacts: Path = PROJECT_ROOT / "fansight_artifacts"
     cache: Path = PROJECT_ROOT / "fansight_artifacts" / "cache"
+    # Storage format per dataset name ("csv", "parquet" or "feather").
+    formats: Dict[str, str] = field(default_factory=dict)
+    default_format: str = "csv"
+
+    def format_for(self, name: str) -> str:
+        """Return the storage format configured for a dataset."""
+
+        return self.formats.get(name, self.default_format)
 
 
 @dataclass(frozen=True)
@@ -57,6 +65,16 @@ class FeatureConfig:
         ]
     )
     target: str = "attendance"
+    # Trailing game_date windows materialized as touch_count_<window>;
+    # durations are pandas offsets ("7d", "90d") or "season".
+    touch_windows: List[str] = field(default_factory=lambda: ["7d", "30d"])
+    # Keep the one-hot block sparse end to end: the feature pipeline returns
+    # CSR even next to the dense scaled numerics, and the model fits on it.
+    # Saves memory with wide one-hot blocks; trees split CSR input slower.
+    sparse_output: bool = False
+    # Categorical columns with more distinct training values than this are
+    # target-encoded (one column each) instead of one-hot; None disables it.
+    max_onehot_levels: Optional[int] = 100
 
 
 @dataclass(frozen=True)
@@ -65,10 +83,101 @@ class ModelConfig:
 
     test_size: float = 0.2
     random_state: int = 42
+    # Regressor behind AttendanceForecaster: "gbr" (GradientBoostingRegressor
+    # on one-hot features) or "hist_gbr" (HistGradientBoostingRegressor with
+    # native categoricals and early stopping; n_estimators caps its iterations).
+    engine: str = "gbr"
     n_estimators: int = 400
     max_depth: Optional[int] = 8
+    learning_rate: float = 0.1
+    # hist_gbr only: stop once the score on a held-out validation_fraction of
+    # the training rows hasn't improved for n_iter_no_change iterations.
+    early_stopping: bool = True
+    validation_fraction: float = 0.1
+    n_iter_no_change: int = 10
     forecast_horizon: int = 3
     segment_k: int = 6
+    # Segmentation: "kmeans" (full batch) or "minibatch" (MiniBatchKMeans fed
+    # shuffled segment_batch_size-row chunks via partial_fit for segment_epochs
+    # passes). The silhouette is scored on segment_silhouette_sample rows;
+    # None scores every row, which is quadratic in the row count.
+    segment_engine: str = "kmeans"
+    # "fan" clusters one row per fan_id (touch counts averaged over the fan's
+    # games) and broadcasts labels back; "row" clusters the input rows as given.
+    segment_grain: str = "fan"
+    segment_batch_size: int = 16_384
+    segment_epochs: int = 3
+    segment_silhouette_sample: Optional[int] = 10_000
+    # Trace allocations during segmentation fits to report their own peak
+    # memory; off by default because tracemalloc slows fits several-fold.
+    segment_trace_memory: bool = False
+    # segmentation.sweep_segment_counts: k values fitted in segment_workers
+    # processes (None uses every core) and the criterion that picks the winner.
+    segment_k_candidates: List[int] = field(default_factory=lambda: list(range(3, 11)))
+    segment_workers: Optional[int] = None
+    segment_selection: str = "silhouette"
+    # Rows scored per batch by AttendanceForecaster.predict_iter/predict_batches.
+    predict_batch_size: int = 50_000
+    # AttendanceForecaster.update: boosting stages added per warm start, and
+    # the drift (mean shift in fitted std units, share of unseen categories)
+    # beyond which the model is refit on full history instead.
+    warm_start_estimators: int = 50
+    drift_max_shift: float = 1.0
+    drift_max_unseen_rate: float = 0.05
+    drift_exempt: List[str] = field(default_factory=lambda: ["game_id", "fan_id"])
+    # Registered versions kept per model name; older unpromoted ones are
+    # deleted after each registration. None keeps every version.
+    registry_keep_last: Optional[int] = 10
+
+
+@dataclass(frozen=True)
+class EtlConfig:
+    """Controls how the ETL stage materializes and reuses datasets."""
+
+    use_cache: bool = True
+    cache_max_bytes: int = 2 * 1024**3
+    # Out-of-core builds: touch rows read per chunk and fan_id range partitions.
+    stream_chunksize: int = 500_000
+    stream_partitions: int = 16
+    # Worker processes for the per-fan ETL steps; 1 keeps everything in-process.
+    workers: int = 1
+    # Store loaded and built tables with categorical/downcast dtypes.
+    compact_dtypes: bool = True
+    # incremental.append_campaign_touches writes changed fans to a changes file
+    # and folds it into the processed dataset once it exceeds this fraction.
+    incremental_compact_fraction: float = 0.2
+    # Reuse transformed feature matrices (fansight.features.store) across
+    # predict/dashboard calls and processes.
+    feature_store: bool = True
+    feature_store_max_bytes: int = 4 * 1024**3
+
+
+@dataclass(frozen=True)
+class TuningConfig:
+    """Cross-validation and search settings for ``fansight.models.tuning``."""
+
+    # Expanding-window folds over game_date; each tests on the next block of dates.
+    n_splits: int = 4
+    # Worker processes for candidate fits; None uses every core.
+    workers: Optional[int] = None
+    # Successive halving keeps the best 1/halving_factor candidates per rung
+    # and multiplies their training rows by it; 1 evaluates all on full data.
+    halving_factor: int = 3
+    min_train_rows: int = 2_000
+    leaderboard_name: str = "tuning_leaderboard.csv"
+
+
+@dataclass(frozen=True)
+class ServingConfig:
+    """Settings for the HTTP scoring endpoint in ``fansight.serving``."""
+
+    host: str = "127.0.0.1"
+    port: int = 8080
+    # Concurrent requests are coalesced into one predict call of up to
+    # max_batch_size records, waiting at most max_wait_ms for it to fill.
+    max_batch_size: int = 256
+    max_wait_ms: float = 1.0
+    max_body_bytes: int = 8 * 1024**2
 
 
 @dataclass(frozen=True)
@@ -78,6 +187,9 @@ class ProjectConfig:
     paths: DataPaths = field(default_factory=DataPaths)
     features: FeatureConfig = field(default_factory=FeatureConfig)
     model: ModelConfig = field(default_factory=ModelConfig)
+    etl: EtlConfig = field(default_factory=EtlConfig)
+    tuning: TuningConfig = field(default_factory=TuningConfig)
+    serving: ServingConfig = field(default_factory=ServingConfig)
 
 
 DEFAULT_CONFIG = ProjectConfig()
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Dict, Tuple, Union
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from fansight.config import DEFAULT_CONFIG, ProjectConfig, ensure_directories
-from fansight.data import sources
+from fansight.data import schemas, sources
 from fansight.utils import io
+from fansight.utils import dtypes
+from fansight.utils.cache import DatasetCache
 
 LOGGER = logging.getLogger(__name__)
 
+ETL_INPUTS = ("games", "fans", "campaign_touches")
+
 
 def _ensure_columns(
     df: pd.DataFrame, defaults: Dict[str, Union[float, int, str]]
@@ -27,6 +36,8 @@ def _ensure_columns(
 
 
 def _most_frequent(series: pd.Series, default: str = "unknown") -> str:
+    """Reference per-group mode; ``_group_mode`` is its vectorized equivalent."""
+
     if series.empty:
         return default
     mode = series.mode()
@@ -35,37 +46,67 @@ def _most_frequent(series: pd.Series, default: str = "unknown") -> str:
     return series.iloc[0]
 
 
+def _group_mode(values: pd.Series, group_ids: np.ndarray) -> pd.Series:
+    """Most frequent entry of ``values`` per ``group_ids`` group without per-group Python calls.
+
+    Values are factorized in sorted order and (group, code) pairs are counted in
+    one pass; ties resolve to the smallest value, matching ``Series.mode``.
+    Groups whose values are all missing yield NaN, as ``_most_frequent`` does.
+    """
+
+    n_groups = int(group_ids.max()) + 1 if len(group_ids) else 0
+    codes, uniques = pd.factorize(values, sort=True)
+    valid = codes >= 0
+    n_codes = max(len(uniques), 1)
+    pairs, counts = np.unique(
+        group_ids[valid].astype(np.int64) * n_codes + codes[valid], return_counts=True
+    )
+    pair_groups, pair_codes = np.divmod(pairs, n_codes)
+    order = np.lexsort((pair_codes, -counts, pair_groups))
+    pair_groups, pair_codes = pair_groups[order], pair_codes[order]
+    first = np.ones(len(pair_groups), dtype=bool)
+    first[1:] = pair_groups[1:] != pair_groups[:-1]
+
+    result = np.full(n_groups, np.nan, dtype=object)
+    result[pair_groups[first]] = np.asarray(uniques, dtype=object)[pair_codes[first]]
+    return pd.Series(result, name=values.name).astype(values.dtype)
+
+
+TOUCH_DEFAULTS: Dict[str, Union[float, int, str]] = {
+    "game_id": np.nan,
+    "campaign_spend": 0.0,
+    "conversion": 0.0,
+    "campaign_channel": "unknown",
+    "promotion_flag": 0,
+    "variant": "control",
+}
+
+
 def aggregate_campaign_touches(campaigns: pd.DataFrame) -> pd.DataFrame:
     """Aggregate campaign touches to a fan/game grain."""
 
     campaigns = campaigns.copy()
-    defaults = {
-        "game_id": np.nan,
-        "campaign_spend": 0.0,
-        "conversion": 0.0,
-        "campaign_channel": "unknown",
-        "promotion_flag": 0,
-        "variant": "control",
-    }
-    campaigns = _ensure_columns(campaigns, defaults)
+    campaigns = _ensure_columns(campaigns, TOUCH_DEFAULTS)
 
     campaigns["touch_date"] = pd.to_datetime(campaigns["touch_date"])
     campaigns["touch_count"] = 1
 
-    grouped = (
-        campaigns.groupby(["fan_id", "game_id"], dropna=False)
-        .agg(
-            {
-                "touch_count": "sum",
-                "campaign_spend": "sum",
-                "conversion": "sum",
-                "campaign_channel": lambda s: _most_frequent(s),
-                "promotion_flag": "max",
-                "variant": lambda s: _most_frequent(s, default="control"),
-            }
-        )
-        .reset_index()
+    groups = campaigns.groupby(["fan_id", "game_id"], dropna=False)
+    grouped = groups.agg(
+        {
+            "touch_count": "sum",
+            "campaign_spend": "sum",
+            "conversion": "sum",
+            "promotion_flag": "max",
+        }
+    ).reset_index()
+    group_ids = groups.ngroup().to_numpy()
+    grouped.insert(
+        grouped.columns.get_loc("promotion_flag"),
+        "campaign_channel",
+        _group_mode(campaigns["campaign_channel"], group_ids),
     )
+    grouped["variant"] = _group_mode(campaigns["variant"], group_ids)
     grouped.rename(
         columns={
             "touch_count": "touch_count_total",
@@ -77,6 +118,75 @@ def aggregate_campaign_touches(campaigns: pd.DataFrame) -> pd.DataFrame:
     return grouped
 
 
+def _run_starts(boundary: np.ndarray) -> np.ndarray:
+    """Index of the first row of the run each row belongs to."""
+
+    positions = np.arange(len(boundary))
+    return np.maximum.accumulate(np.where(boundary, positions, 0))
+
+
+def _season_labels(df: pd.DataFrame, date_col: str) -> np.ndarray:
+    if "season" in df.columns and df["season"].notna().all():
+        return pd.factorize(df["season"])[0]
+    # Without a season column, seasons run August-July so winter leagues stay whole.
+    dates = df[date_col]
+    return (dates.dt.year - (dates.dt.month < 8)).fillna(-1).to_numpy()
+
+
+def add_touch_windows(
+    df: pd.DataFrame,
+    windows: List[str],
+    *,
+    value_col: str = "touch_count_total",
+    date_col: str = "game_date",
+    key_col: str = "fan_id",
+) -> pd.DataFrame:
+    """Add ``touch_count_<window>`` trailing sums per fan.
+
+    ``df`` must be sorted by ``key_col`` then ``date_col``. A duration window
+    such as ``"7d"`` covers ``(t - 7 days, t]``; ``"season"`` covers the fan's
+    games so far in the current season. All windows share one cumulative sum,
+    and each row's window start is found by binary search on a composite
+    (fan, timestamp) key, so no per-fan rolling groupby is needed.
+    """
+
+    n_rows = len(df)
+    values = df[value_col].to_numpy(dtype=float)
+    cumulative = np.zeros(n_rows + 1)
+    np.cumsum(values, out=cumulative[1:])
+    positions = np.arange(n_rows)
+
+    fan_codes = pd.factorize(df[key_col])[0].astype(np.int64)
+    fan_boundary = np.ones(n_rows, dtype=bool)
+    fan_boundary[1:] = fan_codes[1:] != fan_codes[:-1]
+    fan_starts = _run_starts(fan_boundary)
+
+    dates = pd.to_datetime(df[date_col])
+    valid = dates.notna().to_numpy()
+    seconds = np.zeros(n_rows, dtype=np.int64)
+    if valid.any():
+        seconds[valid] = (dates[valid] - dates[valid].min()) // pd.Timedelta(seconds=1)
+    span = int(seconds.max()) + 2 if n_rows else 1
+    # Undated rows sort last within a fan; give them the largest offset.
+    seconds[~valid] = span - 1
+    keys = fan_codes * span + seconds
+
+    for window in windows:
+        if window == "season":
+            seasons = _season_labels(df, date_col)
+            boundary = fan_boundary.copy()
+            boundary[1:] |= seasons[1:] != seasons[:-1]
+            starts = _run_starts(boundary)
+        else:
+            width = int(pd.Timedelta(window) // pd.Timedelta(seconds=1))
+            starts = np.searchsorted(keys, keys - width, side="right")
+            starts = np.maximum(starts, fan_starts)
+        totals = cumulative[positions + 1] - cumulative[starts]
+        totals[~valid] = values[~valid]
+        df[f"touch_count_{window}"] = totals
+    return df
+
+
 def build_fan_game_dataset(
     games: pd.DataFrame,
     fans: pd.DataFrame,
@@ -87,15 +197,71 @@ def build_fan_game_dataset(
     """Create the modeling table at a fan/game granularity."""
 
     ensure_directories(config)
-    games = games.copy()
-    fans = fans.copy()
     campaign_agg = aggregate_campaign_touches(campaigns)
+    return assemble_fan_game_dataset(campaign_agg, games, fans, config=config)
 
-    # Create every fan-game combination that has at least one touch
-    merged = campaign_agg.merge(fans, on="fan_id", how="left")
-    merged = merged.merge(
-        games, on="game_id", how="left", suffixes=("_fan", "_game")
-    )
+
+def partition_bounds(fan_ids: pd.Series, n_partitions: int) -> np.ndarray:
+    """Split the sorted fan_id domain into ``n_partitions`` contiguous ranges.
+
+    Cuts are quantiles of ``fan_ids``, so passing touch rows balances the
+    partitions by touch volume; use ``np.searchsorted(bounds, ids, "right")``
+    to assign rows.
+    """
+
+    values = np.sort(fan_ids.dropna().to_numpy())
+    if len(values) == 0 or n_partitions <= 1:
+        return values[:0]
+    cuts = np.linspace(0, len(values), n_partitions + 1)[1:-1].astype(int)
+    return np.unique(values[cuts])
+
+
+def _build_shard(
+    payload: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, ProjectConfig]
+) -> pd.DataFrame:
+    games, fans, campaigns, config = payload
+    return build_fan_game_dataset(games, fans, campaigns, config=config)
+
+
+def build_fan_game_dataset_parallel(
+    games: pd.DataFrame,
+    fans: pd.DataFrame,
+    campaigns: pd.DataFrame,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """Run :func:`build_fan_game_dataset` over fan_id shards in a process pool.
+
+    Shards are contiguous fan_id ranges (several per worker for balance), so
+    concatenating results in shard order reproduces the serial row order
+    exactly, even when fan_id is not one of the output columns.
+    """
+
+    workers = workers or config.etl.workers
+    if workers <= 1:
+        return build_fan_game_dataset(games, fans, campaigns, config=config)
+
+    ensure_directories(config)
+    bounds = partition_bounds(campaigns["fan_id"], workers * 4)
+    touch_shard = np.searchsorted(bounds, campaigns["fan_id"].to_numpy(), side="right")
+    fan_shard = np.searchsorted(bounds, fans["fan_id"].to_numpy(), side="right")
+    payloads = [
+        (games, fans[fan_shard == shard], campaigns[touch_shard == shard], config)
+        for shard in range(len(bounds) + 1)
+        if (touch_shard == shard).any()
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_build_shard, payloads))
+    dataset = pd.concat(parts, ignore_index=True)
+    if config.etl.compact_dtypes:
+        # Shards infer their own categories; re-derive them for the whole table.
+        dataset = dtypes.compact_dtypes(dataset, categorical=config.features.categorical)
+    return dataset
+
+
+def _resolve_dimension_columns(merged: pd.DataFrame) -> None:
+    """Settle fan/game column name clashes left by the ``_fan``/``_game`` merge suffixes."""
 
     rename_map = {
         "campaign_channel_fan": "campaign_channel",
@@ -109,6 +275,50 @@ def build_fan_game_dataset(
         if redundant in merged.columns:
             merged.drop(columns=redundant, inplace=True)
 
+
+def iter_fan_game_grid(
+    fans: pd.DataFrame,
+    games: pd.DataFrame,
+    *,
+    rows_per_chunk: int = 50_000,
+) -> Iterator[pd.DataFrame]:
+    """Yield every fan x game pairing in chunks of whole fans, for scoring upcoming games.
+
+    Columns match :func:`assemble_fan_game_dataset` except the touch-derived
+    ones, which do not exist before any campaign runs.
+    """
+
+    fans_per_chunk = max(1, rows_per_chunk // max(1, len(games)))
+    for start in range(0, len(fans), fans_per_chunk):
+        grid = fans.iloc[start : start + fans_per_chunk].merge(
+            games, how="cross", suffixes=("_fan", "_game")
+        )
+        _resolve_dimension_columns(grid)
+        grid["game_date"] = pd.to_datetime(grid["game_date"])
+        grid["loyalty_engagement"] = grid["loyalty_score"] * grid["engagement_score"]
+        yield grid
+
+
+def assemble_fan_game_dataset(
+    campaign_agg: pd.DataFrame,
+    games: pd.DataFrame,
+    fans: pd.DataFrame,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> pd.DataFrame:
+    """Join aggregated touches to the fan and game dimensions.
+
+    Every step is per fan, so passing the aggregate rows of a subset of fans
+    yields exactly those fans' rows of the full dataset.
+    """
+
+    # Create every fan-game combination that has at least one touch
+    merged = campaign_agg.merge(fans, on="fan_id", how="left")
+    merged = merged.merge(
+        games, on="game_id", how="left", suffixes=("_fan", "_game")
+    )
+    _resolve_dimension_columns(merged)
+
     if merged["game_id"].isna().any():
         LOGGER.warning("Campaign touches reference unknown game_ids.")
         merged = merged.dropna(subset=["game_id"])
@@ -116,20 +326,8 @@ def build_fan_game_dataset(
     merged["game_date"] = pd.to_datetime(merged["game_date"])
     merged = merged.sort_values(["fan_id", "game_date"]).reset_index(drop=True)
 
-    # Fill time based helpers
-    merged["touch_count_7d"] = (
-        merged.groupby("fan_id")["touch_count_total"]
-        .rolling(window=3, min_periods=1)
-        .sum()
-        .reset_index(level=0, drop=True)
-    )
-
-    merged["touch_count_30d"] = (
-        merged.groupby("fan_id")["touch_count_total"]
-        .rolling(window=5, min_periods=1)
-        .sum()
-        .reset_index(level=0, drop=True)
-    )
+    # Trailing touch totals over the configured game_date windows
+    merged = add_touch_windows(merged, config.features.touch_windows)
 
     # Derive loyalty uplift proxy
     merged["loyalty_engagement"] = merged["loyalty_score"] * merged["engagement_score"]
@@ -139,30 +337,74 @@ def build_fan_game_dataset(
         + config.features.numerical
         + [config.features.target]
     )
-    metadata_cols = ["variant"]
+    # Every configured window is kept, even one not (yet) listed in numerical.
+    window_cols = [f"touch_count_{window}" for window in config.features.touch_windows]
+    # game_date orders the rows for time-based CV and incremental retraining.
+    metadata_cols = ["game_date", "variant"]
     available_cols = [
-        c for c in feature_cols + metadata_cols if c in merged.columns
+        c for c in dict.fromkeys(feature_cols + window_cols + metadata_cols) if c in merged.columns
     ]
     dataset = merged[available_cols].copy()
     dataset.dropna(subset=[config.features.target], inplace=True)
+    if config.etl.compact_dtypes:
+        dataset = dtypes.compact_dtypes(dataset, categorical=config.features.categorical)
 
     return dataset
 
 
+def get_cache(config: ProjectConfig = DEFAULT_CONFIG) -> DatasetCache:
+    """Return the ETL materialization cache rooted under ``paths.cache``."""
+
+    return DatasetCache(config.paths.cache / "etl", max_bytes=config.etl.cache_max_bytes)
+
+
+def _code_version() -> str:
+    digest = hashlib.sha256()
+    for module in (sys.modules[__name__], sources, schemas, io, dtypes):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(
+    cache: DatasetCache,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    extra_files: Sequence[Path] = (),
+) -> str:
+    """Key the ETL output on input file contents, feature config and code."""
+
+    files = [io.get_processed_path(name, config=config) for name in ETL_INPUTS]
+    files += [path for path in extra_files if path.exists()]
+    params = {
+        "features": asdict(config.features),
+        "compact_dtypes": config.etl.compact_dtypes,
+        "code": _code_version(),
+    }
+    return cache.fingerprint(files, params)
+
+
+def changes_path(name: str, config: ProjectConfig = DEFAULT_CONFIG) -> Path:
+    """Rows of fans updated by incremental appends since ``name`` was last written."""
+
+    path = io.get_processed_path(name, config=config)
+    return path.with_name(f"{name}_changes{path.suffix}")
+
+
 def build_and_save_dataset(
     name: str,
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
+    cache: Optional[DatasetCache] = None,
 ) -> Tuple[pd.DataFrame, str]:
-    """Full ETL routine that saves the processed dataset."""
-
-    data_map = sources.load_all(config=config)
-    dataset = build_fan_game_dataset(
-        games=data_map["games"],
-        fans=data_map["fans"],
-        campaigns=data_map["campaigns"],
-        config=config,
-    )
-    output_path = io.get_processed_path(name, config=config)
-    io.save_dataframe(dataset, output_path)
-    return dataset, str(output_path)
+    """Full ETL routine that saves the processed dataset.
+
+    Delegates to :func:`fansight.data.incremental.rebuild_dataset`, so the
+    touch state, pending changes and cache key stay in step with appends.
+    When ``config.etl.use_cache`` is set, the dataset is reused from the cache
+    if the inputs, touch state, feature config and ETL code are unchanged.
+    """
+
+    # Imported here: incremental builds on this module.
+    from fansight.data import incremental
+
+    return incremental.rebuild_dataset(name, config=config, cache=cache)
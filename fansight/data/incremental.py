@@ -0,0 +1,365 @@
+"""Incremental ETL that folds newly appended campaign touches into the dataset."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig, ensure_directories
+from fansight.data import etl, sources
+from fansight.utils import dtypes, io
+from fansight.utils.cache import DatasetCache, hash_file
+
+LOGGER = logging.getLogger(__name__)
+
+KEYS = ["fan_id", "game_id"]
+MODE_COLUMNS = {"campaign_channel": "unknown", "variant": "control"}
+
+
+@dataclass
+class TouchState:
+    """Mergeable aggregate of every touch seen so far.
+
+    ``totals`` holds the per (fan_id, game_id) sums and max; ``counts`` holds
+    per-category touch counts for each mode column so the most frequent value
+    can be recomputed exactly after new touches arrive.
+    """
+
+    totals: pd.DataFrame
+    counts: dict
+    # Digest of the campaign_touches input the state was built from.
+    source: Optional[str] = None
+
+
+def _prepare(touches: pd.DataFrame) -> pd.DataFrame:
+    touches = etl._ensure_columns(touches.copy(), etl.TOUCH_DEFAULTS)
+    touches["touch_date"] = pd.to_datetime(touches["touch_date"])
+    return touches
+
+
+def _category_counts(touches: pd.DataFrame, column: str) -> pd.DataFrame:
+    # Series.mode ignores missing values, so they never count towards the mode.
+    present = touches[touches[column].notna()]
+    return (
+        present.groupby(KEYS + [column], dropna=False, observed=True)
+        .size()
+        .rename("count")
+        .reset_index()
+    )
+
+
+def _check_state(state: TouchState) -> TouchState:
+    # Every counts row is an observed (fan, game, value) triple, so there can
+    # be no more of them than touches; more means unobserved categories leaked in.
+    touches = int(state.totals["touch_count"].sum())
+    for column, frame in state.counts.items():
+        if len(frame) > touches or (frame["count"] <= 0).any():
+            raise ValueError(
+                f"Touch state for {column} has {len(frame)} rows for {touches} touches; "
+                "category counts must only hold observed values."
+            )
+    return state
+
+
+def build_touch_state(touches: pd.DataFrame) -> TouchState:
+    """Summarize a batch of raw touches into a :class:`TouchState`."""
+
+    touches = _prepare(touches)
+    totals = (
+        touches.groupby(KEYS, dropna=False, observed=True)
+        .agg(
+            touch_count=("fan_id", "size"),
+            campaign_spend=("campaign_spend", "sum"),
+            conversion=("conversion", "sum"),
+            promotion_flag=("promotion_flag", "max"),
+        )
+        .reset_index()
+    )
+    counts = {column: _category_counts(touches, column) for column in MODE_COLUMNS}
+    return _check_state(TouchState(totals=totals, counts=counts))
+
+
+def _merge_totals(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    return (
+        pd.concat([old, new], ignore_index=True)
+        .groupby(KEYS, dropna=False, observed=True)
+        .agg(
+            touch_count=("touch_count", "sum"),
+            campaign_spend=("campaign_spend", "sum"),
+            conversion=("conversion", "sum"),
+            promotion_flag=("promotion_flag", "max"),
+        )
+        .reset_index()
+    )
+
+
+def _merge_counts(old: pd.DataFrame, new: pd.DataFrame, column: str) -> pd.DataFrame:
+    return (
+        pd.concat([old, new], ignore_index=True)
+        .groupby(KEYS + [column], dropna=False, observed=True)["count"]
+        .sum()
+        .reset_index()
+    )
+
+
+def update_touch_state(
+    state: TouchState, new_touches: pd.DataFrame
+) -> Tuple[TouchState, List[int]]:
+    """Fold new touches into ``state``, re-aggregating only the affected fans."""
+
+    delta = build_touch_state(new_touches)
+    affected = sorted(delta.totals["fan_id"].unique().tolist())
+
+    untouched = ~state.totals["fan_id"].isin(affected)
+    totals = pd.concat(
+        [
+            state.totals[untouched],
+            _merge_totals(state.totals[~untouched], delta.totals),
+        ],
+        ignore_index=True,
+    )
+    counts = {}
+    for column, frame in state.counts.items():
+        keep = ~frame["fan_id"].isin(affected)
+        counts[column] = pd.concat(
+            [frame[keep], _merge_counts(frame[~keep], delta.counts[column], column)],
+            ignore_index=True,
+        )
+    updated = TouchState(totals=totals, counts=counts, source=getattr(state, "source", None))
+    return _check_state(updated), affected
+
+
+def state_to_aggregate(
+    state: TouchState, fan_ids: Optional[Iterable[int]] = None
+) -> pd.DataFrame:
+    """Return rows shaped like :func:`etl.aggregate_campaign_touches` output."""
+
+    totals = state.totals
+    counts = state.counts
+    if fan_ids is not None:
+        fan_ids = list(fan_ids)
+        totals = totals[totals["fan_id"].isin(fan_ids)]
+        counts = {c: f[f["fan_id"].isin(fan_ids)] for c, f in counts.items()}
+
+    agg = totals.sort_values(KEYS).reset_index(drop=True)
+    for column in MODE_COLUMNS:
+        # Most frequent value per group; ties go to the smallest value like Series.mode.
+        mode = (
+            counts[column]
+            .sort_values(KEYS + ["count", column], ascending=[True, True, False, True])
+            .drop_duplicates(KEYS)[KEYS + [column]]
+        )
+        agg = agg.merge(mode, on=KEYS, how="left")
+
+    agg = agg.rename(columns={"touch_count": "touch_count_total", "conversion": "conversions"})
+    return agg[
+        KEYS
+        + [
+            "touch_count_total",
+            "campaign_spend",
+            "conversions",
+            "campaign_channel",
+            "promotion_flag",
+            "variant",
+        ]
+    ]
+
+
+def touch_state_path(name: str, config: ProjectConfig = DEFAULT_CONFIG) -> Path:
+    return config.paths.processed / f"{name}_touch_state.pkl"
+
+
+def save_touch_state(state: TouchState, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as handle:
+        pickle.dump(state, handle)
+    tmp.replace(path)
+
+
+def load_touch_state(path: Path) -> TouchState:
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No touch state at {path}; run rebuild_dataset (FanSightPipeline.run_etl) "
+            "before appending touches."
+        )
+    with path.open("rb") as handle:
+        return pickle.load(handle)
+
+
+def _touches_digest(config: ProjectConfig, cache: Optional[DatasetCache]) -> str:
+    path = io.get_processed_path("campaign_touches", config=config)
+    return cache.file_digest(path) if cache is not None else hash_file(path)
+
+
+def _read_dataset(path: Path, config: ProjectConfig) -> pd.DataFrame:
+    df = io.load_table(path, parse_dates=["game_date"])
+    if config.etl.compact_dtypes:
+        df = dtypes.compact_dtypes(df, categorical=config.features.categorical)
+    return df
+
+
+def _overlay(base: pd.DataFrame, rows: pd.DataFrame, config: ProjectConfig) -> pd.DataFrame:
+    """``base`` with every fan in ``rows`` replaced by its rows there, in fan_id order."""
+
+    if "fan_id" not in base.columns:
+        raise ValueError("Incremental ETL requires fan_id in the processed dataset.")
+    kept = base[~base["fan_id"].isin(rows["fan_id"].unique())]
+    merged = (
+        pd.concat([kept, rows], ignore_index=True)
+        .sort_values("fan_id", kind="mergesort")
+        .reset_index(drop=True)
+    )
+    if config.etl.compact_dtypes:
+        # Categoricals with different categories concatenate to object.
+        merged = dtypes.compact_dtypes(merged, categorical=config.features.categorical)
+    return merged
+
+
+def load_processed_dataset(
+    name: str,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> pd.DataFrame:
+    """The processed dataset with any pending changes from appends applied."""
+
+    dataset = _read_dataset(io.get_processed_path(name, config=config), config)
+    changes = etl.changes_path(name, config=config)
+    if changes.exists():
+        dataset = _overlay(dataset, _read_dataset(changes, config), config)
+    return dataset
+
+
+def _cache_key(cache: DatasetCache, name: str, config: ProjectConfig) -> str:
+    return etl.dataset_fingerprint(cache, config=config, extra_files=[touch_state_path(name, config)])
+
+
+def rebuild_dataset(
+    name: str,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    cache: Optional[DatasetCache] = None,
+) -> Tuple[pd.DataFrame, str]:
+    """Full build that also materializes the touch state for later appends.
+
+    A saved state built from the current ``campaign_touches`` input is reused
+    and the dataset rebuilt from it; when the input changed, both are rebuilt
+    from the raw tables. Appended touches are written to that input too (see
+    :func:`append_campaign_touches`), so the raw rebuild keeps them. With
+    ``config.etl.use_cache`` the dataset is cached under the inputs plus the
+    state file, so appends invalidate it.
+    """
+
+    ensure_directories(config)
+    if config.etl.use_cache:
+        cache = cache or etl.get_cache(config)
+    output_path = io.get_processed_path(name, config=config)
+    state_path = touch_state_path(name, config)
+    source = _touches_digest(config, cache)
+    state = load_touch_state(state_path) if state_path.exists() else None
+    if state is not None and getattr(state, "source", None) != source:
+        LOGGER.info("Campaign touches changed since the touch state was built; rebuilding it.")
+        state = None
+
+    if state is not None and cache is not None:
+        key = _cache_key(cache, name, config)
+        cached = cache.get(key)
+        if cached is not None:
+            LOGGER.info("ETL cache hit (%s); reusing materialized dataset.", key[:12])
+            if not output_path.exists():
+                io.save_dataframe(cached, output_path)
+                etl.changes_path(name, config=config).unlink(missing_ok=True)
+            return cached, str(output_path)
+
+    if state is None:
+        data_map = sources.load_all(config=config)
+        state = build_touch_state(data_map["campaigns"])
+        state.source = source
+        save_touch_state(state, state_path)
+        dataset = etl.build_fan_game_dataset_parallel(
+            games=data_map["games"],
+            fans=data_map["fans"],
+            campaigns=data_map["campaigns"],
+            config=config,
+        )
+    else:
+        games, fans = sources.load_games(config=config), sources.load_fans(config=config)
+        dataset = etl.assemble_fan_game_dataset(state_to_aggregate(state), games, fans, config=config)
+    io.save_dataframe(dataset, output_path)
+    etl.changes_path(name, config=config).unlink(missing_ok=True)
+    if cache is not None:
+        cache.put(_cache_key(cache, name, config), dataset)
+    return dataset, str(output_path)
+
+
+def append_campaign_touches(
+    name: str,
+    new_touches: Union[pd.DataFrame, Path],
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    current: Optional[pd.DataFrame] = None,
+    cache: Optional[DatasetCache] = None,
+) -> Tuple[pd.DataFrame, str]:
+    """Apply a batch of new touches to a previously built dataset.
+
+    The touches are first appended to the ``campaign_touches`` input, which
+    stays the only record of them; the touch state then notes the input's new
+    digest. If the state no longer matches the input (it was edited, or an
+    earlier append stopped part way), the dataset is rebuilt before applying
+    the batch. Only fans present in ``new_touches`` are re-aggregated and re-joined,
+    including their rolling touch windows, which depend on the fan's whole
+    history. Their rows are written to the dataset's changes file
+    (:func:`etl.changes_path`) rather than rewriting the processed file; once
+    the changes exceed ``config.etl.incremental_compact_fraction`` of the
+    dataset they are folded into it. ``current`` (the dataset as of the last
+    build or append) saves re-reading it, and ``cache`` receives the updated
+    dataset under the new touch state's key.
+    """
+
+    if isinstance(new_touches, Path):
+        new_touches = sources.load_campaign_touches(new_touches, config=config)
+
+    state_path = touch_state_path(name, config)
+    state = load_touch_state(state_path)
+    if getattr(state, "source", None) != _touches_digest(config, cache):
+        LOGGER.info("Campaign touches changed since the touch state was built; rebuilding first.")
+        current, _ = rebuild_dataset(name, config=config, cache=cache)
+        state = load_touch_state(state_path)
+    # Persist before touching the state: a crash in between leaves the state's
+    # digest stale, and the next append or build rebuilds from the input.
+    new_touches = io.append_table(new_touches, io.get_processed_path("campaign_touches", config=config))
+    state, affected = update_touch_state(state, new_touches)
+    state.source = _touches_digest(config, cache)
+    fans = sources.load_fans(config=config, filters=[("fan_id", "in", affected)])
+    games = sources.load_games(config=config)
+    delta = etl.assemble_fan_game_dataset(
+        state_to_aggregate(state, affected), games, fans, config=config
+    )
+
+    output_path = io.get_processed_path(name, config=config)
+    changes_path = etl.changes_path(name, config=config)
+    if current is None:
+        current = load_processed_dataset(name, config=config)
+    dataset = _overlay(current, delta, config)
+    changes = _overlay(_read_dataset(changes_path, config), delta, config) if changes_path.exists() else delta
+    if len(changes) > config.etl.incremental_compact_fraction * len(dataset):
+        io.save_dataframe(dataset, output_path)
+        changes_path.unlink(missing_ok=True)
+        LOGGER.info("Folded %d changed rows into %s.", len(changes), output_path)
+    else:
+        io.save_dataframe(changes, changes_path)
+    save_touch_state(state, state_path)
+    if cache is not None:
+        cache.put(_cache_key(cache, name, config), dataset)
+    LOGGER.info(
+        "Applied %d new touches: %d fans and %d rows refreshed.",
+        len(new_touches),
+        len(affected),
+        len(delta),
+    )
+    return dataset, str(output_path)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
 
@@ -13,6 +13,8 @@ class TableSchema:
     name: str
     required: List[str]
     optional: List[str]
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    parse_dates: List[str] = field(default_factory=list)
 
     def validate(self, columns: List[str]) -> Dict[str, List[str]]:
         """Return missing/extra columns for easy diagnostics."""
@@ -77,6 +79,31 @@ GAME_SCHEMA = TableSchema(
         "win_pct_home",
         "win_pct_visitor",
     ],
+    dtypes={
+        "game_id": "int64",
+        "home_team": "object",
+        "visitor_team": "object",
+        "attendance": "float64",
+        "capacity": "float64",
+        "ticket_price": "float64",
+        "win_pct_home": "float64",
+        "win_pct_visitor": "float64",
+        "promotion_flag": "Int64",
+        "campaign_channel": "object",
+        "day_of_week": "object",
+        "month": "object",
+        "is_rivalry": "Int64",
+        "attendance_lag_1": "float64",
+        "attendance_lag_3": "float64",
+        "season": "object",
+        "team_abbreviation": "object",
+        "team_name": "object",
+        "result": "object",
+        "arena": "object",
+        "notes": "object",
+        "source_file": "object",
+    },
+    parse_dates=["game_date"],
 )
 
 FAN_SCHEMA = TableSchema(
@@ -97,6 +124,19 @@ FAN_SCHEMA = TableSchema(
         "city",
         "email_opt_in",
     ],
+    dtypes={
+        "fan_id": "int64",
+        "segment": "object",
+        "tenure_days": "float64",
+        "loyalty_score": "float64",
+        "avg_spend": "float64",
+        "lifetime_value": "float64",
+        "price_sensitivity": "float64",
+        "engagement_score": "float64",
+        "home_team": "object",
+        "favorite_player": "object",
+        "city": "object",
+    },
 )
 
 CAMPAIGN_SCHEMA = TableSchema(
@@ -114,4 +154,16 @@ CAMPAIGN_SCHEMA = TableSchema(
         "promotion_flag",
         "creative",
     ],
+    dtypes={
+        "campaign_id": "object",
+        "fan_id": "int64",
+        "game_id": "Int64",
+        "campaign_channel": "object",
+        "campaign_spend": "float64",
+        "conversion": "float64",
+        "promotion_flag": "Int64",
+        "variant": "object",
+        "creative": "object",
+    },
+    parse_dates=["touch_date"],
 )
@@ -2,72 +2,157 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 
 from fansight.config import DEFAULT_CONFIG, ProjectConfig
 from fansight.data import schemas
-from fansight.utils.io import load_csv
+from fansight.utils.dtypes import compact_dtypes, dtype_savings
+from fansight.utils.io import Filter, get_processed_path, load_table
 
+LOGGER = logging.getLogger(__name__)
+
+
+def validate_table(
+    df: pd.DataFrame,
+    schema: schemas.TableSchema,
+    columns: Optional[Sequence[str]] = None,
+) -> None:
+    """Raise when required schema columns are missing from ``df``."""
 
-def _validate(df: pd.DataFrame, schema: schemas.TableSchema) -> None:
     diff = schema.validate(df.columns.tolist())
-    if diff["missing"]:
-        missing = ", ".join(diff["missing"])
-        raise ValueError(f"{schema.name} missing columns: {missing}")
+    missing = diff["missing"]
+    if columns is not None:
+        # Projected loads only need the required columns that were asked for.
+        missing = [c for c in missing if c in columns]
+    if missing:
+        raise ValueError(f"{schema.name} missing columns: {', '.join(missing)}")
+
+
+def _load(
+    name: str,
+    schema: schemas.TableSchema,
+    path: Optional[Path],
+    config: ProjectConfig,
+    columns: Optional[Sequence[str]],
+    filters: Optional[Sequence[Filter]],
+) -> pd.DataFrame:
+    path = path or get_processed_path(name, config=config)
+    df = load_table(
+        path,
+        columns=columns,
+        filters=filters,
+        parse_dates=schema.parse_dates,
+        dtype=schema.dtypes,
+    )
+    validate_table(df, schema, columns)
+    if config.etl.compact_dtypes:
+        compact = compact_dtypes(df, categorical=config.features.categorical)
+        savings = dtype_savings(df, compact)
+        LOGGER.debug("Dtype savings for %s:\n%s", name, savings.to_string())
+        LOGGER.info(
+            "Loaded %s with compact dtypes (%d -> %d bytes).",
+            name,
+            savings["bytes_before"].sum(),
+            savings["bytes_after"].sum(),
+        )
+        df = compact
+    return df
 
 
 def load_games(
     path: Optional[Path] = None,
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
 ) -> pd.DataFrame:
-    """Load the core game-level dataset."""
+    """Load the core game-level dataset.
 
-    path = path or (config.paths.processed / "games.csv")
-    df = load_csv(path, parse_dates=["game_date"])
-    _validate(df, schemas.GAME_SCHEMA)
-    return df
+    ``columns`` projects the table (e.g. to the configured feature columns) and
+    ``filters`` restricts rows, e.g. ``[("season", "in", ["2022-23", "2023-24"])]``.
+    """
+
+    return _load("games", schemas.GAME_SCHEMA, path, config, columns, filters)
 
 
 def load_fans(
     path: Optional[Path] = None,
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
 ) -> pd.DataFrame:
     """Load the fan dimension table."""
 
-    path = path or (config.paths.processed / "fans.csv")
-    df = load_csv(path)
-    _validate(df, schemas.FAN_SCHEMA)
-    return df
+    return _load("fans", schemas.FAN_SCHEMA, path, config, columns, filters)
 
 
 def load_campaign_touches(
     path: Optional[Path] = None,
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
 ) -> pd.DataFrame:
     """Load campaign-level touchpoints."""
 
-    path = path or (config.paths.processed / "campaign_touches.csv")
-    df = load_csv(path, parse_dates=["touch_date"])
-    _validate(df, schemas.CAMPAIGN_SCHEMA)
-    return df
+    return _load(
+        "campaign_touches", schemas.CAMPAIGN_SCHEMA, path, config, columns, filters
+    )
+
+
+def feature_columns(
+    schema: schemas.TableSchema,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    keys: Sequence[str] = (),
+) -> List[str]:
+    """Return the schema columns referenced by the feature config, plus join keys."""
+
+    wanted = set(config.features.categorical + config.features.numerical)
+    wanted.add(config.features.target)
+    wanted.update(keys)
+    known = schema.required + schema.optional
+    return [c for c in dict.fromkeys(known) if c in wanted]
 
 
 def load_all(
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
     overrides: Optional[Dict[str, Path]] = None,
+    columns: Optional[Dict[str, Sequence[str]]] = None,
+    filters: Optional[Dict[str, Sequence[Filter]]] = None,
 ) -> Dict[str, pd.DataFrame]:
-    """Convenience helper to pull every dataset."""
+    """Convenience helper to pull every dataset.
+
+    ``columns`` and ``filters`` are keyed like the returned mapping
+    (``games``, ``fans``, ``campaigns``).
+    """
 
     overrides = overrides or {}
+    columns = columns or {}
+    filters = filters or {}
     return {
-        "games": load_games(overrides.get("games"), config=config),
-        "fans": load_fans(overrides.get("fans"), config=config),
-        "campaigns": load_campaign_touches(overrides.get("campaigns"), config=config),
+        "games": load_games(
+            overrides.get("games"),
+            config=config,
+            columns=columns.get("games"),
+            filters=filters.get("games"),
+        ),
+        "fans": load_fans(
+            overrides.get("fans"),
+            config=config,
+            columns=columns.get("fans"),
+            filters=filters.get("fans"),
+        ),
+        "campaigns": load_campaign_touches(
+            overrides.get("campaigns"),
+            config=config,
+            columns=columns.get("campaigns"),
+            filters=filters.get("campaigns"),
+        ),
     }
@@ -0,0 +1,99 @@
+"""Out-of-core ETL that builds the fan/game table one fan_id partition at a time."""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig, ensure_directories
+from fansight.data import etl, schemas, sources
+from fansight.utils import io
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _spill_partitions(
+    touches_path: Path,
+    bounds: np.ndarray,
+    spill_dir: Path,
+    chunksize: int,
+) -> List[Path]:
+    """Stream touches once, appending each chunk's rows to its partition."""
+
+    partitions = [spill_dir / f"part-{i:04d}" for i in range(len(bounds) + 1)]
+    for part in partitions:
+        part.mkdir()
+    chunks = io.iter_table(
+        touches_path,
+        chunksize=chunksize,
+        parse_dates=schemas.CAMPAIGN_SCHEMA.parse_dates,
+        dtype=schemas.CAMPAIGN_SCHEMA.dtypes,
+    )
+    for chunk_no, chunk in enumerate(chunks):
+        sources.validate_table(chunk, schemas.CAMPAIGN_SCHEMA)
+        assignment = np.searchsorted(bounds, chunk["fan_id"].to_numpy(), side="right")
+        for index, piece in chunk.groupby(assignment, sort=False):
+            piece.to_pickle(partitions[index] / f"chunk-{chunk_no:06d}.pkl")
+    return partitions
+
+
+def _read_partition(part: Path) -> Optional[pd.DataFrame]:
+    pieces = [pd.read_pickle(p) for p in sorted(part.glob("chunk-*.pkl"))]
+    if not pieces:
+        return None
+    return pd.concat(pieces, ignore_index=True)
+
+
+def build_and_save_dataset_streaming(
+    name: str,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    touches_path: Optional[Path] = None,
+) -> Tuple[int, str]:
+    """Build the processed dataset without holding all touches in memory.
+
+    Touches are streamed in ``config.etl.stream_chunksize`` row chunks and
+    spilled to disk by fan_id range; each partition is then aggregated and
+    joined against the (small) fan and game tables and appended to the output.
+    Because every step is per fan and partitions are ordered ranges, the file
+    matches :func:`etl.build_and_save_dataset` row for row. Returns the row
+    count and output path rather than the dataset itself.
+    """
+
+    ensure_directories(config)
+    # Partitions would each pick their own narrowest dtypes; keep them uniform
+    # so every piece appended to the output shares one schema.
+    part_config = replace(config, etl=replace(config.etl, compact_dtypes=False))
+    touches_path = touches_path or io.get_processed_path("campaign_touches", config=config)
+    games = sources.load_games(config=config)
+    fans = sources.load_fans(config=config)
+    bounds = etl.partition_bounds(fans["fan_id"], config.etl.stream_partitions)
+    fan_partition = np.searchsorted(bounds, fans["fan_id"].to_numpy(), side="right")
+
+    output_path = io.get_processed_path(name, config=config)
+    spill_root = config.paths.cache / "stream"
+    spill_root.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=spill_root) as spill_dir:
+        partitions = _spill_partitions(
+            touches_path, bounds, Path(spill_dir), config.etl.stream_chunksize
+        )
+        with io.TableWriter(output_path) as writer:
+            for index, part in enumerate(partitions):
+                touches = _read_partition(part)
+                if touches is None:
+                    continue
+                dataset = etl.build_fan_game_dataset(
+                    games, fans[fan_partition == index], touches, config=part_config
+                )
+                writer.write(dataset)
+                LOGGER.info(
+                    "Partition %s: %d touches -> %d rows.", part.name, len(touches), len(dataset)
+                )
+    etl.changes_path(name, config=config).unlink(missing_ok=True)
+    return writer.rows, str(output_path)
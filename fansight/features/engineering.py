@@ -3,45 +3,133 @@
 from __future__ import annotations
 
 import logging
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler, TargetEncoder
 
 from fansight.config import DEFAULT_CONFIG, ProjectConfig
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _ratio(numerator: Any, denominator: Any) -> Any:
+    # A zero denominator gives NaN, for columns and single values alike.
+    if isinstance(denominator, pd.Series):
+        return numerator / denominator.replace(0, np.nan)
+    return numerator / denominator if denominator != 0 else float("nan")
+
+
+@dataclass(frozen=True)
+class DerivedFeature:
+    """A column computed from others, for whole frames and single records.
+
+    ``compute`` receives a getter for input columns and must only use
+    arithmetic that behaves the same on pandas Series and floats, so
+    :func:`add_behavioral_features` and the compiled scorer share it.
+    ``requires`` lists the columns whose presence enables the feature.
+    """
+
+    name: str
+    requires: Tuple[str, ...]
+    compute: Callable[[Callable[[str], Any]], Any]
+
+
+DERIVED_FEATURES: Tuple[DerivedFeature, ...] = (
+    DerivedFeature(
+        "sell_through_rate",
+        ("attendance", "capacity"),
+        lambda col: _ratio(col("attendance"), col("capacity")),
+    ),
+    DerivedFeature(
+        "loyalty_value_ratio",
+        ("loyalty_score", "avg_spend"),
+        lambda col: col("lifetime_value") / (col("loyalty_score") + 1e-3),
+    ),
+    DerivedFeature(
+        "price_alignment",
+        ("ticket_price", "price_sensitivity"),
+        lambda col: col("ticket_price") * (1 - col("price_sensitivity")),
+    ),
+)
+
+
 def add_behavioral_features(df: pd.DataFrame) -> pd.DataFrame:
     """Derive behavioral metrics such as loyalty delta and price response."""
 
-    df = df.copy()
-    if "attendance" in df.columns and "capacity" in df.columns:
-        df["sell_through_rate"] = df["attendance"] / df["capacity"].replace(0, np.nan)
+    # Shallow copy: new columns are added without duplicating existing data.
+    df = df.copy(deep=False)
+    for feature in DERIVED_FEATURES:
+        if set(feature.requires).issubset(df.columns):
+            df[feature.name] = feature.compute(df.__getitem__)
+    return df
 
-    if {"loyalty_score", "avg_spend"}.issubset(df.columns):
-        df["loyalty_value_ratio"] = df["lifetime_value"] / (df["loyalty_score"] + 1e-3)
 
-    if {"ticket_price", "price_sensitivity"}.issubset(df.columns):
-        df["price_alignment"] = df["ticket_price"] * (1 - df["price_sensitivity"])
+# HistGradientBoostingRegressor bins categorical codes into at most 255 bins
+# (one more is reserved for missing values).
+MAX_NATIVE_CATEGORIES = 255
 
-    return df
+
+@dataclass
+class CardinalitySelector:
+    """``ColumnTransformer`` column selector splitting categoricals by their number of levels.
+
+    Resolved once at fit time: selects the ``columns`` with at most
+    ``max_levels`` distinct values (or, with ``high``, more than that).
+    """
+
+    columns: List[str]
+    max_levels: Optional[int]
+    high: bool = False
+
+    def __call__(self, X: pd.DataFrame) -> List[str]:
+        if self.max_levels is None:
+            return [] if self.high else list(self.columns)
+        return [c for c in self.columns if (X[c].nunique() > self.max_levels) == self.high]
 
 
 def build_feature_pipeline(
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
+    native_categorical: bool = False,
 ) -> ColumnTransformer:
-    """Create a preprocessing pipeline for model-ready features."""
+    """Create a preprocessing pipeline for model-ready features.
+
+    Categorical columns with up to ``FeatureConfig.max_onehot_levels``
+    levels are one-hot encoded, higher-cardinality ones target-encoded (a
+    single column each, appended after the numerics). With
+    ``FeatureConfig.sparse_output`` the result stays CSR instead of being
+    densified next to the scaled numerics.
+
+    With ``native_categorical`` the categorical columns are ordinal-encoded
+    (missing and unseen values become NaN, rare levels beyond
+    ``MAX_NATIVE_CATEGORIES`` share one code) and numerics pass through
+    unscaled, for estimators that split on categories and NaNs themselves.
+    Categorical columns always come first in the output.
+    """
 
     categorical = [c for c in config.features.categorical]
     numeric = [n for n in config.features.numerical]
 
+    if native_categorical:
+        encoder = OrdinalEncoder(
+            handle_unknown="use_encoded_value",
+            unknown_value=np.nan,
+            encoded_missing_value=np.nan,
+            max_categories=MAX_NATIVE_CATEGORIES,
+        )
+        return ColumnTransformer(
+            transformers=[
+                ("categorical", encoder, categorical),
+                ("numerical", "passthrough", numeric),
+            ]
+        )
+
     cat_pipeline = Pipeline(
         steps=[
             ("impute", SimpleImputer(strategy="most_frequent")),
@@ -56,26 +144,45 @@ def build_feature_pipeline(
         ]
     )
 
+    max_levels = config.features.max_onehot_levels
     transformer = ColumnTransformer(
         transformers=[
-            ("categorical", cat_pipeline, categorical),
+            ("categorical", cat_pipeline, CardinalitySelector(categorical, max_levels)),
             ("numerical", num_pipeline, numeric),
-        ]
+            ("high_cardinality", TargetEncoder(), CardinalitySelector(categorical, max_levels, high=True)),
+        ],
+        sparse_threshold=1.0 if config.features.sparse_output else 0.3,
     )
     return transformer
 
 
-def prepare_training_matrices(
+def prepare_features(
     df: pd.DataFrame,
     *,
     config: ProjectConfig = DEFAULT_CONFIG,
-) -> Tuple[pd.DataFrame, pd.Series]:
-    """Return X and y for modeling."""
+) -> pd.DataFrame:
+    """Return the model input columns of ``df`` (no target required)."""
 
     df = add_behavioral_features(df)
     missing = [col for col in config.features.categorical + config.features.numerical if col not in df]
     if missing:
         LOGGER.warning("Dropping missing columns: %s", ", ".join(missing))
-    X = df[[c for c in config.features.categorical + config.features.numerical if c in df]].copy()
+    X = df[[c for c in config.features.categorical + config.features.numerical if c in df]]
+    # sklearn imputers treat pandas categoricals as numeric; hand them over as
+    # object arrays (which reference the shared category strings).
+    categorical_cols = [c for c in X.columns if isinstance(X[c].dtype, pd.CategoricalDtype)]
+    if categorical_cols:
+        X = X.astype({c: object for c in categorical_cols})
+    return X
+
+
+def prepare_training_matrices(
+    df: pd.DataFrame,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """Return X and y for modeling."""
+
+    X = prepare_features(df, config=config)
     y = df[config.features.target].copy()
     return X, y
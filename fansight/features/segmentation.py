@@ -2,21 +2,229 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import davies_bouldin_score, silhouette_score
 from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_limits
+
+try:  # pragma: no cover - not available on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+from fansight.config import DEFAULT_CONFIG, ModelConfig, ProjectConfig
+
+LOGGER = logging.getLogger(__name__)
+
+SEGMENT_ENGINES = ("kmeans", "minibatch")
+SEGMENT_GRAINS = ("fan", "row")
+# Sweep criteria: the highest silhouette or the lowest Davies-Bouldin index.
+SEGMENT_SELECTION = ("silhouette", "davies_bouldin")
+
+DEFAULT_FEATURES = [
+    "loyalty_score",
+    "engagement_score",
+    "avg_spend",
+    "price_sensitivity",
+    "touch_count_30d",
+]
 
 
 @dataclass
 class SegmentResult:
     assignments: pd.Series
-    model: KMeans
+    model: Union[KMeans, MiniBatchKMeans]
     silhouette: float
+    # Input and clustered rows, scaled matrix size, fit wall time, memory
+    # (peak_rss_mb, or peak_mb traced during the fit with segment_trace_memory)
+    # and inertia over every clustered row.
+    report: Dict[str, float] = field(default_factory=dict)
+
+
+def scale_features(df: pd.DataFrame, features: Optional[list[str]] = None) -> Tuple[np.ndarray, List[str]]:
+    """Median-imputed, standardized matrix of the segmentation features present in ``df``."""
+
+    available = [f for f in features or DEFAULT_FEATURES if f in df]
+    if not available:
+        raise ValueError("No overlapping features for segmentation.")
+    matrix = df[available].fillna(df[available].median())
+    return StandardScaler().fit_transform(matrix), available
+
+
+def fan_level_frame(
+    df: pd.DataFrame,
+    features: Optional[list[str]] = None,
+    *,
+    fan_col: str = "fan_id",
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Collapse a fan/game table to one row per fan.
+
+    Numeric features are averaged over each fan's rows: fan attributes are
+    constant there and pass through unchanged, while game-level touch counts
+    become per-game averages, so a fan is weighted once however many games
+    they were touched for. ``games_touched`` counts those rows. Also returns
+    each input row's position in the fan frame, for broadcasting labels back.
+    """
+
+    available = [f for f in features or DEFAULT_FEATURES if f in df]
+    grouped = df.groupby(fan_col, sort=True, observed=True, dropna=False)
+    fans = grouped[available].mean()
+    fans["games_touched"] = grouped.size()
+    return fans, grouped.ngroup().to_numpy()
+
+
+def segmentation_matrix(
+    df: pd.DataFrame,
+    features: Optional[list[str]] = None,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Scaled clustering input for ``df`` and, at fan grain, each row's position in it.
+
+    With ``segment_grain="fan"`` and a ``fan_id`` column the matrix has one
+    row per fan (:func:`fan_level_frame`); otherwise it has one per input row
+    and no positions are returned.
+    """
+
+    grain = config.model.segment_grain
+    if grain not in SEGMENT_GRAINS:
+        raise ValueError(f"Unknown segment grain {grain!r}; expected one of {', '.join(SEGMENT_GRAINS)}.")
+    if grain == "fan" and "fan_id" in df:
+        fans, codes = fan_level_frame(df, features)
+        return scale_features(fans, features)[0], codes
+    return scale_features(df, features)[0], None
+
+
+def _assignments(labels: np.ndarray, codes: Optional[np.ndarray], index: pd.Index) -> pd.Series:
+    return pd.Series(labels if codes is None else labels[codes], index=index, name="segment_id")
+
+
+def sampled_silhouette(
+    scaled: np.ndarray,
+    labels: np.ndarray,
+    sample_size: Optional[int],
+    random_state: int = 18,
+) -> float:
+    """Silhouette over a random ``sample_size`` rows (all rows when None or larger)."""
+
+    if sample_size is None or sample_size >= len(labels):
+        return float(silhouette_score(scaled, labels))
+    return float(silhouette_score(scaled, labels, sample_size=sample_size, random_state=random_state))
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return round(peak / (1e6 if sys.platform == "darwin" else 1e3), 1)
+
+
+@contextmanager
+def _measure(report: Dict[str, float], *, trace_memory: bool = False) -> Iterator[None]:
+    """Record fit seconds and memory: the process's peak RSS, or with
+    ``trace_memory`` the peak allocated during the block (tracemalloc, which
+    slows the fit several-fold)."""
+
+    was_tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        report["fit_seconds"] = round(time.perf_counter() - start, 3)
+        if trace_memory:
+            report["peak_mb"] = round((tracemalloc.get_traced_memory()[1] - baseline) / 1e6, 1)
+            if not was_tracing:
+                tracemalloc.stop()
+        else:
+            rss = _peak_rss_mb()
+            if rss is not None:
+                report["peak_rss_mb"] = rss
+
+
+def _fit_minibatch(
+    scaled: np.ndarray,
+    n_segments: int,
+    random_state: int,
+    *,
+    batch_size: int,
+    epochs: int,
+    tol: float = 1e-3,
+) -> Tuple[MiniBatchKMeans, np.ndarray]:
+    """Stream shuffled ``batch_size``-row chunks through ``partial_fit``.
+
+    Centroids are seeded by a full ``KMeans`` on one chunk, since
+    ``partial_fit`` would otherwise settle for a single random initialization.
+    Passes stop after ``epochs`` or once no centroid moves more than ``tol``.
+    """
+
+    batch_size = max(batch_size, n_segments)
+    rng = np.random.default_rng(random_state)
+    seed_rows = rng.choice(len(scaled), size=min(len(scaled), batch_size), replace=False)
+    seed = KMeans(n_clusters=n_segments, random_state=random_state, n_init="auto").fit(scaled[seed_rows])
+    model = MiniBatchKMeans(
+        n_clusters=n_segments,
+        init=seed.cluster_centers_,
+        n_init=1,
+        random_state=random_state,
+        batch_size=batch_size,
+    )
+    previous = seed.cluster_centers_
+    for _ in range(max(epochs, 1)):
+        order = rng.permutation(len(scaled))
+        for start in range(0, len(order), batch_size):
+            chunk = order[start : start + batch_size]
+            # The first call checks the chunk holds at least k rows.
+            if len(chunk) >= n_segments:
+                model.partial_fit(scaled[chunk])
+        shift = np.abs(model.cluster_centers_ - previous).max()
+        previous = model.cluster_centers_.copy()
+        if shift < tol:
+            break
+    return model, model.predict(scaled)
+
+
+def _fit(
+    scaled: np.ndarray,
+    n_segments: int,
+    random_state: int,
+    settings: ModelConfig,
+) -> Tuple[Union[KMeans, MiniBatchKMeans], np.ndarray]:
+    if settings.segment_engine == "minibatch":
+        return _fit_minibatch(
+            scaled,
+            n_segments,
+            random_state,
+            batch_size=settings.segment_batch_size,
+            epochs=settings.segment_epochs,
+        )
+    model = KMeans(n_clusters=n_segments, random_state=random_state, n_init="auto")
+    return model, model.fit_predict(scaled)
+
+
+def _check_engine(settings: ModelConfig) -> None:
+    if settings.segment_engine not in SEGMENT_ENGINES:
+        raise ValueError(
+            f"Unknown segment engine {settings.segment_engine!r}; expected one of {', '.join(SEGMENT_ENGINES)}."
+        )
 
 
 def run_kmeans_segmentation(
@@ -24,29 +232,141 @@ def run_kmeans_segmentation(
     features: Optional[list[str]] = None,
     n_segments: int = 6,
     random_state: int = 18,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
 ) -> SegmentResult:
-    """Cluster fans based on behavioral fields."""
+    """Cluster fans based on behavioral fields.
+
+    The input is collapsed per ``config.model.segment_grain`` (see
+    :func:`segmentation_matrix`) and labels are broadcast back to every row
+    of ``df``. ``segment_engine`` picks full-batch ``KMeans`` or
+    ``MiniBatchKMeans`` streamed over chunks; the silhouette is computed on
+    at most ``segment_silhouette_sample`` rows.
+    """
 
-    if len(df) < 3:
+    settings = config.model
+    _check_engine(settings)
+    scaled, codes = segmentation_matrix(df, features, config=config)
+    if len(scaled) < 3:
         raise ValueError("Segmentation requires at least three records.")
-    n_segments = max(2, min(n_segments, len(df) - 1))
-
-    if features is None:
-        features = [
-            "loyalty_score",
-            "engagement_score",
-            "avg_spend",
-            "price_sensitivity",
-            "touch_count_30d",
-        ]
-
-    available = [f for f in features if f in df]
-    if not available:
-        raise ValueError("No overlapping features for segmentation.")
+    n_segments = max(2, min(n_segments, len(scaled) - 1))
+    report: Dict[str, float] = {
+        "input_rows": float(len(df)),
+        "rows": float(len(scaled)),
+        "matrix_mb": round(scaled.nbytes / 1e6, 1),
+    }
+    with _measure(report, trace_memory=settings.segment_trace_memory):
+        model, labels = _fit(scaled, n_segments, random_state, settings)
+    report["inertia"] = float(-model.score(scaled))
+    metric = sampled_silhouette(scaled, labels, settings.segment_silhouette_sample, random_state)
+    return SegmentResult(
+        assignments=_assignments(labels, codes, df.index),
+        model=model,
+        silhouette=metric,
+        report=report,
+    )
 
-    matrix = df[available].fillna(df[available].median())
-    scaled = StandardScaler().fit_transform(matrix)
-    model = KMeans(n_clusters=n_segments, random_state=random_state, n_init="auto")
-    labels = model.fit_predict(scaled)
-    metric = silhouette_score(scaled, labels)
-    return SegmentResult(assignments=pd.Series(labels, index=df.index, name="segment_id"), model=model, silhouette=metric)
+
+# Worker-process view of the sweep's shared scaled matrix, set by _attach_shared.
+_SHARED: Dict[str, Any] = {}
+
+
+def _attach_shared(name: str, shape: Tuple[int, ...], dtype: str) -> None:
+    block = shared_memory.SharedMemory(name=name)
+    _SHARED["block"] = block
+    _SHARED["scaled"] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _score_k(
+    n_segments: int, random_state: int, settings: ModelConfig, threads: Optional[int]
+) -> Dict[str, Any]:
+    scaled = _SHARED["scaled"]
+    report: Dict[str, float] = {}
+    with threadpool_limits(limits=threads), _measure(report, trace_memory=settings.segment_trace_memory):
+        model, labels = _fit(scaled, n_segments, random_state, settings)
+    return {
+        "k": n_segments,
+        "silhouette": sampled_silhouette(scaled, labels, settings.segment_silhouette_sample, random_state),
+        "inertia": float(-model.score(scaled)),
+        "davies_bouldin": float(davies_bouldin_score(scaled, labels)),
+        "fit_seconds": report["fit_seconds"],
+        "model": model,
+    }
+
+
+@dataclass
+class SegmentSweepResult:
+    best: SegmentResult
+    # One row per k: silhouette, inertia, Davies-Bouldin, fit seconds, best flag.
+    table: pd.DataFrame
+
+
+def sweep_segment_counts(
+    df: pd.DataFrame,
+    ks: Optional[Sequence[int]] = None,
+    features: Optional[list[str]] = None,
+    random_state: int = 18,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> SegmentSweepResult:
+    """Fit one model per k in a process pool and keep the best by ``segment_selection``.
+
+    The matrix from :func:`segmentation_matrix` is copied once into shared memory
+    and every worker maps it read-only instead of receiving a pickled copy.
+    Workers return fitted models (centroids only); the winner's labels are
+    predicted in this process.
+    """
+
+    settings = config.model
+    _check_engine(settings)
+    if settings.segment_selection not in SEGMENT_SELECTION:
+        raise ValueError(
+            f"Unknown segment selection {settings.segment_selection!r}; "
+            f"expected one of {', '.join(SEGMENT_SELECTION)}."
+        )
+    scaled, codes = segmentation_matrix(df, features, config=config)
+    if len(scaled) < 3:
+        raise ValueError("Segmentation requires at least three records.")
+    candidates = sorted({k for k in ks or settings.segment_k_candidates if 2 <= k <= len(scaled) - 1})
+    if not candidates:
+        raise ValueError(f"No segment counts between 2 and {len(scaled) - 1} to sweep.")
+
+    workers = min(settings.segment_workers or os.cpu_count() or 1, len(candidates))
+    threads = 1 if workers > 1 else None
+    block = shared_memory.SharedMemory(create=True, size=scaled.nbytes)
+    try:
+        np.ndarray(scaled.shape, dtype=scaled.dtype, buffer=block.buf)[:] = scaled
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_shared,
+            initargs=(block.name, scaled.shape, scaled.dtype.str),
+        ) as pool:
+            futures = [pool.submit(_score_k, k, random_state, settings, threads) for k in candidates]
+            scores = [future.result() for future in futures]
+    finally:
+        block.close()
+        block.unlink()
+
+    table = pd.DataFrame([{key: value for key, value in row.items() if key != "model"} for row in scores])
+    metric = table[settings.segment_selection]
+    best_row = int(metric.idxmin() if settings.segment_selection == "davies_bouldin" else metric.idxmax())
+    table["best"] = table.index == best_row
+    best = scores[best_row]
+    labels = best["model"].predict(scaled)
+    LOGGER.info("Segment sweep over k=%s picked k=%d by %s.", candidates, best["k"], settings.segment_selection)
+    return SegmentSweepResult(
+        best=SegmentResult(
+            assignments=_assignments(labels, codes, df.index),
+            model=best["model"],
+            silhouette=best["silhouette"],
+            report={
+                "input_rows": float(len(df)),
+                "rows": float(len(scaled)),
+                "matrix_mb": round(scaled.nbytes / 1e6, 1),
+                "fit_seconds": best["fit_seconds"],
+                "inertia": best["inertia"],
+                "davies_bouldin": best["davies_bouldin"],
+            },
+        ),
+        table=table,
+    )
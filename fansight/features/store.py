@@ -0,0 +1,169 @@
+"""On-disk store of transformed feature matrices, shared across runs and processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig
+from fansight.utils.cache import CacheStats, frame_fingerprint
+
+LOGGER = logging.getLogger(__name__)
+
+Matrix = Union[np.ndarray, sp.csr_matrix]
+
+_SPARSE_PARTS = ("data", "indices", "indptr")
+
+
+def pipeline_version(pipeline: Any) -> str:
+    """Hash of a fitted pipeline's state; changes whenever it is refit."""
+
+    return joblib.hash(pipeline)
+
+
+@dataclass
+class FeatureStore:
+    """Caches ``pipeline.transform`` output keyed by data, feature config and pipeline.
+
+    Each entry is a directory holding the matrix as ``.npy`` files (a dense
+    ``matrix.npy``, or the ``data``/``indices``/``indptr`` arrays of a CSR
+    matrix) plus ``meta.json`` with its shape and output column names.
+    Entries are published with a directory rename and read back with
+    ``mmap_mode="r"``, so processes reusing an entry share its pages.
+    Least recently used entries are evicted beyond ``max_bytes``.
+    """
+
+    root: Path
+    max_bytes: int = 4 * 1024**3
+    # Smaller frames are transformed directly; hashing them costs about as much.
+    min_rows: int = 10_000
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    def __post_init__(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig = DEFAULT_CONFIG) -> "FeatureStore":
+        return cls(config.paths.cache / "features", max_bytes=config.etl.feature_store_max_bytes)
+
+    def key(self, df: pd.DataFrame, version: str, *, config: ProjectConfig = DEFAULT_CONFIG) -> str:
+        digest = hashlib.sha256()
+        digest.update(frame_fingerprint(df).encode())
+        digest.update(json.dumps(asdict(config.features), sort_keys=True, default=str).encode())
+        digest.update(version.encode())
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def get(self, key: str) -> Optional[Matrix]:
+        path = self._entry(key)
+        meta_path = path / "meta.json"
+        if not meta_path.exists():
+            self.stats.misses += 1
+            return None
+        meta = json.loads(meta_path.read_text())
+        if meta["sparse"]:
+            parts = [np.load(path / f"{name}.npy", mmap_mode="r") for name in _SPARSE_PARTS]
+            matrix: Matrix = sp.csr_matrix(tuple(parts), shape=tuple(meta["shape"]), copy=False)
+        else:
+            matrix = np.load(path / "matrix.npy", mmap_mode="r")
+        os.utime(path)
+        self.stats.hits += 1
+        return matrix
+
+    def columns(self, key: str) -> List[str]:
+        return json.loads((self._entry(key) / "meta.json").read_text())["columns"]
+
+    def put(self, key: str, matrix: Matrix, columns: List[str]) -> Matrix:
+        """Store ``matrix`` and return its memory-mapped copy."""
+
+        path = self._entry(key)
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        sparse = sp.issparse(matrix)
+        if sparse:
+            matrix = sp.csr_matrix(matrix)
+            for name in _SPARSE_PARTS:
+                np.save(tmp / f"{name}.npy", getattr(matrix, name))
+        else:
+            np.save(tmp / "matrix.npy", np.ascontiguousarray(matrix))
+        (tmp / "meta.json").write_text(
+            json.dumps({"sparse": sparse, "shape": list(matrix.shape), "columns": list(columns)})
+        )
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            # Another process published the same entry first; theirs is identical.
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+        return self.get(key)
+
+    def get_or_transform(
+        self,
+        df: pd.DataFrame,
+        transform: Callable[[pd.DataFrame], Matrix],
+        *,
+        version: str,
+        columns: Callable[[], List[str]],
+        config: ProjectConfig = DEFAULT_CONFIG,
+    ) -> Matrix:
+        """The stored matrix for ``df``, computing and storing it on a miss."""
+
+        if len(df) < self.min_rows:
+            return transform(df)
+        key = self.key(df, version, config=config)
+        matrix = self.get(key)
+        if matrix is None:
+            matrix = self.put(key, transform(df), columns())
+        return matrix
+
+    def entries(self) -> List[Path]:
+        """Entries ordered from least to most recently used."""
+
+        return sorted(
+            (p for p in self.root.iterdir() if p.is_dir() and not p.name.startswith(".")),
+            key=lambda p: p.stat().st_mtime_ns,
+        )
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        return sum(f.stat().st_size for f in path.iterdir())
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the size bound holds."""
+
+        entries = self.entries()
+        sizes = {path: self._size(path) for path in entries}
+        total = sum(sizes.values())
+        removed = 0
+        # Always keep the most recent entry, even if it alone exceeds the bound.
+        for path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            total -= sizes[path]
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        self.stats.evictions += removed
+        return removed
+
+    def report(self) -> Dict[str, Any]:
+        entries = self.entries()
+        return {
+            "session": self.stats.as_dict(),
+            "entries": len(entries),
+            "bytes": sum(self._size(p) for p in entries),
+            "max_bytes": self.max_bytes,
+        }
@@ -41,8 +41,8 @@ def run_ab_test(
 ) -> ABResult:
     """Calculate lift, confidence interval, and p-value for a binary test."""
 
-    control = df[df[variant_col] == "control"][metric].values
-    treatment = df[df[variant_col] == "treatment"][metric].values
+    control = df[df[variant_col] == "control"][metric].to_numpy(dtype=float)
+    treatment = df[df[variant_col] == "treatment"][metric].to_numpy(dtype=float)
     if len(control) == 0 or len(treatment) == 0:
         raise ValueError("Both control and treatment samples are required.")
 
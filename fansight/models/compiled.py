@@ -0,0 +1,258 @@
+"""Pandas-free scoring of single records with a fitted forecaster's arrays."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.pipeline import Pipeline
+
+from fansight.features.engineering import DERIVED_FEATURES
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _derived_features(record: Mapping[str, Any], needed: Sequence[str]) -> Dict[str, Any]:
+    """The subset of ``add_behavioral_features`` the model consumes, for one record."""
+
+    def number(name: str) -> float:
+        value = record.get(name)
+        return float("nan") if _is_missing(value) else float(value)
+
+    return {
+        feature.name: float(feature.compute(number))
+        for feature in DERIVED_FEATURES
+        if feature.name in needed and all(column in record for column in feature.requires)
+    }
+
+
+@dataclass
+class CategoricalBlock:
+    """Most-frequent imputation followed by one-hot encoding, per input column."""
+
+    columns: List[str]
+    fill: List[Any]
+    # One {category: output position} table per column; unknown values encode to zeros.
+    positions: List[Dict[Any, int]]
+
+
+@dataclass
+class NumericBlock:
+    """Median imputation followed by standard scaling."""
+
+    columns: List[str]
+    offset: int
+    median: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+
+
+@dataclass
+class TargetBlock:
+    """Target encoding: one learned value per category, the target mean otherwise."""
+
+    columns: List[str]
+    offset: int
+    # Missing values are looked up under None.
+    encodings: List[Dict[Any, float]]
+    default: float
+
+
+@dataclass
+class TreeEnsemble:
+    """All trees of a gradient boosting model in flat node arrays."""
+
+    roots: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    feature: np.ndarray
+    threshold: np.ndarray
+    value: np.ndarray
+    depth: int
+    baseline: float
+    learning_rate: float
+
+    def predict(self, x: np.ndarray) -> float:
+        # Trees compare float32 inputs, exactly as sklearn does.
+        x = x.astype(np.float32).astype(np.float64)
+        nodes = self.roots
+        for _ in range(self.depth):
+            go_left = x[self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.baseline + self.learning_rate * float(self.value[nodes].sum())
+
+    def predict_many(self, X: np.ndarray) -> np.ndarray:
+        """Row-wise :meth:`predict` for a 2-D feature matrix."""
+
+        X = X.astype(np.float32).astype(np.float64)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.baseline + self.learning_rate * self.value[nodes].sum(axis=1)
+
+
+def _compile_trees(model: GradientBoostingRegressor, n_features: int) -> TreeEnsemble:
+    roots, left, right, feature, threshold, value = [], [], [], [], [], []
+    offset = 0
+    depth = 0
+    for estimator in model.estimators_[:, 0]:
+        tree = estimator.tree_
+        is_leaf = tree.children_left == -1
+        nodes = np.arange(tree.node_count) + offset
+        roots.append(offset)
+        # Leaves point at themselves so every tree can be walked the same number of steps.
+        left.append(np.where(is_leaf, nodes, tree.children_left + offset))
+        right.append(np.where(is_leaf, nodes, tree.children_right + offset))
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+        value.append(tree.value[:, 0, 0])
+        depth = max(depth, tree.max_depth)
+        offset += tree.node_count
+    if model.init_ == "zero":
+        baseline = 0.0
+    else:
+        baseline = float(model.init_.predict(np.zeros((1, n_features)))[0])
+    return TreeEnsemble(
+        roots=np.asarray(roots),
+        left=np.concatenate(left),
+        right=np.concatenate(right),
+        feature=np.concatenate(feature),
+        threshold=np.concatenate(threshold),
+        value=np.concatenate(value),
+        depth=depth,
+        baseline=baseline,
+        learning_rate=float(model.learning_rate),
+    )
+
+
+def _steps(pipeline: Pipeline) -> Tuple[Any, Any]:
+    (_, imputer), (_, second) = pipeline.steps
+    return imputer, second
+
+
+@dataclass
+class CompiledScorer:
+    """A fitted preprocessing pipeline and gradient boosting model as flat NumPy arrays.
+
+    Built by :meth:`AttendanceForecaster.compile`; :meth:`score` turns one
+    mapping of raw column values into a prediction without pandas or sklearn
+    and agrees with ``AttendanceForecaster.predict`` to floating point noise.
+    """
+
+    categorical: Optional[CategoricalBlock]
+    numeric: Optional[NumericBlock]
+    n_features: int
+    derived: List[str]
+    trees: TreeEnsemble
+    target: Optional[TargetBlock] = None
+
+    @classmethod
+    def from_fitted(
+        cls,
+        pipeline: ColumnTransformer,
+        model: GradientBoostingRegressor,
+    ) -> "CompiledScorer":
+        if not isinstance(model, GradientBoostingRegressor):
+            raise TypeError(f"Cannot compile {type(model).__name__}; expected GradientBoostingRegressor.")
+        categorical = numeric = target = None
+        offset = 0
+        for name, transformer, columns in pipeline.transformers_:
+            if isinstance(transformer, str) or not len(columns):
+                continue
+            if name == "high_cardinality":
+                target = TargetBlock(
+                    columns=list(columns),
+                    offset=offset,
+                    encodings=[
+                        {(None if _is_missing(c) else c): float(v) for c, v in zip(categories, values)}
+                        for categories, values in zip(transformer.categories_, transformer.encodings_)
+                    ],
+                    default=float(transformer.target_mean_),
+                )
+                offset += len(columns)
+                continue
+            imputer, second = _steps(transformer)
+            # Imputers drop columns that were entirely missing during fit.
+            kept = [
+                (column, stat)
+                for column, stat in zip(columns, imputer.statistics_)
+                if not _is_missing(stat)
+            ]
+            if name == "categorical":
+                positions = []
+                for categories in second.categories_:
+                    positions.append({category: offset + i for i, category in enumerate(categories)})
+                    offset += len(categories)
+                categorical = CategoricalBlock(
+                    columns=[c for c, _ in kept],
+                    fill=[s for _, s in kept],
+                    positions=positions,
+                )
+            elif name == "numerical":
+                numeric = NumericBlock(
+                    columns=[c for c, _ in kept],
+                    offset=offset,
+                    median=np.array([s for _, s in kept], dtype=np.float64),
+                    mean=second.mean_ if second.with_mean else np.zeros(len(kept)),
+                    scale=second.scale_ if second.with_std else np.ones(len(kept)),
+                )
+                offset += len(kept)
+            else:
+                raise ValueError(f"Unexpected transformer {name!r} in feature pipeline.")
+        inputs = [
+            column for block in (categorical, numeric, target) if block is not None for column in block.columns
+        ]
+        derived = [feature.name for feature in DERIVED_FEATURES if feature.name in inputs]
+        return cls(
+            categorical=categorical,
+            numeric=numeric,
+            n_features=offset,
+            derived=derived,
+            target=target,
+            trees=_compile_trees(model, offset),
+        )
+
+    def transform(self, record: Mapping[str, Any]) -> np.ndarray:
+        """The feature pipeline's output row for ``record``."""
+
+        if self.derived:
+            record = {**record, **_derived_features(record, self.derived)}
+        x = np.zeros(self.n_features)
+        if self.categorical is not None:
+            block = self.categorical
+            for column, fill, positions in zip(block.columns, block.fill, block.positions):
+                value = record.get(column)
+                position = positions.get(fill if _is_missing(value) else value)
+                if position is not None:
+                    x[position] = 1.0
+        if self.numeric is not None:
+            block = self.numeric
+            raw = np.array(
+                [record.get(column) for column in block.columns], dtype=np.float64
+            )
+            raw = np.where(np.isnan(raw), block.median, raw)
+            x[block.offset : block.offset + len(raw)] = (raw - block.mean) / block.scale
+        if self.target is not None:
+            block = self.target
+            for i, (column, encoding) in enumerate(zip(block.columns, block.encodings)):
+                value = record.get(column)
+                x[block.offset + i] = encoding.get(None if _is_missing(value) else value, block.default)
+        return x
+
+    def score(self, record: Mapping[str, Any]) -> float:
+        return self.trees.predict(self.transform(record))
+
+    def score_many(self, records: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """Score several records with one vectorized pass over the trees."""
+
+        if not records:
+            return np.empty(0)
+        return self.trees.predict_many(np.stack([self.transform(record) for record in records]))
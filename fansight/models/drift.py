@@ -0,0 +1,79 @@
+"""Training-data profiles used to decide between warm-start and full retraining."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig
+
+
+@dataclass
+class DriftReport:
+    # Per numeric column: |new mean - fitted mean| in fitted standard deviations.
+    numeric_shift: Dict[str, float] = field(default_factory=dict)
+    # Per categorical column: share of new rows whose value the encoder never saw.
+    unseen_rate: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def max_shift(self) -> float:
+        return max(self.numeric_shift.values(), default=0.0)
+
+    @property
+    def max_unseen_rate(self) -> float:
+        return max(self.unseen_rate.values(), default=0.0)
+
+    def exceeds(self, *, shift: float, unseen_rate: float) -> bool:
+        return self.max_shift > shift or self.max_unseen_rate > unseen_rate
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"max_shift": self.max_shift, "max_unseen_rate": self.max_unseen_rate}
+
+
+@dataclass
+class FeatureProfile:
+    """Statistics and vocabularies of the rows a feature pipeline was fit on."""
+
+    mean: Dict[str, float]
+    std: Dict[str, float]
+    categories: Dict[str, List[Any]]
+
+    @classmethod
+    def from_frame(
+        cls,
+        X: pd.DataFrame,
+        *,
+        config: ProjectConfig = DEFAULT_CONFIG,
+    ) -> "FeatureProfile":
+        numeric = [c for c in config.features.numerical if c in X]
+        categorical = [c for c in config.features.categorical if c in X]
+        values = X[numeric].apply(pd.to_numeric, errors="coerce")
+        return cls(
+            mean=values.mean().astype(float).to_dict(),
+            std=values.std().astype(float).to_dict(),
+            categories={c: X[c].dropna().unique().tolist() for c in categorical},
+        )
+
+    def drift(self, X: pd.DataFrame) -> DriftReport:
+        """Compare new model inputs against this profile."""
+
+        report = DriftReport()
+        for column, mean in self.mean.items():
+            if column not in X or np.isnan(mean):
+                continue
+            new_mean = pd.to_numeric(X[column], errors="coerce").mean()
+            if np.isnan(new_mean):
+                continue
+            std = self.std.get(column, 0.0)
+            scale = std if std and not np.isnan(std) else 1.0
+            report.numeric_shift[column] = float(abs(new_mean - mean) / scale)
+        for column, known in self.categories.items():
+            if column not in X:
+                continue
+            values = X[column].dropna()
+            if len(values):
+                report.unseen_rate[column] = float((~values.isin(known)).mean())
+        return report
@@ -2,18 +2,111 @@
 
 from __future__ import annotations
 
+import logging
+import time
+
 import joblib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
 from sklearn.metrics import mean_absolute_error, r2_score
 from sklearn.model_selection import train_test_split
 
 from fansight.config import DEFAULT_CONFIG, ProjectConfig
-from fansight.features.engineering import build_feature_pipeline, prepare_training_matrices
+from fansight.features.engineering import (
+    build_feature_pipeline,
+    prepare_features,
+    prepare_training_matrices,
+)
+from fansight.features.store import FeatureStore, pipeline_version
+from fansight.models.compiled import CompiledScorer
+from fansight.models.drift import DriftReport, FeatureProfile
+from fansight.utils import io
+
+LOGGER = logging.getLogger(__name__)
+
+PredictionSource = Union[pd.DataFrame, Iterable[pd.DataFrame], Path, str]
+Regressor = Union[GradientBoostingRegressor, HistGradientBoostingRegressor]
+
+ENGINES = ("gbr", "hist_gbr")
+# Rows scored both ways after each (re)compile to confirm the compiled scorer
+# matches predict; on a mismatch single records fall back to predict.
+PARITY_ROWS = 64
+
+
+def build_estimator(config: ProjectConfig = DEFAULT_CONFIG) -> Regressor:
+    """Instantiate the regressor selected by ``config.model.engine``.
+
+    ``hist_gbr`` expects the native-categorical feature pipeline, whose first
+    ``len(config.features.categorical)`` output columns are category codes.
+    """
+
+    params = config.model
+    if params.engine == "gbr":
+        return GradientBoostingRegressor(
+            n_estimators=params.n_estimators,
+            max_depth=params.max_depth,
+            learning_rate=params.learning_rate,
+            random_state=params.random_state,
+        )
+    if params.engine == "hist_gbr":
+        return HistGradientBoostingRegressor(
+            max_iter=params.n_estimators,
+            max_depth=params.max_depth,
+            learning_rate=params.learning_rate,
+            categorical_features=list(range(len(config.features.categorical))),
+            early_stopping=params.early_stopping,
+            validation_fraction=params.validation_fraction,
+            n_iter_no_change=params.n_iter_no_change,
+            random_state=params.random_state,
+        )
+    raise ValueError(f"Unknown model engine {params.engine!r}; expected one of {', '.join(ENGINES)}.")
+
+
+def _iter_source(source: PredictionSource, chunksize: int) -> Iterator[pd.DataFrame]:
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start : start + chunksize]
+    elif isinstance(source, (str, Path)):
+        yield from io.iter_table(Path(source), chunksize=chunksize)
+    else:
+        yield from source
+
+
+def _rebatch(chunks: Iterable[pd.DataFrame], batch_size: int) -> Iterator[pd.DataFrame]:
+    """Regroup arbitrarily sized chunks into batches of exactly ``batch_size`` rows (last one shorter)."""
+
+    buffer: List[pd.DataFrame] = []
+    buffered = 0
+    for chunk in chunks:
+        while len(chunk):
+            take = min(batch_size - buffered, len(chunk))
+            buffer.append(chunk.iloc[:take])
+            buffered += take
+            chunk = chunk.iloc[take:]
+            if buffered == batch_size:
+                yield buffer[0] if len(buffer) == 1 else pd.concat(buffer)
+                buffer, buffered = [], 0
+    if buffer:
+        yield buffer[0] if len(buffer) == 1 else pd.concat(buffer)
+
+
+_WORKER_MODEL: Optional["AttendanceForecaster"] = None
+
+
+def _init_worker(model: "AttendanceForecaster") -> None:
+    global _WORKER_MODEL
+    _WORKER_MODEL = model
+
+
+def _score_in_worker(batch: pd.DataFrame, keep: Tuple[str, ...]) -> pd.DataFrame:
+    return _WORKER_MODEL._score_batch(batch, keep)
 
 
 @dataclass
@@ -29,9 +122,26 @@ class AttendanceForecaster:
 
     config: ProjectConfig = field(default_factory=lambda: DEFAULT_CONFIG)
     pipeline_: Optional[object] = None
-    model_: Optional[GradientBoostingRegressor] = None
+    model_: Optional[Regressor] = None
+    compiled_: Optional[CompiledScorer] = None
+    # Inputs the feature pipeline was fit on, for drift checks in update().
+    profile_: Optional[FeatureProfile] = None
+    # One entry per fit/update: how the model got to its current state.
+    lineage_: List[Dict[str, Any]] = field(default_factory=list)
+    # Optional cache for predict(); see transform().
+    feature_store_: Optional[FeatureStore] = None
+    _pipeline_version: Optional[str] = field(default=None, init=False, repr=False)
 
     def fit(self, dataset: pd.DataFrame) -> "AttendanceForecaster":
+        """Fit the feature pipeline and estimator on a train/test split of ``dataset``.
+
+        Training and held-out matrices come straight from the new pipeline,
+        not ``feature_store_``: every fit changes :attr:`pipeline_version`,
+        so stored entries could never be reused. :meth:`evaluate` reports the
+        held-out metrics recorded here.
+        """
+
+        start = time.perf_counter()
         X, y = prepare_training_matrices(dataset, config=self.config)
         X_train, X_test, y_train, y_test = train_test_split(
             X,
@@ -40,39 +150,308 @@ class AttendanceForecaster:
             random_state=self.config.model.random_state,
         )
 
-        self.pipeline_ = build_feature_pipeline(config=self.config)
-        X_train_transformed = self.pipeline_.fit_transform(X_train)
+        self.model_ = build_estimator(self.config)
+        self.pipeline_ = build_feature_pipeline(
+            config=self.config,
+            native_categorical=isinstance(self.model_, HistGradientBoostingRegressor),
+        )
+        self._pipeline_version = None
+        X_train_transformed = self.pipeline_.fit_transform(X_train, y_train)
         X_test_transformed = self.pipeline_.transform(X_test)
 
-        self.model_ = GradientBoostingRegressor(
-            n_estimators=self.config.model.n_estimators,
-            max_depth=self.config.model.max_depth,
-            random_state=self.config.model.random_state,
-        )
         self.model_.fit(X_train_transformed, y_train)
+        self.profile_ = FeatureProfile.from_frame(X_train, config=self.config)
+
+        self._record_metrics(y_test, self.model_.predict(X_test_transformed))
+        self.compile()
+        self._check_compiled(dataset)
+        self._record_lineage("full", dataset, fit_seconds=round(time.perf_counter() - start, 3))
+        return self
+
+    def update(
+        self,
+        new_data: pd.DataFrame,
+        *,
+        history: Optional[pd.DataFrame] = None,
+    ) -> "AttendanceForecaster":
+        """Fold newly arrived rows into the fitted model.
+
+        When ``new_data`` matches the profile the feature pipeline was fit on
+        (see ``ModelConfig.drift_*``), the pipeline is reused as is and
+        ``ModelConfig.warm_start_estimators`` boosting stages are fit on the
+        new rows' residuals, so the cost follows the size of ``new_data``.
+        Otherwise the model is refit from scratch on ``history``, which must
+        then include the new rows. Either way a lineage entry is appended.
+        """
+
+        if self.pipeline_ is None or self.model_ is None:
+            raise RuntimeError("Model not fit yet.")
+        start = time.perf_counter()
+        params = self.config.model
+        X, y = prepare_training_matrices(new_data, config=self.config)
+        drift = self._drift(X)
+        if drift is None or drift.exceeds(shift=params.drift_max_shift, unseen_rate=params.drift_max_unseen_rate):
+            if history is None:
+                raise ValueError("New data drifted from the fitted features; pass history to refit.")
+            LOGGER.info("Feature drift %s exceeds limits; refitting on %d rows.", drift and drift.as_dict(), len(history))
+            self.fit(history)
+            self.lineage_[-1]["mode"] = "refit"
+            self.lineage_[-1]["drift"] = drift.as_dict() if drift else None
+            return self
 
-        preds = self.model_.predict(X_test_transformed)
+        if len(y) >= 10:
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=params.test_size, random_state=params.random_state
+            )
+        else:
+            X_train, X_test, y_train, y_test = X, X.iloc[:0], y, y.iloc[:0]
+        if isinstance(self.model_, GradientBoostingRegressor):
+            self.model_.set_params(warm_start=True, n_estimators=self.model_.n_estimators_ + params.warm_start_estimators)
+        else:
+            self.model_.set_params(warm_start=True, max_iter=self.model_.n_iter_ + params.warm_start_estimators)
+        self.model_.fit(self.pipeline_.transform(X_train), y_train)
+        self.model_.set_params(warm_start=False)
+        if len(y_test):
+            self._record_metrics(y_test, self.model_.predict(self.pipeline_.transform(X_test)))
+        else:
+            self._latest_metrics = {"mae": float("nan"), "r2": float("nan")}
+        self.compile()
+        self._check_compiled(new_data)
+        self._record_lineage(
+            "warm_start",
+            new_data,
+            fit_seconds=round(time.perf_counter() - start, 3),
+            drift=drift.as_dict(),
+        )
+        return self
+
+    def _drift(self, X: pd.DataFrame) -> Optional[DriftReport]:
+        if self.profile_ is None:
+            return None
+        return self.profile_.drift(X.drop(columns=self.config.model.drift_exempt, errors="ignore"))
+
+    def _record_metrics(self, y_test: pd.Series, preds: np.ndarray) -> None:
         mae = float(mean_absolute_error(y_test, preds))
         if len(y_test) >= 2:
             r2 = float(r2_score(y_test, preds))
         else:
             r2 = float("nan")
         self._latest_metrics = {"mae": mae, "r2": r2}
-        return self
+
+    @property
+    def n_stages(self) -> int:
+        """Boosting stages in the fitted model."""
+
+        return int(getattr(self.model_, "n_iter_", None) or self.model_.n_estimators_)
+
+    @property
+    def trained_through(self) -> Optional[pd.Timestamp]:
+        """Latest ``game_date`` the model has seen, if recorded."""
+
+        dates = [entry["trained_through"] for entry in self.lineage_ if entry.get("trained_through")]
+        return pd.Timestamp(max(dates)) if dates else None
+
+    def _record_lineage(self, mode: str, data: pd.DataFrame, **extra: Any) -> None:
+        through = None
+        if "game_date" in data and len(data):
+            through = pd.to_datetime(data["game_date"]).max().isoformat()
+        self.lineage_.append(
+            {
+                "mode": mode,
+                "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "rows": len(data),
+                "trained_through": through,
+                "n_stages": self.n_stages,
+                **getattr(self, "_latest_metrics", {}),
+                **extra,
+            }
+        )
+
+    def compile(self) -> Optional[CompiledScorer]:
+        """Extract the fitted pipeline and trees into a :class:`CompiledScorer`.
+
+        Only the ``gbr`` engine has a compiled form; for other engines this
+        returns ``None`` and single-record scoring goes through :meth:`predict`.
+        """
+
+        if self.pipeline_ is None or self.model_ is None:
+            raise RuntimeError("Model not fit yet.")
+        if isinstance(self.model_, GradientBoostingRegressor):
+            self.compiled_ = CompiledScorer.from_fitted(self.pipeline_, self.model_)
+        else:
+            self.compiled_ = None
+        return self.compiled_
+
+    def _check_compiled(self, df: pd.DataFrame) -> None:
+        if self.compiled_ is None or df.empty:
+            return
+        sample = df.iloc[:PARITY_ROWS]
+        records = [
+            {key: (None if isinstance(value, float) and np.isnan(value) else value) for key, value in row.items()}
+            for row in sample.to_dict("records")
+        ]
+        expected = self._predict_values(sample)
+        compiled = self.compiled_.score_many(records)
+        if not np.allclose(compiled, expected, rtol=1e-9, atol=1e-6):
+            LOGGER.warning(
+                "Compiled scorer disagrees with predict (max abs diff %.3g); scoring records via predict.",
+                float(np.abs(compiled - expected).max()),
+            )
+            self.compiled_ = None
+
+    def _scorer(self) -> Optional[CompiledScorer]:
+        # None (other engines, or a failed parity check) means score via predict.
+        if self.pipeline_ is None or self.model_ is None:
+            raise RuntimeError("Model not fit yet.")
+        return self.compiled_
+
+    def score_record(self, record: Mapping[str, Any]) -> float:
+        """Predict attendance for one fan/game record (a plain mapping) without pandas."""
+
+        compiled = self._scorer()
+        if compiled is None:
+            return float(self._predict_values(pd.DataFrame([record]))[0])
+        return compiled.score(record)
+
+    def score_records(self, records: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """Vectorized :meth:`score_record` for a small batch of plain mappings."""
+
+        compiled = self._scorer()
+        if compiled is None:
+            return self._predict_values(pd.DataFrame.from_records(records))
+        return compiled.score_many(records)
 
     def predict(self, df: pd.DataFrame) -> pd.Series:
         if self.pipeline_ is None or self.model_ is None:
             raise RuntimeError("Model not fit yet.")
-        X, _ = prepare_training_matrices(df, config=self.config)
-        transformed = self.pipeline_.transform(X)
-        return pd.Series(self.model_.predict(transformed), index=df.index, name="attendance_pred")
+        return pd.Series(self.model_.predict(self.transform(df)), index=df.index, name="attendance_pred")
+
+    @property
+    def pipeline_version(self) -> str:
+        """Fingerprint of the fitted feature pipeline, part of feature-store keys."""
+
+        if self._pipeline_version is None:
+            self._pipeline_version = pipeline_version(self.pipeline_)
+        return self._pipeline_version
+
+    def transform(self, df: pd.DataFrame) -> Any:
+        """Model-ready feature matrix for ``df``.
+
+        With a ``feature_store_`` attached the matrix is looked up by the
+        frame's contents, the feature config and :attr:`pipeline_version`,
+        so repeated calls on the same data (dashboard, evaluation, another
+        process) skip feature preparation and the column transform.
+        """
+
+        if self.pipeline_ is None:
+            raise RuntimeError("Model not fit yet.")
+        if self.feature_store_ is None:
+            return self._transform(df)
+        return self.feature_store_.get_or_transform(
+            df,
+            self._transform,
+            version=self.pipeline_version,
+            columns=lambda: [str(c) for c in self.pipeline_.get_feature_names_out()],
+            config=self.config,
+        )
+
+    def _transform(self, df: pd.DataFrame) -> Any:
+        # Inputs the pipeline was fit on but the frame lacks (e.g. touch
+        # counts on an upcoming-game grid) are left to the imputers.
+        fitted = getattr(self.pipeline_, "feature_names_in_", ())
+        absent = [c for c in fitted if c not in df.columns]
+        if absent:
+            df = df.assign(**{c: np.nan for c in absent})
+        X = prepare_features(df, config=self.config)
+        return self.pipeline_.transform(X)
+
+    def _predict_values(self, df: pd.DataFrame) -> np.ndarray:
+        return self.model_.predict(self._transform(df))
+
+    def _score_batch(self, batch: pd.DataFrame, keep: Sequence[str]) -> pd.DataFrame:
+        scored = batch[[c for c in keep if c in batch.columns]].copy()
+        scored["attendance_pred"] = self._predict_values(batch)
+        return scored
+
+    def predict_iter(
+        self,
+        source: PredictionSource,
+        *,
+        batch_size: Optional[int] = None,
+        workers: int = 1,
+        keep: Sequence[str] = ("fan_id", "game_id"),
+    ) -> Iterator[pd.DataFrame]:
+        """Score ``source`` batch by batch, yielding ``keep`` columns plus ``attendance_pred``.
+
+        ``source`` is a DataFrame, an iterable of DataFrame chunks or a table
+        path (read chunk-wise). Rows are regrouped into batches of
+        ``batch_size`` (default ``config.model.predict_batch_size``), so
+        memory is bounded by a few batches whatever the input size. With
+        ``workers > 1`` batches are scored in a process pool holding at most
+        ``2 * workers`` batches in flight; output order always follows input.
+        """
+
+        if self.pipeline_ is None or self.model_ is None:
+            raise RuntimeError("Model not fit yet.")
+        batch_size = batch_size or self.config.model.predict_batch_size
+        batches = _rebatch(_iter_source(source, batch_size), batch_size)
+        if workers <= 1:
+            for batch in batches:
+                yield self._score_batch(batch, keep)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        ) as pool:
+            pending: Deque[Future] = deque()
+            for batch in batches:
+                pending.append(pool.submit(_score_in_worker, batch, tuple(keep)))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def predict_batches(
+        self,
+        source: PredictionSource,
+        output: Path,
+        *,
+        batch_size: Optional[int] = None,
+        workers: int = 1,
+        keep: Sequence[str] = ("fan_id", "game_id"),
+    ) -> int:
+        """Stream predictions for ``source`` into ``output`` (CSV/Parquet/Feather); returns rows written."""
+
+        with io.TableWriter(output) as writer:
+            for scored in self.predict_iter(
+                source, batch_size=batch_size, workers=workers, keep=keep
+            ):
+                writer.write(scored)
+        return writer.rows
 
     def save(self, path: Optional[Path] = None) -> Path:
+        """Write the fitted model, its config, metrics and lineage to ``path``.
+
+        The dump is uncompressed so :meth:`load` can memory-map its arrays.
+        """
+
         if self.pipeline_ is None or self.model_ is None:
             raise RuntimeError("Nothing to save.")
         path = path or (self.config.paths.artifacts / "attendance_model.joblib")
         path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump({"pipeline": self.pipeline_, "model": self.model_}, path)
+        joblib.dump(
+            {
+                "pipeline": self.pipeline_,
+                "model": self.model_,
+                "compiled": self.compiled_,
+                "config": self.config,
+                "metrics": getattr(self, "_latest_metrics", None),
+                "pipeline_version": self.pipeline_version,
+                "profile": self.profile_,
+                "lineage": self.lineage_,
+            },
+            path,
+        )
         return path
 
     def evaluate(self) -> Tuple[float, float]:
@@ -81,9 +460,32 @@ class AttendanceForecaster:
         return self._latest_metrics["mae"], self._latest_metrics["r2"]
 
     @classmethod
-    def load(cls, path: Path) -> "AttendanceForecaster":
-        payload = joblib.load(path)
-        instance = cls()
+    def load(
+        cls,
+        path: Path,
+        config: Optional[ProjectConfig] = None,
+        *,
+        mmap_mode: Optional[str] = None,
+    ) -> "AttendanceForecaster":
+        """Restore a saved model; ``config`` overrides the one it was trained with.
+
+        With ``mmap_mode="r"`` NumPy arrays in the artifact (compiled tree
+        tables, histogram-GBM predictors, scaler statistics) are memory-mapped
+        read-only, so processes loading the same file share one copy in the
+        page cache. sklearn's Cython trees still copy their nodes on load.
+        """
+
+        payload = joblib.load(path, mmap_mode=mmap_mode)
+        instance = cls(config=config or payload.get("config") or DEFAULT_CONFIG)
         instance.pipeline_ = payload["pipeline"]
         instance.model_ = payload["model"]
+        instance.profile_ = payload.get("profile")
+        instance.lineage_ = payload.get("lineage", [])
+        instance._pipeline_version = payload.get("pipeline_version")
+        if payload.get("metrics") is not None:
+            instance._latest_metrics = payload["metrics"]
+        if "compiled" in payload:
+            instance.compiled_ = payload["compiled"]
+        else:
+            instance.compile()
         return instance
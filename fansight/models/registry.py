@@ -0,0 +1,206 @@
+"""Versioned on-disk registry for trained attendance models."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig
+from fansight.models.forecasting import AttendanceForecaster
+from fansight.utils.cache import frame_fingerprint
+
+LOGGER = logging.getLogger(__name__)
+
+MODEL_FILE = "model.joblib"
+METADATA_FILE = "metadata.json"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+@dataclass
+class ModelVersion:
+    name: str
+    version: str
+    path: Path
+    metadata: Dict[str, Any]
+
+    @property
+    def model_path(self) -> Path:
+        return self.path / MODEL_FILE
+
+
+@dataclass
+class ModelRegistry:
+    """Stores each registered model under ``<root>/<name>/<version>/``.
+
+    A version directory holds the uncompressed joblib artifact and a
+    ``metadata.json`` (metrics, feature list, engine, data fingerprint,
+    training time, lineage); it only counts as registered once the metadata
+    is written. ``<root>/<name>/CURRENT`` names the promoted version and is
+    swapped with ``os.replace``, so readers see either the old or the new
+    version, never a partial one. With ``keep_last``, each registration
+    prunes the model down to that many versions (see :meth:`prune`).
+    """
+
+    root: Path
+    keep_last: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig = DEFAULT_CONFIG) -> "ModelRegistry":
+        return cls(config.paths.artifacts / "registry", keep_last=config.model.registry_keep_last)
+
+    def _model_dir(self, name: str) -> Path:
+        return self.root / name
+
+    def _pointer(self, name: str) -> Path:
+        return self._model_dir(name) / "CURRENT"
+
+    def _new_version_dir(self, name: str) -> Path:
+        model_dir = self._model_dir(name)
+        model_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            numbers = [int(p.name[1:]) for p in model_dir.glob("v*") if p.name[1:].isdigit()]
+            path = model_dir / f"v{max(numbers, default=0) + 1:04d}"
+            try:
+                # mkdir is the lock: concurrent registrations get distinct versions.
+                path.mkdir()
+                return path
+            except FileExistsError:
+                continue
+
+    def register(
+        self,
+        model: AttendanceForecaster,
+        *,
+        name: str = "attendance",
+        dataset: Optional[pd.DataFrame] = None,
+        promote: bool = False,
+        **extra: Any,
+    ) -> ModelVersion:
+        """Save ``model`` as a new version, optionally promoting it."""
+
+        path = self._new_version_dir(name)
+        model.save(path / MODEL_FILE)
+        features = model.config.features
+        last_fit = model.lineage_[-1] if model.lineage_ else {}
+        metadata = {
+            "name": name,
+            "version": path.name,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "engine": type(model.model_).__name__,
+            "metrics": getattr(model, "_latest_metrics", None),
+            "features": {"categorical": features.categorical, "numerical": features.numerical},
+            "target": features.target,
+            "data_fingerprint": frame_fingerprint(dataset) if dataset is not None else None,
+            "training_seconds": last_fit.get("fit_seconds"),
+            "trained_through": last_fit.get("trained_through"),
+            "model_config": asdict(model.config.model),
+            "lineage": model.lineage_,
+            **extra,
+        }
+        _write_atomic(path / METADATA_FILE, json.dumps(metadata, indent=2, default=str))
+        version = ModelVersion(name, path.name, path, metadata)
+        LOGGER.info("Registered %s %s", name, path.name)
+        if promote:
+            self.promote(name, path.name)
+        if self.keep_last is not None:
+            self.prune(name, keep_last=self.keep_last)
+        return version
+
+    def get(self, name: str = "attendance", version: Optional[str] = None) -> ModelVersion:
+        """A registered version; the promoted one when ``version`` is omitted."""
+
+        version = version or self.current_version(name)
+        if version is None:
+            raise LookupError(f"No promoted version of {name!r} in {self.root}.")
+        path = self._model_dir(name) / version
+        metadata_path = path / METADATA_FILE
+        if not metadata_path.exists():
+            raise LookupError(f"{name} {version} is not registered in {self.root}.")
+        return ModelVersion(name, version, path, json.loads(metadata_path.read_text()))
+
+    def versions(self, name: str = "attendance") -> List[ModelVersion]:
+        model_dir = self._model_dir(name)
+        if not model_dir.exists():
+            return []
+        return [
+            self.get(name, path.name)
+            for path in sorted(model_dir.glob("v*"))
+            if (path / METADATA_FILE).exists()
+        ]
+
+    def current_version(self, name: str = "attendance") -> Optional[str]:
+        pointer = self._pointer(name)
+        return pointer.read_text().strip() if pointer.exists() else None
+
+    def promote(self, name: str, version: str) -> ModelVersion:
+        """Atomically make ``version`` the one :meth:`load` returns by default."""
+
+        target = self.get(name, version)
+        _write_atomic(self._pointer(name), version)
+        LOGGER.info("Promoted %s %s", name, version)
+        return target
+
+    def prune(self, name: str = "attendance", *, keep_last: int) -> List[str]:
+        """Delete all but the newest ``keep_last`` versions; returns the removed ones.
+
+        The promoted version is always kept, as are directories still being
+        registered (no metadata yet).
+        """
+
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1.")
+        current = self.current_version(name)
+        stale = [entry for entry in self.versions(name)[:-keep_last] if entry.version != current]
+        for entry in stale:
+            shutil.rmtree(entry.path, ignore_errors=True)
+        if stale:
+            LOGGER.info("Pruned %d old %s versions.", len(stale), name)
+        return [entry.version for entry in stale]
+
+    def load(
+        self,
+        name: str = "attendance",
+        version: Optional[str] = None,
+        *,
+        config: Optional[ProjectConfig] = None,
+        mmap_mode: Optional[str] = "r",
+    ) -> AttendanceForecaster:
+        """Load a version (default: promoted) with its arrays memory-mapped."""
+
+        return AttendanceForecaster.load(
+            self.get(name, version).model_path, config=config, mmap_mode=mmap_mode
+        )
+
+    def summary(self, name: str = "attendance") -> pd.DataFrame:
+        """One row per version with its headline metadata."""
+
+        current = self.current_version(name)
+        rows = []
+        for entry in self.versions(name):
+            meta = entry.metadata
+            rows.append(
+                {
+                    "version": entry.version,
+                    "current": entry.version == current,
+                    "created_at": meta.get("created_at"),
+                    "engine": meta.get("engine"),
+                    "mae": (meta.get("metrics") or {}).get("mae"),
+                    "r2": (meta.get("metrics") or {}).get("r2"),
+                    "training_seconds": meta.get("training_seconds"),
+                    "data_fingerprint": (meta.get("data_fingerprint") or "")[:12],
+                }
+            )
+        return pd.DataFrame(rows)
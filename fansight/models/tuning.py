@@ -0,0 +1,257 @@
+"""Time-ordered cross-validation and parallel hyperparameter search for the forecaster."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import ParameterGrid, ParameterSampler
+from threadpoolctl import threadpool_limits
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig
+from fansight.features.engineering import build_feature_pipeline, prepare_training_matrices
+from fansight.models.forecasting import build_estimator
+from fansight.utils.cache import frame_fingerprint
+
+LOGGER = logging.getLogger(__name__)
+
+SearchSpace = Mapping[str, Sequence[Any]]
+Split = Tuple[np.ndarray, np.ndarray]
+
+
+def time_ordered_splits(dates: pd.Series, n_splits: int) -> List[Split]:
+    """Expanding-window folds over whole game dates.
+
+    The distinct dates are cut into ``n_splits + 1`` consecutive blocks; fold
+    ``k`` trains on every row dated before block ``k + 1`` and tests on that
+    block, so a game day never straddles train and test. Train positions are
+    returned oldest first.
+    """
+
+    values = pd.to_datetime(dates).to_numpy()
+    unique = np.unique(values[~pd.isna(values)])
+    if len(unique) < n_splits + 1:
+        raise ValueError(f"Need at least {n_splits + 1} distinct game dates for {n_splits} folds.")
+    blocks = np.array_split(unique, n_splits + 1)
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    splits = []
+    for block in blocks[1:]:
+        train_end = np.searchsorted(sorted_values, block[0], side="left")
+        test_end = np.searchsorted(sorted_values, block[-1], side="right")
+        splits.append((order[:train_end], np.sort(order[train_end:test_end])))
+    return splits
+
+
+def cache_fold_matrices(
+    X: pd.DataFrame,
+    y: pd.Series,
+    splits: Sequence[Split],
+    *,
+    native_categorical: bool,
+    root: Path,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> List[Path]:
+    """Fit the feature pipeline once per fold and store the transformed matrices.
+
+    Files are keyed by the data, feature config, encoding and fold, so
+    repeated searches over the same dataset reuse them. Workers load them with
+    ``mmap_mode="r"`` and share the pages instead of receiving pickled copies.
+    """
+
+    root.mkdir(parents=True, exist_ok=True)
+    base = hashlib.sha256(
+        json.dumps(
+            [frame_fingerprint(X, y)[:16], asdict(config.features), native_categorical],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()[:16]
+    paths = []
+    for index, (train, test) in enumerate(splits):
+        path = root / f"fold_{base}_{len(splits)}_{index}.joblib"
+        if not path.exists():
+            pipeline = build_feature_pipeline(config=config, native_categorical=native_categorical)
+            payload = {
+                "X_train": pipeline.fit_transform(X.iloc[train], y.iloc[train]),
+                "y_train": y.iloc[train].to_numpy(dtype=float),
+                "X_test": pipeline.transform(X.iloc[test]),
+                "y_test": y.iloc[test].to_numpy(dtype=float),
+            }
+            tmp = path.with_suffix(".tmp")
+            joblib.dump(payload, tmp)
+            tmp.replace(path)
+        paths.append(path)
+    return paths
+
+
+def candidate_params(
+    space: SearchSpace,
+    *,
+    n_candidates: Optional[int] = None,
+    random_state: int = 0,
+) -> List[Dict[str, Any]]:
+    """Every combination in ``space``, or ``n_candidates`` sampled from it."""
+
+    valid = {f.name for f in fields(DEFAULT_CONFIG.model)}
+    unknown = sorted(set(space) - valid)
+    if unknown:
+        raise ValueError(f"Unknown ModelConfig fields in search space: {', '.join(unknown)}")
+    if n_candidates is None:
+        return list(ParameterGrid(dict(space)))
+    return list(ParameterSampler(dict(space), n_iter=n_candidates, random_state=random_state))
+
+
+def _evaluate(
+    path: Path, config: ProjectConfig, train_rows: int, threads: Optional[int]
+) -> Dict[str, float]:
+    fold = joblib.load(path, mmap_mode="r")
+    X_train, y_train = fold["X_train"], fold["y_train"]
+    if train_rows < len(y_train):
+        # Halving rungs train on the most recent rows of the fold.
+        X_train, y_train = X_train[-train_rows:], y_train[-train_rows:]
+    model = build_estimator(config)
+    start = time.perf_counter()
+    with threadpool_limits(limits=threads):
+        model.fit(X_train, y_train)
+        preds = model.predict(fold["X_test"])
+    y_test = fold["y_test"]
+    return {
+        "mae": float(mean_absolute_error(y_test, preds)),
+        "r2": float(r2_score(y_test, preds)) if len(y_test) >= 2 else float("nan"),
+        "fit_s": time.perf_counter() - start,
+    }
+
+
+def _rungs(n_candidates: int, factor: int, smallest_train: int, min_rows: int) -> Iterator[float]:
+    """Training-row fractions per rung, ending at 1.0."""
+
+    if factor <= 1:
+        yield 1.0
+        return
+    n_rungs = 1 + int(math.floor(math.log(max(n_candidates, 1), factor)))
+    while n_rungs > 1 and smallest_train * factor ** -(n_rungs - 1) < min_rows:
+        n_rungs -= 1
+    for rung in range(n_rungs):
+        yield float(factor ** -(n_rungs - 1 - rung))
+
+
+@dataclass
+class TuningResult:
+    best_params: Dict[str, Any]
+    config: ProjectConfig
+    leaderboard: pd.DataFrame
+    leaderboard_path: Path
+
+
+def tune_forecaster(
+    dataset: pd.DataFrame,
+    space: SearchSpace,
+    *,
+    n_candidates: Optional[int] = None,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    date_col: str = "game_date",
+) -> TuningResult:
+    """Search ``ModelConfig`` values in ``space`` with time-ordered CV in a process pool.
+
+    Each rung fits every surviving candidate on every fold in parallel
+    (``config.tuning.workers`` processes, BLAS/OpenMP pinned to one thread
+    each) and keeps the lowest mean MAE ``1 / halving_factor`` for the next
+    rung, which trains on ``halving_factor`` times more rows. Fold matrices
+    come from :func:`cache_fold_matrices`. The leaderboard (one row per
+    candidate and rung) is appended to ``leaderboard_name`` in the artifacts
+    directory under a fresh ``run_id``.
+    """
+
+    settings = config.tuning
+    candidates = candidate_params(space, n_candidates=n_candidates, random_state=config.model.random_state)
+    if not candidates:
+        raise ValueError("Search space is empty.")
+    configs = [replace(config, model=replace(config.model, **params)) for params in candidates]
+
+    X, y = prepare_training_matrices(dataset, config=config)
+    splits = time_ordered_splits(dataset[date_col], settings.n_splits)
+    cache_root = config.paths.cache / "tuning"
+    fold_paths: Dict[bool, List[Path]] = {}
+    for candidate in configs:
+        native = candidate.model.engine == "hist_gbr"
+        if native not in fold_paths:
+            fold_paths[native] = cache_fold_matrices(
+                X, y, splits, native_categorical=native, root=cache_root, config=config
+            )
+
+    workers = settings.workers or os.cpu_count() or 1
+    threads = 1 if workers > 1 else None
+    smallest_train = min(len(train) for train, _ in splits)
+    run_id = time.strftime("%Y%m%dT%H%M%S")
+    rows: List[Dict[str, Any]] = []
+    survivors = list(range(len(candidates)))
+    LOGGER.info(
+        "Tuning %d candidates over %d time-ordered folds with %d workers.",
+        len(candidates), len(splits), workers,
+    )
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rung, fraction in enumerate(
+            _rungs(len(candidates), settings.halving_factor, smallest_train, settings.min_train_rows)
+        ):
+            futures = {
+                (c, f): pool.submit(
+                    _evaluate,
+                    fold_paths[configs[c].model.engine == "hist_gbr"][f],
+                    configs[c],
+                    max(1, int(len(train) * fraction)),
+                    threads,
+                )
+                for c in survivors
+                for f, (train, _) in enumerate(splits)
+            }
+            scores = []
+            for c in survivors:
+                folds = [futures[(c, f)].result() for f in range(len(splits))]
+                mae = np.array([fold["mae"] for fold in folds])
+                rows.append(
+                    {
+                        "run_id": run_id,
+                        "candidate": c,
+                        "rung": rung,
+                        "train_fraction": round(fraction, 4),
+                        "params": json.dumps(candidates[c], sort_keys=True, default=str),
+                        "mae_mean": float(mae.mean()),
+                        "mae_std": float(mae.std()),
+                        "r2_mean": float(np.nanmean([fold["r2"] for fold in folds])),
+                        "fit_s": float(sum(fold["fit_s"] for fold in folds)),
+                    }
+                )
+                scores.append(float(mae.mean()))
+            LOGGER.info(
+                "Rung %d (%.0f%% of training rows): best MAE %.2f across %d candidates.",
+                rung, fraction * 100, min(scores), len(survivors),
+            )
+            keep = max(1, math.ceil(len(survivors) / max(settings.halving_factor, 1)))
+            survivors = [survivors[i] for i in np.argsort(scores, kind="stable")[:keep]]
+
+    leaderboard = pd.DataFrame(rows).sort_values(["rung", "mae_mean"], ascending=[False, True])
+    leaderboard = leaderboard.reset_index(drop=True)
+    path = config.paths.artifacts / settings.leaderboard_name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    leaderboard.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+    best = int(leaderboard.loc[0, "candidate"])
+    LOGGER.info("Best candidate %s (MAE=%.2f)", candidates[best], leaderboard.loc[0, "mae_mean"])
+    return TuningResult(
+        best_params=candidates[best],
+        config=configs[best],
+        leaderboard=leaderboard,
+        leaderboard_path=path,
+    )
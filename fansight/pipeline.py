@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
 
 import pandas as pd
 
 from fansight import config
-from fansight.data import etl, sources
+from fansight.data import etl, incremental, sources
 from fansight.features import engineering, segmentation
+from fansight.features.store import FeatureStore
 from fansight.marketing import ab_testing
+from fansight.models import tuning
 from fansight.models.forecasting import AttendanceForecaster
+from fansight.models.registry import ModelRegistry
 from fansight.reporting import dashboards
+from fansight.utils.cache import DatasetCache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,26 +32,138 @@ class FanSightPipeline:
     dataset_: Optional[pd.DataFrame] = None
     model_: Optional[AttendanceForecaster] = None
     segment_result_: Optional[segmentation.SegmentResult] = None
+    etl_cache_: Optional[DatasetCache] = None
+    tuning_result_: Optional[tuning.TuningResult] = None
+    segment_sweep_: Optional[pd.DataFrame] = None
 
     def run_etl(self) -> pd.DataFrame:
         LOGGER.info("Running FanSight ETL for dataset %s", self.dataset_name)
-        dataset, path = etl.build_and_save_dataset(self.dataset_name, config=self.cfg)
+        if self.cfg.etl.use_cache and self.etl_cache_ is None:
+            self.etl_cache_ = etl.get_cache(self.cfg)
+        # Also keeps the touch state that run_incremental_etl folds new touches into.
+        dataset, path = incremental.rebuild_dataset(
+            self.dataset_name, config=self.cfg, cache=self.etl_cache_
+        )
         LOGGER.info("Saved processed dataset to %s", path)
+        if self.etl_cache_ is not None:
+            LOGGER.info("ETL cache report: %s", self.etl_cache_.report())
         self.dataset_ = dataset
         return dataset
 
-    def run_modeling(self) -> AttendanceForecaster:
+    def run_incremental_etl(self, new_touches: Union[pd.DataFrame, Path]) -> pd.DataFrame:
+        """Fold newly appended campaign touches into the processed dataset."""
+
+        LOGGER.info("Applying new campaign touches to dataset %s", self.dataset_name)
+        if self.cfg.etl.use_cache and self.etl_cache_ is None:
+            self.etl_cache_ = etl.get_cache(self.cfg)
+        dataset, path = incremental.append_campaign_touches(
+            self.dataset_name,
+            new_touches,
+            config=self.cfg,
+            current=self.dataset_,
+            cache=self.etl_cache_,
+        )
+        LOGGER.info("Updated processed dataset at %s", path)
+        self.dataset_ = dataset
+        return dataset
+
+    def run_modeling(
+        self,
+        *,
+        incremental: bool = False,
+        register: bool = False,
+        promote: bool = False,
+    ) -> AttendanceForecaster:
+        """Train the attendance forecaster and save it to the artifacts directory.
+
+        With ``incremental`` the previous artifact is updated with the rows
+        dated after its last ``trained_through`` (warm start, or a full refit
+        when they drift); without one this is a regular full fit. With
+        ``register`` the result is also stored as a new version in the
+        :class:`ModelRegistry` (pruned to ``ModelConfig.registry_keep_last``),
+        and with ``promote`` as well it becomes the version served by default.
+        """
+
         if self.dataset_ is None:
             raise RuntimeError("Call run_etl before modeling.")
-        LOGGER.info("Training attendance forecaster.")
-        model = AttendanceForecaster(config=self.cfg)
-        model.fit(self.dataset_)
-        model_path = model.save()
+        model_path = self.cfg.paths.artifacts / "attendance_model.joblib"
+        model = None
+        if incremental and model_path.exists():
+            model = AttendanceForecaster.load(model_path, config=self.cfg)
+            through = model.trained_through
+            if through is None or "game_date" not in self.dataset_:
+                LOGGER.info("Previous model has no date lineage; retraining from scratch.")
+                model = None
+            else:
+                new_rows = self.dataset_[pd.to_datetime(self.dataset_["game_date"]) > through]
+                if new_rows.empty:
+                    LOGGER.info("No games after %s; keeping the existing model.", through.date())
+                    self.model_ = self._attach_feature_store(model)
+                    return model
+                LOGGER.info("Updating attendance forecaster with %d rows after %s.", len(new_rows), through.date())
+                model.update(new_rows, history=self.dataset_)
+        if model is None:
+            LOGGER.info("Training attendance forecaster.")
+            model = AttendanceForecaster(config=self.cfg)
+            model.fit(self.dataset_)
+        self._attach_feature_store(model)
+        model.save(model_path)
         mae, r2 = model.evaluate()
         LOGGER.info("Model saved to %s (MAE=%.2f, R2=%.3f)", model_path, mae, r2)
+        if register:
+            version = ModelRegistry.from_config(self.cfg).register(model, dataset=self.dataset_, promote=promote)
+            LOGGER.info("Registered model version %s (promoted: %s)", version.version, promote)
         self.model_ = model
         return model
 
+    def _attach_feature_store(self, model: AttendanceForecaster) -> AttendanceForecaster:
+        if self.cfg.etl.feature_store:
+            model.feature_store_ = FeatureStore.from_config(self.cfg)
+        return model
+
+    def run_tuning(
+        self,
+        space: Dict[str, Sequence[Any]],
+        *,
+        n_candidates: Optional[int] = None,
+        apply: bool = False,
+    ) -> tuning.TuningResult:
+        """Search ``ModelConfig`` values with time-ordered CV; ``apply`` adopts the winner for later runs."""
+
+        if self.dataset_ is None:
+            raise RuntimeError("Call run_etl before tuning.")
+        result = tuning.tune_forecaster(self.dataset_, space, n_candidates=n_candidates, config=self.cfg)
+        LOGGER.info("Tuning leaderboard written to %s", result.leaderboard_path)
+        if apply:
+            self.cfg = result.config
+        self.tuning_result_ = result
+        return result
+
+    def score_upcoming_games(
+        self,
+        games: pd.DataFrame,
+        output: Optional[Path] = None,
+        *,
+        batch_size: Optional[int] = None,
+        workers: int = 1,
+    ) -> Path:
+        """Score every fan against each game in ``games``, streaming predictions to ``output``."""
+
+        if self.model_ is None:
+            raise RuntimeError("Call run_modeling before scoring.")
+        batch_size = batch_size or self.cfg.model.predict_batch_size
+        output = output or self.cfg.paths.artifacts / "upcoming_predictions.csv"
+        fans = sources.load_fans(config=self.cfg)
+        LOGGER.info("Scoring %d fans against %d upcoming games.", len(fans), len(games))
+        rows = self.model_.predict_batches(
+            etl.iter_fan_game_grid(fans, games, rows_per_chunk=batch_size),
+            output,
+            batch_size=batch_size,
+            workers=workers,
+        )
+        LOGGER.info("Wrote %d predictions to %s", rows, output)
+        return output
+
     def run_segmentation(self, n_segments: Optional[int] = None) -> segmentation.SegmentResult:
         if self.dataset_ is None:
             raise RuntimeError("Dataset unavailable for segmentation.")
@@ -54,9 +171,23 @@ class FanSightPipeline:
         result = segmentation.run_kmeans_segmentation(
             self.dataset_,
             n_segments=n_segments or self.cfg.model.segment_k,
+            config=self.cfg,
         )
         self.segment_result_ = result
         LOGGER.info("Segmentation silhouette score: %.3f", result.silhouette)
+        LOGGER.info("Segmentation fit: %s", result.report)
+        return result
+
+    def run_segmentation_sweep(self, ks: Optional[Sequence[int]] = None) -> segmentation.SegmentSweepResult:
+        """Fit each candidate k in parallel and keep the best as ``segment_result_``."""
+
+        if self.dataset_ is None:
+            raise RuntimeError("Dataset unavailable for segmentation.")
+        LOGGER.info("Running segmentation sweep.")
+        result = segmentation.sweep_segment_counts(self.dataset_, ks, config=self.cfg)
+        self.segment_result_ = result.best
+        self.segment_sweep_ = result.table
+        LOGGER.info("Segmentation sweep:\n%s", result.table.to_string(index=False))
         return result
 
     def run_ab_testing(
@@ -78,6 +209,8 @@ class FanSightPipeline:
         feature_importances = None
         if self.model_ is not None:
             preds = self.model_.predict(self.dataset_)
+            if self.model_.feature_store_ is not None:
+                LOGGER.info("Feature store report: %s", self.model_.feature_store_.report())
         if self.model_ and hasattr(self.model_.model_, "feature_importances_"):
             feature_importances = {
                 f"f_{i}": float(imp)
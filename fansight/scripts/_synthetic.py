@@ -0,0 +1,54 @@
+"""Synthetic fan/game data shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+TEAMS = ["Metro Meteors", "Coast Captains", "Capital Comets", "Harbor Hawks", "Desert Drakes"]
+
+
+def synthetic_dataset(n_rows: int, seed: int = 7) -> pd.DataFrame:
+    """A fan/game frame with every configured feature and a target that depends on them."""
+
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 180, n_rows), unit="D")
+    df = pd.DataFrame(
+        {
+            "game_date": dates,
+            "home_team": rng.choice(TEAMS, n_rows),
+            "visitor_team": rng.choice(TEAMS, n_rows),
+            "segment": rng.choice(["Loyal", "Value", "New"], n_rows),
+            "campaign_channel": rng.choice(["email", "sms", "social", None], n_rows),
+            "promotion_flag": rng.integers(0, 2, n_rows),
+            "day_of_week": dates.day_name(),
+            "month": dates.month_name(),
+            "is_rivalry": rng.integers(0, 2, n_rows),
+            "game_id": rng.integers(1, 200, n_rows),
+            "fan_id": rng.integers(1, 50_000, n_rows),
+            "ticket_price": rng.uniform(40, 160, n_rows).round(2),
+            "engagement_score": rng.random(n_rows),
+            "loyalty_score": rng.random(n_rows),
+            "tenure_days": rng.integers(10, 3_000, n_rows),
+            "avg_spend": rng.uniform(20, 200, n_rows),
+            "lifetime_value": rng.uniform(100, 6_000, n_rows),
+            "price_sensitivity": rng.random(n_rows),
+            "campaign_spend": rng.uniform(0, 20, n_rows),
+            "touch_count_7d": rng.integers(0, 5, n_rows),
+            "touch_count_30d": rng.integers(0, 15, n_rows),
+            "win_pct_home": rng.uniform(0.2, 0.8, n_rows),
+            "win_pct_visitor": rng.uniform(0.2, 0.8, n_rows),
+            "attendance_lag_1": rng.integers(12_000, 19_000, n_rows),
+            "attendance_lag_3": rng.integers(12_000, 19_000, n_rows),
+            "capacity": 19_000,
+        }
+    )
+    df.loc[rng.random(n_rows) < 0.05, "ticket_price"] = np.nan
+    df["attendance"] = (
+        12_000
+        + 4_000 * df["win_pct_home"]
+        + 2_000 * df["loyalty_score"]
+        - 10 * df["ticket_price"].fillna(100)
+        + rng.normal(0, 300, n_rows)
+    )
+    return df
@@ -0,0 +1,98 @@
+"""Benchmark feature-matrix memory and fit time as a categorical column's cardinality grows."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig
+from fansight.features.engineering import build_feature_pipeline, prepare_training_matrices
+from fansight.models.forecasting import build_estimator
+from fansight.scripts._synthetic import synthetic_dataset
+
+# FeatureConfig overrides per mode; "onehot" is the previous behaviour.
+MODES: Dict[str, Dict[str, Any]] = {
+    "onehot": {"sparse_output": False, "max_onehot_levels": None},
+    "onehot_csr": {"sparse_output": True, "max_onehot_levels": None},
+    # Target encoding leaves a narrow, dense matrix, which trees fit faster than CSR.
+    "target_encoded": {"sparse_output": False, "max_onehot_levels": DEFAULT_CONFIG.features.max_onehot_levels},
+}
+
+
+def with_fan_zone(df: pd.DataFrame, cardinality: int, seed: int = 7) -> pd.DataFrame:
+    """Add a ``fan_zone`` categorical with ``cardinality`` levels that shifts the target."""
+
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, cardinality, len(df))
+    effect = rng.normal(0, 400, cardinality)
+    df = df.assign(fan_zone=pd.Series(codes).map(lambda c: f"zone_{c}").to_numpy(dtype=object))
+    df["attendance"] = df["attendance"] + effect[codes]
+    return df
+
+
+def _nbytes(matrix: Any) -> int:
+    if sp.issparse(matrix):
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return np.asarray(matrix).nbytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--cardinality", type=int, nargs="+", default=[30, 300, 3_000])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--n-estimators", type=int, default=50)
+    args = parser.parse_args()
+
+    base = synthetic_dataset(args.rows)
+    split = int(args.rows * 0.8)
+    rows: List[Dict[str, Any]] = []
+    for cardinality in args.cardinality:
+        data = with_fan_zone(base, cardinality)
+        for mode in args.modes:
+            features = replace(
+                DEFAULT_CONFIG.features,
+                categorical=DEFAULT_CONFIG.features.categorical + ["fan_zone"],
+                **MODES[mode],
+            )
+            config: ProjectConfig = replace(
+                DEFAULT_CONFIG,
+                features=features,
+                model=replace(DEFAULT_CONFIG.model, n_estimators=args.n_estimators),
+            )
+            X, y = prepare_training_matrices(data, config=config)
+            pipeline = build_feature_pipeline(config=config)
+            start = time.perf_counter()
+            X_train = pipeline.fit_transform(X.iloc[:split], y.iloc[:split])
+            X_test = pipeline.transform(X.iloc[split:])
+            transform_s = time.perf_counter() - start
+            model = build_estimator(config)
+            start = time.perf_counter()
+            model.fit(X_train, y.iloc[:split])
+            fit_s = time.perf_counter() - start
+            mae = float(np.abs(model.predict(X_test) - y.iloc[split:].to_numpy()).mean())
+            rows.append(
+                {
+                    "cardinality": cardinality,
+                    "mode": mode,
+                    "columns": X_train.shape[1],
+                    "sparse": sp.issparse(X_train),
+                    "matrix_mb": round(_nbytes(X_train) / 1e6, 1),
+                    "transform_s": round(transform_s, 2),
+                    "fit_s": round(fit_s, 2),
+                    "mae": round(mae, 1),
+                }
+            )
+            print(rows[-1])
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
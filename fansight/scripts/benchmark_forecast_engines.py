@@ -0,0 +1,56 @@
+"""Compare training time and holdout accuracy of the forecaster's model engines as data grows."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG
+from fansight.models.forecasting import ENGINES, AttendanceForecaster
+from fansight.scripts._synthetic import synthetic_dataset
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[5_000, 20_000, 80_000])
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    parser.add_argument("--n-estimators", type=int, default=DEFAULT_CONFIG.model.n_estimators)
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    for n_rows in args.rows:
+        data = synthetic_dataset(n_rows)
+        for engine in args.engines:
+            config = replace(
+                DEFAULT_CONFIG,
+                model=replace(DEFAULT_CONFIG.model, engine=engine, n_estimators=args.n_estimators),
+            )
+            model = AttendanceForecaster(config=config)
+            start = time.perf_counter()
+            model.fit(data)
+            seconds = time.perf_counter() - start
+            mae, r2 = model.evaluate()
+            rows.append(
+                {
+                    "rows": n_rows,
+                    "engine": engine,
+                    "fit_s": round(seconds, 2),
+                    "iterations": getattr(model.model_, "n_iter_", None) or model.model_.n_estimators_,
+                    "mae": round(mae, 1),
+                    "r2": round(r2, 4),
+                }
+            )
+            print(rows[-1])
+
+    report = pd.DataFrame(rows)
+    baseline = report[report["engine"] == args.engines[0]].set_index("rows")["fit_s"]
+    report["speedup"] = (report["rows"].map(baseline) / report["fit_s"]).round(1)
+    print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
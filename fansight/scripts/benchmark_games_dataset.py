@@ -0,0 +1,192 @@
+"""Benchmark the single-pass games dataset build against the merge-based path on synthetic logs."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fansight.scripts import build_games_dataset as games_dataset
+
+N_TEAMS = 30
+GAMES_PER_SEASON = 1_230
+
+
+def synthetic_logs(n_seasons: int, first_season: int = 1985, seed: int = 7) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Raw NBA-style team-game log plus a Basketball-Reference attendance export."""
+
+    rng = np.random.default_rng(seed)
+    abbrs = np.array([f"T{i:02d}" for i in range(N_TEAMS)], dtype=object)
+    names = np.array([f"City {i:02d} Club" for i in range(N_TEAMS)], dtype=object)
+
+    season_idx = np.repeat(np.arange(n_seasons), GAMES_PER_SEASON)
+    game_no = np.tile(np.arange(1, GAMES_PER_SEASON + 1), n_seasons)
+    start_year = first_season + season_idx
+    home = rng.integers(0, N_TEAMS, len(season_idx))
+    visitor = (home + rng.integers(1, N_TEAMS, len(season_idx))) % N_TEAMS
+    dates = pd.to_datetime(start_year.astype(str) + "-10-20") + pd.to_timedelta(
+        np.sort(rng.integers(0, 170, (n_seasons, GAMES_PER_SEASON)), axis=1).ravel(), unit="D"
+    )
+    # A pairing plays at most once per day, so (date, home, visitor) identifies a game.
+    unique = ~pd.DataFrame({"date": dates, "home": home, "visitor": visitor}).duplicated().to_numpy()
+    start_year, game_no, home, visitor, dates = (
+        start_year[unique], game_no[unique], home[unique], visitor[unique], dates[unique]
+    )
+    game_id = 20_000_000 + (start_year % 100) * 100_000 + game_no
+    home_won = rng.random(len(home)) < 0.6
+    season = [f"{year}-{str(year + 1)[-2:]}" for year in start_year]
+
+    def team_rows(team: np.ndarray, opponent: np.ndarray, at_home: bool, won: np.ndarray) -> pd.DataFrame:
+        frame = pd.DataFrame(
+            {
+                "SEASON_ID": 20_000 + start_year,
+                "TEAM_ID": 1_610_612_700 + team,
+                "TEAM_ABBREVIATION": abbrs[team],
+                "TEAM_NAME": names[team],
+                "GAME_ID": game_id,
+                "GAME_DATE": dates.strftime("%Y-%m-%d"),
+                "MATCHUP": abbrs[team] + (" vs. " if at_home else " @ ") + abbrs[opponent],
+                "WL": np.where(won, "W", "L"),
+            }
+        )
+        for column in games_dataset.STATS_COLUMNS:
+            if column.endswith("_PCT"):
+                frame[column] = rng.random(len(frame)).round(3)
+            else:
+                frame[column] = rng.integers(0, 120, len(frame))
+        frame["SEASON"] = season
+        return frame
+
+    games = pd.concat(
+        [team_rows(home, visitor, True, home_won), team_rows(visitor, home, False, ~home_won)],
+        ignore_index=True,
+    ).sample(frac=1.0, random_state=seed, ignore_index=True)
+
+    attendance = pd.DataFrame(
+        {
+            "Date": dates.strftime("%a, %b %-d, %Y"),
+            "visitor_team": names[visitor],
+            "home_team": names[home],
+            "attendance": np.where(rng.random(len(home)) < 0.02, np.nan, rng.integers(12_000, 21_000, len(home))),
+            "Arena": names[home] + " Arena",
+            "Notes": np.nan,
+            "Source file": "synthetic.xls",
+        }
+    )
+    return games, attendance
+
+
+def legacy_build(games: pd.DataFrame, attendance: pd.DataFrame, capacity: pd.DataFrame) -> pd.DataFrame:
+    """The previous implementation: sort + groupbys, two win% merges, regex matchups, string-key joins."""
+
+    abbrev_to_name: Dict[str, str] = (
+        games[["TEAM_ABBREVIATION", "TEAM_NAME"]]
+        .drop_duplicates()
+        .set_index("TEAM_ABBREVIATION")["TEAM_NAME"]
+        .to_dict()
+    )
+    lookup = games.copy()
+    lookup["game_date"] = pd.to_datetime(lookup["GAME_DATE"])
+    lookup["win_flag"] = (lookup["WL"] == "W").astype(int)
+    lookup = lookup.sort_values(["TEAM_ABBREVIATION", "SEASON", "game_date", "GAME_ID"])
+    group_cols = ["TEAM_ABBREVIATION", "SEASON"]
+    lookup["games_prior"] = lookup.groupby(group_cols).cumcount()
+    lookup["wins_prior"] = lookup.groupby(group_cols)["win_flag"].cumsum() - lookup["win_flag"]
+    lookup["win_pct_prior"] = lookup["wins_prior"] / lookup["games_prior"].replace(0, pd.NA)
+    lookup = lookup[["GAME_ID", "TEAM_ABBREVIATION", "win_pct_prior"]]
+
+    home_games = games[games["MATCHUP"].str.contains("vs.", regex=False)].copy()
+    home_games["home_abbr"] = home_games["TEAM_ABBREVIATION"]
+    home_games["home_team"] = home_games["TEAM_NAME"]
+    home_games["visitor_abbr"] = home_games["MATCHUP"].str.extract(r"vs\. (\w+)")
+    home_games["visitor_team"] = home_games["visitor_abbr"].map(abbrev_to_name)
+    home_games["game_date"] = pd.to_datetime(home_games["GAME_DATE"])
+    home_games["game_id"] = home_games["GAME_ID"]
+    home_games = home_games.merge(
+        lookup.rename(
+            columns={"GAME_ID": "game_id", "TEAM_ABBREVIATION": "home_abbr", "win_pct_prior": "win_pct_home"}
+        ),
+        on=["game_id", "home_abbr"],
+        how="left",
+    )
+    home_games = home_games.merge(
+        lookup.rename(
+            columns={"GAME_ID": "game_id", "TEAM_ABBREVIATION": "visitor_abbr", "win_pct_prior": "win_pct_visitor"}
+        ),
+        on=["game_id", "visitor_abbr"],
+        how="left",
+    )
+    home_games = home_games.rename(columns=games_dataset.RENAME_MAP)[games_dataset.GAME_COLUMNS]
+
+    merged = home_games.merge(
+        attendance, on=["game_date", "home_team", "visitor_team"], how="left", suffixes=("", "_att")
+    )
+    merged = merged.dropna(subset=["attendance"])
+    merged = merged.sort_values("game_date").drop_duplicates("game_id", keep="first")
+    merged = merged.merge(capacity, on="home_team", how="left")
+    merged["capacity"] = merged["arena_capacity"]
+    merged = merged.drop(columns=["arena_capacity", "arena_name_capacity"], errors="ignore")
+    merged["ticket_price"] = merged["home_team"].map(games_dataset.AVERAGE_TICKET_PRICE).fillna(100)
+    return merged.sort_values("game_date").reset_index(drop=True)
+
+
+def _canonical(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.sort_values("game_id").reset_index(drop=True)
+    for column in ("win_pct_home", "win_pct_visitor"):
+        df[column] = pd.to_numeric(df[column]).astype(float)
+    return df
+
+
+def _time(fn: Callable[[], pd.DataFrame], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows: List[dict] = []
+    for n_seasons in args.seasons:
+        games, raw_attendance = synthetic_logs(n_seasons)
+        attendance = games_dataset.prepare_attendance(raw_attendance)
+        capacity = pd.DataFrame(
+            {
+                "home_team": games["TEAM_NAME"].unique(),
+                "arena_capacity": pd.array([18_000] * games["TEAM_NAME"].nunique(), dtype="Int64"),
+                "arena_name_capacity": "Arena",
+            }
+        )
+        pd.testing.assert_frame_equal(
+            _canonical(legacy_build(games, attendance, capacity)),
+            _canonical(games_dataset.build_games_table(games, attendance, capacity)),
+        )
+        legacy = _time(lambda: legacy_build(games, attendance, capacity), args.repeat)
+        single_pass = _time(
+            lambda: games_dataset.build_games_table(games, attendance, capacity), args.repeat
+        )
+        rows.append(
+            {
+                "seasons": n_seasons,
+                "team_rows": len(games),
+                "legacy_s": round(legacy, 3),
+                "single_pass_s": round(single_pass, 3),
+                "speedup": round(legacy / single_pass, 1),
+            }
+        )
+        print(rows[-1])
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Benchmark the lxml schedule parser against the previous ``pd.read_html`` path."""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import re
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fansight.scripts.fetch_bref_attendance import MONTHS, RESPONSE_CACHE_DIR, parse_pages, parse_schedule
+from fansight.utils.schedule_parser import DATE_FORMAT
+
+Page = Tuple[str, int, str]
+
+TEAMS = [
+    "Boston Celtics",
+    "Chicago Bulls",
+    "Golden State Warriors",
+    "Los Angeles Lakers",
+    "New York Knicks",
+    "Toronto Raptors",
+    "Miami Heat",
+    "Denver Nuggets",
+]
+_URL = re.compile(r"NBA_(\d{4})_games-(\w+)\.html")
+
+
+def synthetic_page(season_end_year: int, month: str, games: int, rng: np.random.Generator) -> str:
+    """A page shaped like a Basketball-Reference month: navigation noise around one schedule table."""
+
+    cells = (
+        "<th data-stat='date_game'>Date</th><th>Start (ET)</th><th>Visitor/Neutral</th>"
+        "<th>PTS</th><th>Home/Neutral</th><th>PTS</th><th>&nbsp;</th><th>&nbsp;</th>"
+        "<th>Attend.</th><th>Arena</th><th>Notes</th>"
+    )
+    day0 = pd.Timestamp(f"{season_end_year - 1}-10-01")
+    rows = []
+    for i in range(games):
+        day = day0 + pd.Timedelta(days=int(i // 8))
+        visitor, home = rng.choice(TEAMS, 2, replace=False)
+        attendance = f"{int(rng.integers(12_000, 21_000)):,}" if rng.random() > 0.03 else ""
+        notes = "NBA Cup" if rng.random() < 0.05 else ""
+        rows.append(
+            f"<tr><th scope='row' data-stat='date_game'><a href='/b/{i}'>{day.strftime(DATE_FORMAT)}</a></th>"
+            f"<td data-stat='game_start_time'>7:30p</td>"
+            f"<td data-stat='visitor_team_name'><a href='/t/v'>{visitor}</a></td><td>{rng.integers(90, 130)}</td>"
+            f"<td data-stat='home_team_name'><a href='/t/h'>{home}</a></td><td>{rng.integers(90, 130)}</td>"
+            f"<td><a href='/box/{i}'>Box Score</a></td><td></td>"
+            f"<td data-stat='attendance'>{attendance}</td><td>Arena {home}</td><td>{notes}</td></tr>"
+        )
+        if i == games // 2:
+            rows.append(f"<tr class='thead'>{cells}</tr>")
+    nav = "".join(f"<li><a href='/p/{i}'>Link {i}</a></li>" for i in range(1_500))
+    return (
+        f"<html><head><title>{season_end_year} {month}</title></head><body>"
+        f"<div id='nav'><ul>{nav}</ul></div>"
+        f"<table id='schedule'><thead><tr>{cells}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+        f"<div id='footer'><ul>{nav}</ul></div></body></html>"
+    )
+
+
+def synthetic_corpus(n_pages: int, games: int, seed: int = 7) -> List[Page]:
+    rng = np.random.default_rng(seed)
+    pages = []
+    for i in range(n_pages):
+        season, month = 2000 + i // len(MONTHS), MONTHS[i % len(MONTHS)]
+        pages.append((synthetic_page(season, month, games, rng), season, month))
+    return pages
+
+
+def cached_corpus(cache_dir: Path) -> List[Page]:
+    """Pages saved by the collector's response cache."""
+
+    pages = []
+    for path in sorted(cache_dir.glob("*.pkl")):
+        with path.open("rb") as handle:
+            entry = pickle.load(handle)
+        match = _URL.search(entry.url)
+        if entry.status_code == 200 and match is not None:
+            pages.append((entry.text, int(match.group(1)), match.group(2)))
+    return pages
+
+
+def legacy_parse_schedule(html: str, season_end_year: int, month: str) -> Optional[pd.DataFrame]:
+    """The previous implementation: every table through ``pd.read_html``, keep the first."""
+
+    tables = pd.read_html(StringIO(html))
+    if not tables:
+        return None
+    df = tables[0]
+    df = df.dropna(subset=["Visitor/Neutral"])
+    df["Season"] = f"{season_end_year-1}-{str(season_end_year)[-2:]}"
+    df["Month"] = month.title()
+    df = df.rename(
+        columns={
+            "Visitor/Neutral": "visitor_team",
+            "Home/Neutral": "home_team",
+            "Start (ET)": "start_et",
+            "Attend.": "attendance",
+        }
+    )
+    return df[["Season", "Month", "Date", "visitor_team", "home_team", "attendance", "start_et", "Notes"]]
+
+
+def _normalize_legacy(df: pd.DataFrame) -> pd.DataFrame:
+    df = df[df["visitor_team"] != "Visitor/Neutral"].reset_index(drop=True)
+    df["Date"] = pd.to_datetime(df["Date"], format=DATE_FORMAT, errors="coerce")
+    df["attendance"] = pd.to_numeric(df["attendance"], errors="coerce").astype("Int64")
+    for column in ("start_et", "Notes"):
+        df[column] = df[column].astype(object).where(df[column].notna(), None)
+    return df
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=RESPONSE_CACHE_DIR,
+        help="Response cache to read saved pages from; synthetic pages are used when empty.",
+    )
+    parser.add_argument("--pages", type=int, default=60, help="Synthetic pages when no cache is available.")
+    parser.add_argument("--games", type=int, default=220, help="Games per synthetic page.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages: Sequence[Page] = cached_corpus(args.cache_dir) if args.cache_dir.exists() else []
+    source = f"cache {args.cache_dir}"
+    if not pages:
+        pages = synthetic_corpus(args.pages, args.games)
+        source = "synthetic"
+    print(f"{len(pages)} pages ({source}, {sum(len(p[0]) for p in pages) / 1e6:.1f} MB)")
+
+    for html, season, month in pages:
+        expected = legacy_parse_schedule(html, season, month)
+        actual = parse_schedule(html, season, month)
+        pd.testing.assert_frame_equal(
+            _normalize_legacy(expected), actual.reset_index(drop=True), check_dtype=False
+        )
+
+    runs = {
+        "read_html": lambda: [legacy_parse_schedule(*page) for page in pages],
+        "lxml": lambda: parse_pages(pages, workers=1),
+    }
+    for workers in args.workers:
+        runs[f"lxml x{workers} procs"] = lambda workers=workers: parse_pages(pages, workers=workers)
+
+    rows = []
+    baseline = None
+    for name, fn in runs.items():
+        seconds = _time(fn, args.repeat)
+        baseline = baseline or seconds
+        rows.append(
+            {
+                "parser": name,
+                "seconds": round(seconds, 3),
+                "pages_per_s": round(len(pages) / seconds, 1),
+                "speedup": round(baseline / seconds, 1),
+            }
+        )
+        print(rows[-1])
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark single-record scoring latency: compiled arrays versus the pandas/sklearn path."""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG
+from fansight.models.forecasting import AttendanceForecaster
+from fansight.scripts._synthetic import synthetic_dataset
+
+
+def _latencies(fn: Callable[[Dict[str, Any]], float], records: List[Dict[str, Any]]) -> np.ndarray:
+    timings = np.empty(len(records))
+    for i, record in enumerate(records):
+        start = time.perf_counter()
+        fn(record)
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", type=Path, default=None, help="Saved forecaster; trained on synthetic data if omitted.")
+    parser.add_argument("--train-rows", type=int, default=20_000)
+    parser.add_argument("--n-estimators", type=int, default=DEFAULT_CONFIG.model.n_estimators)
+    parser.add_argument("--records", type=int, default=2_000, help="Single-record calls timed per path.")
+    args = parser.parse_args()
+
+    data = synthetic_dataset(args.train_rows)
+    if args.model is not None:
+        model = AttendanceForecaster.load(args.model)
+    else:
+        config = dataclasses.replace(
+            DEFAULT_CONFIG,
+            model=dataclasses.replace(DEFAULT_CONFIG.model, n_estimators=args.n_estimators),
+        )
+        model = AttendanceForecaster(config=config).fit(data)
+
+    sample = data.sample(n=min(args.records, len(data)), random_state=0)
+    records = [
+        {key: (None if isinstance(value, float) and np.isnan(value) else value) for key, value in row.items()}
+        for row in sample.to_dict("records")
+    ]
+    expected = model.predict(sample).to_numpy()
+    compiled = np.array([model.score_record(record) for record in records])
+    print(f"max |compiled - predict| = {np.abs(compiled - expected).max():.2e}")
+
+    def pandas_path(record: Dict[str, Any]) -> float:
+        return float(model.predict(pd.DataFrame([record])).iloc[0])
+
+    rows = []
+    for name, fn in [("predict (pandas/sklearn)", pandas_path), ("score_record (compiled)", model.score_record)]:
+        micros = _latencies(fn, records)
+        rows.append(
+            {
+                "path": name,
+                "p50_us": round(float(np.percentile(micros, 50)), 1),
+                "p99_us": round(float(np.percentile(micros, 99)), 1),
+                "mean_us": round(float(micros.mean()), 1),
+            }
+        )
+    report = pd.DataFrame(rows)
+    report["p50_speedup"] = (report["p50_us"].iloc[0] / report["p50_us"]).round(1)
+    print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
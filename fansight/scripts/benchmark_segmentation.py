@@ -0,0 +1,79 @@
+"""Compare fit time, memory and silhouette of the segmentation engines as the fan base grows."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import replace
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG
+from fansight.features.segmentation import DEFAULT_FEATURES, SEGMENT_ENGINES, run_kmeans_segmentation
+
+
+def synthetic_fans(n_rows: int, n_groups: int = 6, seed: int = 18) -> pd.DataFrame:
+    """Fan attributes drawn around ``n_groups`` centres, with a few missing values."""
+
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(0, 3, (n_groups, len(DEFAULT_FEATURES)))
+    groups = rng.integers(0, n_groups, n_rows)
+    values = centres[groups] + rng.normal(0, 1, (n_rows, len(DEFAULT_FEATURES)))
+    values[rng.random(values.shape) < 0.01] = np.nan
+    return pd.DataFrame(values, columns=DEFAULT_FEATURES)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50_000, 200_000, 1_000_000])
+    parser.add_argument("--engines", nargs="+", default=list(SEGMENT_ENGINES), choices=SEGMENT_ENGINES)
+    parser.add_argument("--k", type=int, default=DEFAULT_CONFIG.model.segment_k)
+    parser.add_argument("--silhouette-sample", type=int, default=DEFAULT_CONFIG.model.segment_silhouette_sample)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Refit once more under tracemalloc to report each fit's own peak memory.",
+    )
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    for n_rows in args.rows:
+        data = synthetic_fans(n_rows)
+        for engine in args.engines:
+            config = replace(
+                DEFAULT_CONFIG,
+                model=replace(
+                    DEFAULT_CONFIG.model,
+                    segment_engine=engine,
+                    segment_silhouette_sample=args.silhouette_sample,
+                ),
+            )
+            start = time.perf_counter()
+            result = run_kmeans_segmentation(data, n_segments=args.k, config=config)
+            total_s = round(time.perf_counter() - start, 2)
+            peak_mb = None
+            if args.trace_memory:
+                traced = replace(config, model=replace(config.model, segment_trace_memory=True))
+                peak_mb = run_kmeans_segmentation(data, n_segments=args.k, config=traced).report["peak_mb"]
+            rows.append(
+                {
+                    "rows": n_rows,
+                    "engine": engine,
+                    "fit_s": result.report["fit_seconds"],
+                    "total_s": total_s,
+                    "matrix_mb": result.report["matrix_mb"],
+                    "peak_mb": peak_mb,
+                    "peak_rss_mb": result.report.get("peak_rss_mb"),
+                    "inertia_per_row": round(result.report["inertia"] / n_rows, 3),
+                    "silhouette": round(result.silhouette, 4),
+                }
+            )
+            print(rows[-1])
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Load-test the scoring endpoint: throughput and tail latency with and without micro-batching."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from fansight.config import DEFAULT_CONFIG
+from fansight.models.forecasting import AttendanceForecaster
+from fansight.scripts._synthetic import synthetic_dataset
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: bytes = b""
+) -> Tuple[int, Any]:
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _get(port: int, path: str) -> Any:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        return (await _request(reader, writer, "GET", path))[1]
+    finally:
+        writer.close()
+
+
+async def _wait_ready(port: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await _get(port, "/health")
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def _load(port: int, bodies: List[bytes], concurrency: int) -> Tuple[np.ndarray, float]:
+    """Send every body over ``concurrency`` keep-alive connections; returns per-request latencies."""
+
+    latencies = np.empty(len(bodies))
+    cursor = iter(range(len(bodies)))
+
+    async def client() -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            for i in cursor:
+                start = time.perf_counter()
+                status, payload = await _request(reader, writer, "POST", "/predict", bodies[i])
+                latencies[i] = time.perf_counter() - start
+                if status != 200:
+                    raise RuntimeError(f"Request failed with {status}: {payload}")
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+async def _run_mode(
+    model_path: Path, bodies: List[bytes], label: str, max_batch_size: int, args: argparse.Namespace
+) -> List[Dict[str, Any]]:
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "fansight.serving",
+            "--model", str(model_path),
+            "--port", str(port),
+            "--max-batch-size", str(max_batch_size),
+            "--max-wait-ms", str(args.max_wait_ms),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    rows = []
+    try:
+        await _wait_ready(port)
+        for concurrency in args.concurrency:
+            before = await _get(port, "/stats")
+            latencies, wall = await _load(port, bodies, concurrency)
+            after = await _get(port, "/stats")
+            batches = after["batches"] - before["batches"]
+            millis = latencies * 1e3
+            rows.append(
+                {
+                    "mode": label,
+                    "concurrency": concurrency,
+                    "req_per_s": round(len(bodies) / wall, 1),
+                    "p50_ms": round(float(np.percentile(millis, 50)), 2),
+                    "p99_ms": round(float(np.percentile(millis, 99)), 2),
+                    "mean_batch": round((after["records"] - before["records"]) / max(batches, 1), 1),
+                }
+            )
+            print(rows[-1])
+    finally:
+        server.terminate()
+        server.wait()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", type=Path, default=None, help="Saved forecaster; trained on synthetic data if omitted.")
+    parser.add_argument("--train-rows", type=int, default=20_000)
+    parser.add_argument("--n-estimators", type=int, default=DEFAULT_CONFIG.model.n_estimators)
+    parser.add_argument("--requests", type=int, default=2_000, help="Single-record requests per concurrency level.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_CONFIG.serving.max_batch_size)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_CONFIG.serving.max_wait_ms)
+    args = parser.parse_args()
+
+    data = synthetic_dataset(args.train_rows)
+    records = data.drop(columns=["attendance"]).sample(n=args.requests, replace=True, random_state=0)
+    bodies = [
+        json.dumps({k: (None if pd.isna(v) else v) for k, v in row.items()}, default=str).encode()
+        for row in records.to_dict("records")
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = args.model
+        if model_path is None:
+            config = replace(DEFAULT_CONFIG, model=replace(DEFAULT_CONFIG.model, n_estimators=args.n_estimators))
+            model_path = AttendanceForecaster(config=config).fit(data).save(Path(tmp) / "model.joblib")
+
+        rows: List[Dict[str, Any]] = []
+        for label, max_batch_size in [("unbatched", 1), (f"batched<={args.max_batch_size}", args.max_batch_size)]:
+            rows += asyncio.run(_run_mode(model_path, bodies, label, max_batch_size, args))
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
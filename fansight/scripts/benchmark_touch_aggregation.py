@@ -0,0 +1,113 @@
+"""Benchmark vectorized campaign-touch aggregation against the per-group lambda path."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+import pandas as pd
+
+from fansight.data import etl
+
+CHANNELS = ["email", "sms", "social", "push", "display"]
+VARIANTS = ["control", "treatment"]
+
+
+def synthetic_touches(n_groups: int, touches_per_group: int, seed: int = 7) -> pd.DataFrame:
+    """Create touches spread over roughly ``n_groups`` fan/game pairs."""
+
+    rng = np.random.default_rng(seed)
+    n_rows = n_groups * touches_per_group
+    n_games = max(1, int(np.sqrt(n_groups)))
+    n_fans = max(1, n_groups // n_games)
+    channel = rng.choice(CHANNELS, n_rows).astype(object)
+    channel[rng.random(n_rows) < 0.02] = np.nan
+    return pd.DataFrame(
+        {
+            "campaign_id": "BENCH",
+            "fan_id": rng.integers(0, n_fans, n_rows),
+            "game_id": pd.array(rng.integers(0, n_games, n_rows), dtype="Int64"),
+            "touch_date": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 180, n_rows), unit="D"),
+            "campaign_channel": channel,
+            "campaign_spend": rng.uniform(0.5, 2.0, n_rows),
+            "conversion": rng.integers(0, 2, n_rows).astype(float),
+            "promotion_flag": pd.array(rng.integers(0, 2, n_rows), dtype="Int64"),
+            "variant": rng.choice(VARIANTS, n_rows).astype(object),
+        }
+    )
+
+
+def legacy_aggregate(campaigns: pd.DataFrame) -> pd.DataFrame:
+    """The previous implementation: one ``Series.mode`` call per group and column."""
+
+    campaigns = etl._ensure_columns(campaigns.copy(), etl.TOUCH_DEFAULTS)
+    campaigns["touch_date"] = pd.to_datetime(campaigns["touch_date"])
+    campaigns["touch_count"] = 1
+    grouped = (
+        campaigns.groupby(["fan_id", "game_id"], dropna=False)
+        .agg(
+            {
+                "touch_count": "sum",
+                "campaign_spend": "sum",
+                "conversion": "sum",
+                "campaign_channel": lambda s: etl._most_frequent(s),
+                "promotion_flag": "max",
+                "variant": lambda s: etl._most_frequent(s, default="control"),
+            }
+        )
+        .reset_index()
+    )
+    return grouped.rename(
+        columns={"touch_count": "touch_count_total", "conversion": "conversions"}
+    )
+
+
+def _time(fn: Callable[[pd.DataFrame], pd.DataFrame], df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--groups",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Approximate number of fan/game groups per run.",
+    )
+    parser.add_argument("--touches-per-group", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows: List[dict] = []
+    for n_groups in args.groups:
+        touches = synthetic_touches(n_groups, args.touches_per_group)
+        pd.testing.assert_frame_equal(
+            legacy_aggregate(touches), etl.aggregate_campaign_touches(touches)
+        )
+        legacy = _time(legacy_aggregate, touches, args.repeat)
+        vectorized = _time(etl.aggregate_campaign_touches, touches, args.repeat)
+        rows.append(
+            {
+                "touches": len(touches),
+                "groups": touches.groupby(["fan_id", "game_id"]).ngroups,
+                "legacy_s": round(legacy, 4),
+                "vectorized_s": round(vectorized, 4),
+                "speedup": round(legacy / vectorized, 1),
+            }
+        )
+        print(rows[-1])
+
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
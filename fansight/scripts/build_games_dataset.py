@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import argparse
+import pickle
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from fansight.utils import io
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 RAW_GAMES = PROJECT_ROOT / "data" / "raw" / "nba_games.csv"
 RAW_ATTENDANCE = PROJECT_ROOT / "data" / "raw" / "nba_attendance.csv"
 RAW_CAPACITY = PROJECT_ROOT / "data" / "raw" / "arena_capacity.csv"
 OUTPUT = PROJECT_ROOT / "data" / "processed" / "games.csv"
+STATE_PATH = PROJECT_ROOT / "data" / "processed" / "games_win_state.pkl"
 
 # Quick placeholder average ticket prices (USD) per home team.
 # Replace with real pricing data when available.
@@ -25,132 +32,293 @@ AVERAGE_TICKET_PRICE = {
 }
 
 
-def compute_win_pct(games: pd.DataFrame) -> pd.DataFrame:
-    games = games.copy()
-    games["game_date"] = pd.to_datetime(games["GAME_DATE"])
-    games["win_flag"] = (games["WL"] == "W").astype(int)
-    games = games.sort_values(["TEAM_ABBREVIATION", "SEASON", "game_date", "GAME_ID"])
+STATS_COLUMNS = [
+    "FGM",
+    "FGA",
+    "FG_PCT",
+    "FG3M",
+    "FG3A",
+    "FG3_PCT",
+    "FTM",
+    "FTA",
+    "FT_PCT",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+    "PLUS_MINUS",
+]
+
+RENAME_MAP = {col: col.lower() for col in STATS_COLUMNS}
+RENAME_MAP.update(
+    {
+        "WL": "result",
+        "PTS": "home_pts",
+        "TEAM_ID": "team_id",
+        "TEAM_ABBREVIATION": "team_abbreviation",
+        "TEAM_NAME": "team_name",
+        "SEASON_ID": "season_id",
+        "SEASON": "season",
+    }
+)
+
+GAME_COLUMNS = [
+    "game_id",
+    "game_date",
+    "home_team",
+    "visitor_team",
+    "season_id",
+    "season",
+    "team_id",
+    "team_abbreviation",
+    "team_name",
+    "result",
+    "fgm",
+    "fga",
+    "fg_pct",
+    "fg3m",
+    "fg3a",
+    "fg3_pct",
+    "ftm",
+    "fta",
+    "ft_pct",
+    "oreb",
+    "dreb",
+    "reb",
+    "ast",
+    "stl",
+    "blk",
+    "tov",
+    "pf",
+    "home_pts",
+    "plus_minus",
+    "win_pct_home",
+    "win_pct_visitor",
+]
+ATTENDANCE_COLUMNS = ["attendance", "arena", "notes", "source_file"]
+
+
+def _lookup(keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Position of the first ``keys`` entry equal to each query, ``-1`` when absent."""
+
+    if len(keys) == 0:
+        return np.full(len(queries), -1, dtype=np.int64)
+    unique, first = np.unique(keys, return_index=True)
+    slot = np.searchsorted(unique, queries).clip(max=len(unique) - 1)
+    return np.where(unique[slot] == queries, first[slot], -1)
+
+
+def _win_pct_prior(
+    team_season: np.ndarray,
+    wins: np.ndarray,
+    games_before: np.ndarray | int = 0,
+    wins_before: np.ndarray | int = 0,
+) -> np.ndarray:
+    """Win share before each row within its team-season; rows must be in date order.
+
+    ``games_before``/``wins_before`` carry in each row's team-season totals
+    from games processed in earlier runs.
+    """
+
+    grouped = pd.Series(wins).groupby(team_season, sort=False)
+    games_prior = grouped.cumcount().to_numpy() + games_before
+    wins_prior = grouped.cumsum().to_numpy() - wins + wins_before
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(games_prior > 0, wins_prior / games_prior, np.nan)
+
+
+@dataclass
+class WinState:
+    """Games played and won per team-season over every raw row through ``through``.
+
+    This is everything :func:`build_games_table` needs from past games, so a
+    nightly refresh only has to process the rows dated after ``through``.
+    """
+
+    records: pd.DataFrame  # TEAM_ABBREVIATION, SEASON, games, wins
+    through: pd.Timestamp
+
+
+def _team_season_totals(games: pd.DataFrame) -> pd.DataFrame:
+    return (
+        games.assign(win_flag=(games["WL"] == "W").astype(np.int64))
+        .groupby(["TEAM_ABBREVIATION", "SEASON"])
+        .agg(games=("win_flag", "size"), wins=("win_flag", "sum"))
+        .reset_index()
+    )
 
-    group_cols = ["TEAM_ABBREVIATION", "SEASON"]
-    games["games_prior"] = games.groupby(group_cols).cumcount()
-    games["wins_prior"] = games.groupby(group_cols)["win_flag"].cumsum() - games["win_flag"]
-    games["win_pct_prior"] = games["wins_prior"] / games["games_prior"].replace(0, pd.NA)
-    return games[["GAME_ID", "TEAM_ABBREVIATION", "win_pct_prior"]]
 
+def build_win_state(games: pd.DataFrame, through: Optional[pd.Timestamp] = None) -> WinState:
+    """Summarize raw team-game rows dated up to ``through`` (default: all of them)."""
 
-def load_games() -> pd.DataFrame:
-    games = pd.read_csv(RAW_GAMES)
-    abbrev_to_name: Dict[str, str] = (
-        games[["TEAM_ABBREVIATION", "TEAM_NAME"]]
-        .drop_duplicates()
-        .set_index("TEAM_ABBREVIATION")["TEAM_NAME"]
-        .to_dict()
-    )
+    game_date = _parse_dates(games["GAME_DATE"])
+    through = game_date.max() if through is None else through
+    return WinState(records=_team_season_totals(games[game_date <= through]), through=through)
 
-    win_pct_lookup = compute_win_pct(games)
-    home_win_pct = win_pct_lookup.rename(
-        columns={
-            "GAME_ID": "game_id",
-            "TEAM_ABBREVIATION": "home_abbr",
-            "win_pct_prior": "win_pct_home",
-        }
+
+def update_win_state(state: WinState, games: pd.DataFrame, through: pd.Timestamp) -> WinState:
+    """Fold newly processed raw rows (dated after ``state.through``) into the state."""
+
+    records = (
+        pd.concat([state.records, _team_season_totals(games)], ignore_index=True)
+        .groupby(["TEAM_ABBREVIATION", "SEASON"], as_index=False)[["games", "wins"]]
+        .sum()
     )
-    visitor_win_pct = win_pct_lookup.rename(
-        columns={
-            "GAME_ID": "game_id",
-            "TEAM_ABBREVIATION": "visitor_abbr",
-            "win_pct_prior": "win_pct_visitor",
-        }
+    return WinState(records=records, through=through)
+
+
+def save_win_state(state: WinState, path: Path = STATE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as handle:
+        pickle.dump(state, handle)
+    tmp.replace(path)
+
+
+def load_win_state(path: Path = STATE_PATH) -> Optional[WinState]:
+    if not path.exists():
+        return None
+    with path.open("rb") as handle:
+        return pickle.load(handle)
+
+
+def _parse_matchups(matchup: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """(is_home, opponent abbreviation) per row, parsing each distinct MATCHUP once."""
+
+    codes, uniques = pd.factorize(matchup)
+    table = pd.Series(uniques, dtype=object)
+    is_home = table.str.contains("vs.", regex=False).to_numpy(dtype=bool)
+    opponent = table.str.extract(r"vs\. (\w+)")[0].to_numpy(dtype=object)
+    # Missing matchups (code -1) land on the trailing sentinel.
+    return np.append(is_home, False)[codes], np.append(opponent, np.nan)[codes]
+
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """``pd.to_datetime`` applied once per distinct value and broadcast back."""
+
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object))
+    return pd.Series(parsed.to_numpy().take(codes), index=values.index).where(codes >= 0)
+
+
+def _date_order(games: pd.DataFrame) -> Tuple[np.ndarray, pd.Series]:
+    """The engine's only sort: team-game row positions by (game_date, GAME_ID)."""
+
+    game_date = _parse_dates(games["GAME_DATE"])
+    game_codes, _ = pd.factorize(games["GAME_ID"], sort=True)
+    return np.lexsort((game_codes, game_date.to_numpy())), game_date
+
+
+def build_games_table(
+    games: pd.DataFrame,
+    attendance: pd.DataFrame,
+    capacity: Optional[pd.DataFrame] = None,
+    prior: Optional[WinState] = None,
+) -> pd.DataFrame:
+    """Join raw team-game logs with prepared attendance and capacity in one pass.
+
+    Only the key columns are sorted, once, by date; prior win shares, the
+    visitor's row of each game, attendance and capacity are then all found
+    with integer-key lookups instead of string merges, and the wide stat
+    columns are gathered once for the home rows. Output is one row per home
+    game with attendance, in (game_date, game_id) order. With ``prior``,
+    ``games`` holds only rows after ``prior.through`` and win shares continue
+    from the carried totals.
+    """
+
+    order, game_date = _date_order(games)
+    abbr_codes, abbrs = pd.factorize(games["TEAM_ABBREVIATION"])
+    abbr_codes = abbr_codes[order]
+    season_codes = pd.factorize(games["SEASON"])[0][order]
+    game_codes = pd.factorize(games["GAME_ID"])[0][order]
+    wins = (games["WL"] == "W").to_numpy(dtype=np.int64)[order]
+    games_before = wins_before = 0
+    if prior is not None:
+        carried = prior.records.set_index(["TEAM_ABBREVIATION", "SEASON"])
+        rows = carried.index.get_indexer(
+            pd.MultiIndex.from_arrays([games["TEAM_ABBREVIATION"], games["SEASON"]])
+        )[order]
+        games_before = np.where(rows >= 0, carried["games"].to_numpy().take(rows), 0)
+        wins_before = np.where(rows >= 0, carried["wins"].to_numpy().take(rows), 0)
+    win_pct = _win_pct_prior(
+        abbr_codes.astype(np.int64) * (season_codes.max() + 2) + season_codes,
+        wins,
+        games_before,
+        wins_before,
     )
 
-    home_games = games[games["MATCHUP"].str.contains("vs.", regex=False)].copy()
-    home_games["home_abbr"] = home_games["TEAM_ABBREVIATION"]
-    home_games["home_team"] = home_games["TEAM_NAME"]
-    home_games["visitor_abbr"] = home_games["MATCHUP"].str.extract(r"vs\. (\w+)")
-    home_games["visitor_team"] = home_games["visitor_abbr"].map(abbrev_to_name)
-
-    home_games["game_date"] = pd.to_datetime(home_games["GAME_DATE"])
-    home_games["game_id"] = home_games["GAME_ID"]
-
-    home_games = home_games.merge(home_win_pct, on=["game_id", "home_abbr"], how="left")
-    home_games = home_games.merge(visitor_win_pct, on=["game_id", "visitor_abbr"], how="left")
-
-    stats_columns = [
-        "FGM",
-        "FGA",
-        "FG_PCT",
-        "FG3M",
-        "FG3A",
-        "FG3_PCT",
-        "FTM",
-        "FTA",
-        "FT_PCT",
-        "OREB",
-        "DREB",
-        "REB",
-        "AST",
-        "STL",
-        "BLK",
-        "TOV",
-        "PF",
-        "PTS",
-        "PLUS_MINUS",
-    ]
-
-    rename_map = {col: col.lower() for col in stats_columns}
-    rename_map.update(
-        {
-            "WL": "result",
-            "PTS": "home_pts",
-            "TEAM_ID": "team_id",
-            "TEAM_ABBREVIATION": "team_abbreviation",
-            "TEAM_NAME": "team_name",
-            "SEASON_ID": "season_id",
-            "SEASON": "season",
-        }
+    is_home, opponent = _parse_matchups(games["MATCHUP"])
+    home_rows = np.flatnonzero(is_home[order])
+    n_abbrs = len(abbrs) + 1
+    team_keys = game_codes.astype(np.int64) * n_abbrs + abbr_codes
+    visitor_abbrs = opponent[order[home_rows]]
+    visitor_codes = pd.Index(abbrs).get_indexer(visitor_abbrs)
+    visitor_keys = game_codes[home_rows].astype(np.int64) * n_abbrs + visitor_codes
+    visitor_rows = np.where(visitor_codes >= 0, _lookup(team_keys, visitor_keys), -1)
+
+    pairs = games[["TEAM_ABBREVIATION", "TEAM_NAME"]].drop_duplicates()
+    abbrev_to_name: Dict[str, str] = dict(zip(pairs["TEAM_ABBREVIATION"], pairs["TEAM_NAME"]))
+
+    home = games.iloc[order[home_rows]].rename(columns=RENAME_MAP).reset_index(drop=True)
+    home["game_id"] = home["GAME_ID"]
+    home["game_date"] = game_date.to_numpy()[order[home_rows]]
+    home["home_team"] = home["team_name"]
+    home["visitor_team"] = pd.Series(visitor_abbrs, dtype=object).map(abbrev_to_name)
+    home["win_pct_home"] = win_pct[home_rows]
+    home["win_pct_visitor"] = np.where(
+        visitor_rows >= 0, win_pct[visitor_rows.clip(min=0)], np.nan
     )
+    home = home[GAME_COLUMNS]
+
+    # Attendance join on one integer key built from shared date and team vocabularies.
+    attendance = attendance.dropna(subset=["attendance"]).reset_index(drop=True)
+    n_home, n_att = len(home), len(attendance)
+    date_codes, _ = pd.factorize(pd.concat([home["game_date"], attendance["game_date"]]))
+    team_codes, teams = pd.factorize(
+        pd.concat(
+            [home["home_team"], home["visitor_team"], attendance["home_team"], attendance["visitor_team"]]
+        )
+    )
+    home_team_codes = np.concatenate([team_codes[:n_home], team_codes[2 * n_home : 2 * n_home + n_att]])
+    visitor_team_codes = np.concatenate([team_codes[n_home : 2 * n_home], team_codes[2 * n_home + n_att :]])
+    keys = (date_codes.astype(np.int64) * len(teams) + home_team_codes) * len(teams) + visitor_team_codes
+    keys[(date_codes < 0) | (home_team_codes < 0) | (visitor_team_codes < 0)] = -1
+    home_keys, attendance_keys = keys[:n_home], keys[n_home:]
+    valid = np.flatnonzero(attendance_keys >= 0)
+    matched = _lookup(attendance_keys[valid], home_keys)
+    keep = np.flatnonzero((home_keys >= 0) & (matched >= 0))
+    att_rows = valid[matched[keep]]
+
+    merged = home.iloc[keep].reset_index(drop=True)
+    for column in ATTENDANCE_COLUMNS:
+        merged[column] = attendance[column].iloc[att_rows].to_numpy()
+    merged["attendance"] = merged["attendance"].astype(pd.Int64Dtype())
+    merged = merged.drop_duplicates("game_id", keep="first").reset_index(drop=True)
+
+    if capacity is not None and not capacity.empty:
+        by_team = capacity.drop_duplicates("home_team").set_index("home_team")["arena_capacity"]
+        merged["capacity"] = merged["home_team"].map(by_team).astype("Int64")
+    else:
+        merged["capacity"] = pd.NA
+
+    merged["ticket_price"] = merged["home_team"].map(AVERAGE_TICKET_PRICE).fillna(100)
+    return merged
+
 
-    home_games = home_games.rename(columns=rename_map)
-
-    keep_cols = [
-        "game_id",
-        "game_date",
-        "home_team",
-        "visitor_team",
-        "season_id",
-        "season",
-        "team_id",
-        "team_abbreviation",
-        "team_name",
-        "result",
-        "fgm",
-        "fga",
-        "fg_pct",
-        "fg3m",
-        "fg3a",
-        "fg3_pct",
-        "ftm",
-        "fta",
-        "ft_pct",
-        "oreb",
-        "dreb",
-        "reb",
-        "ast",
-        "stl",
-        "blk",
-        "tov",
-        "pf",
-        "home_pts",
-        "plus_minus",
-        "win_pct_home",
-        "win_pct_visitor",
-    ]
-
-    return home_games[keep_cols]
-
-
-def load_attendance() -> pd.DataFrame:
-    df = pd.read_csv(RAW_ATTENDANCE)
+def load_games(path: Path = RAW_GAMES) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+def load_attendance(path: Path = RAW_ATTENDANCE) -> pd.DataFrame:
+    return prepare_attendance(pd.read_csv(path))
+
+
+def prepare_attendance(df: pd.DataFrame) -> pd.DataFrame:
     df = df.rename(
         columns={
             "Date": "game_date",
@@ -163,7 +331,7 @@ def load_attendance() -> pd.DataFrame:
             "Arena": "arena",
         }
     )
-    df["game_date"] = pd.to_datetime(df["game_date"])
+    df["game_date"] = _parse_dates(df["game_date"])
     cleaned_attendance = (
         df["attendance"]
         .astype(str)
@@ -192,11 +360,11 @@ def load_attendance() -> pd.DataFrame:
     return df
 
 
-def load_capacity() -> pd.DataFrame:
-    if not RAW_CAPACITY.exists():
+def load_capacity(path: Path = RAW_CAPACITY) -> pd.DataFrame:
+    if not path.exists():
         return pd.DataFrame(columns=["home_team", "arena_capacity", "arena_name_capacity"])
 
-    df = pd.read_csv(RAW_CAPACITY)
+    df = pd.read_csv(path)
     df["home_team"] = df["home_team"].str.strip()
     df["arena_capacity"] = pd.to_numeric(df["capacity"], errors="coerce").astype("Int64")
     df["arena_name_capacity"] = df["arena"].str.strip()
@@ -204,38 +372,140 @@ def load_capacity() -> pd.DataFrame:
 
 
 def build_dataset() -> pd.DataFrame:
+    return build_games_table(load_games(), load_attendance(), load_capacity())
+
+
+def _complete_cutoff(
+    games: pd.DataFrame, game_date: pd.Series, attendance: pd.DataFrame
+) -> Optional[pd.Timestamp]:
+    """Latest game date both feeds fully cover, or None if none is covered yet.
+
+    The newest attendance night may be only partly loaded; it is held back for
+    a later run unless every home game scheduled that night has attendance.
+    """
+
+    reported = attendance.dropna(subset=["attendance"])
+    if games.empty or reported.empty:
+        return None
+    last_attendance = reported["game_date"].max()
+    cutoff = min(game_date.max(), last_attendance)
+    if cutoff < last_attendance:
+        return cutoff
+    night = (game_date == cutoff).to_numpy()
+    is_home, _ = _parse_matchups(games["MATCHUP"][night])
+    scheduled = games["GAME_ID"][night][is_home].nunique()
+    if int((reported["game_date"] == cutoff).sum()) >= scheduled:
+        return cutoff
+    earlier = game_date[game_date < cutoff]
+    return earlier.max() if len(earlier) else None
+
+
+def _full_build(output: Path, state_path: Path) -> int:
+    """Rebuild ``output`` from every raw row the feeds cover and save the win state.
+
+    The state ends at the last ``game_date`` written rather than the last raw
+    game, so games still waiting for attendance are read by the next
+    incremental run instead of being skipped for good.
+    """
+
     games = load_games()
     attendance = load_attendance()
-
-    merged = games.merge(
-        attendance,
-        on=["game_date", "home_team", "visitor_team"],
-        how="left",
-        suffixes=("", "_att"),
+    game_date = _parse_dates(games["GAME_DATE"])
+    cutoff = _complete_cutoff(games, game_date, attendance)
+    if cutoff is None:
+        dataset = build_games_table(games.iloc[:0], attendance.iloc[:0], load_capacity())
+    else:
+        dataset = build_games_table(
+            games[game_date <= cutoff],
+            attendance[attendance["game_date"] <= cutoff],
+            load_capacity(),
+        )
+    _write(dataset, output, append=False)
+    high_water = _processed_high_water(output)
+    if high_water is None:
+        # Nothing written yet: the next incremental run bootstraps from scratch.
+        state_path.unlink(missing_ok=True)
+    else:
+        save_win_state(build_win_state(games, through=high_water), state_path)
+    return len(dataset)
+
+
+def _processed_high_water(output: Path) -> Optional[pd.Timestamp]:
+    if not output.exists():
+        return None
+    dates = pd.to_datetime(pd.read_csv(output, usecols=["game_date"])["game_date"])
+    return dates.max() if len(dates) else None
+
+
+def update_dataset(output: Path = OUTPUT, state_path: Path = STATE_PATH) -> int:
+    """Append games dated after the processed high-water mark; returns rows added.
+
+    Only raw rows after the saved :class:`WinState` are processed, so the
+    compute of a nightly refresh is O(new games). The raw games and
+    attendance files are still scanned in full to find those rows (the
+    collectors rewrite them whole, so no byte offset stays valid between
+    runs); only the processed file is appended to. Raw games are held back
+    until attendance covers every game on their date, then picked up by a
+    later run. Without a saved state, one is rebuilt from the raw rows up to the
+    processed file's last ``game_date``; without a processed file, this is a
+    full build.
+    """
+
+    state = load_win_state(state_path)
+    if state is None:
+        high_water = _processed_high_water(output)
+        if high_water is None:
+            return _full_build(output, state_path)
+        state = build_win_state(load_games(), through=high_water)
+
+    games = io.load_table(
+        RAW_GAMES, filters=[("GAME_DATE", ">", state.through.strftime("%Y-%m-%d"))]
     )
+    attendance = load_attendance()
+    attendance = attendance[attendance["game_date"] > state.through]
+    game_date = _parse_dates(games["GAME_DATE"])
+    cutoff = _complete_cutoff(games, game_date, attendance)
+    if cutoff is None:
+        save_win_state(state, state_path)
+        return 0
+
+    games = games[game_date <= cutoff]
+    table = build_games_table(
+        games,
+        attendance[attendance["game_date"] <= cutoff],
+        load_capacity(),
+        prior=state,
+    )
+    _write(table, output, append=output.exists())
+    save_win_state(update_win_state(state, games, through=cutoff), state_path)
+    return len(table)
 
-    merged = merged.dropna(subset=["attendance"])
-    merged = merged.sort_values("game_date").drop_duplicates("game_id", keep="first")
 
-    capacity = load_capacity()
-    if not capacity.empty:
-        merged = merged.merge(capacity, on="home_team", how="left")
-        merged["capacity"] = merged["arena_capacity"]
-        merged = merged.drop(columns=["arena_capacity", "arena_name_capacity"], errors="ignore")
+def _write(dataset: pd.DataFrame, output: Path, *, append: bool) -> None:
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if append:
+        header = list(pd.read_csv(output, nrows=0).columns)
+        dataset.reindex(columns=header).to_csv(output, mode="a", header=False, index=False)
     else:
-        merged["capacity"] = pd.NA
+        dataset.to_csv(output, index=False)
 
-    merged["ticket_price"] = merged["home_team"].map(AVERAGE_TICKET_PRICE).fillna(100)
 
-    ordered = merged.sort_values("game_date").reset_index(drop=True)
-    return ordered
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process raw games newer than the existing processed file and append them.",
+    )
+    args = parser.parse_args()
 
+    if args.incremental:
+        added = update_dataset()
+        print(f"Appended {added:,} rows to {OUTPUT}")
+        return
 
-def main() -> None:
-    dataset = build_dataset()
-    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    dataset.to_csv(OUTPUT, index=False)
-    print(f"Saved {len(dataset):,} rows to {OUTPUT}")
+    rows = _full_build(OUTPUT, STATE_PATH)
+    print(f"Saved {rows:,} rows to {OUTPUT}")
 
 
 if __name__ == "__main__":
@@ -3,49 +3,111 @@
 from __future__ import annotations
 
 import argparse
-from io import StringIO
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import requests
 import time
 
+from fansight.config import DEFAULT_CONFIG
+from fansight.utils.fetching import (
+    CheckpointStore,
+    FetchUnit,
+    TokenBucket,
+    merge_frames,
+    run_fetch_units,
+)
+from fansight.utils.http_cache import ResponseCache
+from fansight.utils.schedule_parser import PARSER_VERSION, parse_schedule_table
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+HOME_URL = "https://www.basketball-reference.com/"
 BASE_URL = "https://www.basketball-reference.com/leagues/NBA_{season}_games-{month}.html"
 MONTHS = ["october", "november", "december", "january", "february", "march", "april", "may", "june"]
+CHECKPOINT_DIR = DEFAULT_CONFIG.paths.cache / "fetch" / "bref_attendance"
+RESPONSE_CACHE_DIR = DEFAULT_CONFIG.paths.cache / "http" / "bref"
+DEFAULT_SLEEP = 2.0
+DEFAULT_WORKERS = 3
+# Parsed tables are stored under a versioned slot so a parser change reparses.
+SCHEDULE_SLOT = f"schedule-v{PARSER_VERSION}"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36",
+    "Referer": "https://www.basketball-reference.com/",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def build_session(home_url: Optional[str] = HOME_URL) -> requests.Session:
+    """Create a browser-like session, warming it up on the home page if given."""
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    if home_url:
+        session.get(home_url, timeout=30)
+    return session
+
+
+def current_season_end_year(today: Optional[date] = None) -> int:
+    """Season end year of the season in progress (seasons start in the autumn)."""
+
+    today = today or date.today()
+    return today.year + 1 if today.month >= 8 else today.year
+
+
+def season_closed_at(season_end_year: int) -> float:
+    """Timestamp after which a season's pages no longer change (playoffs end in June)."""
 
+    return datetime(season_end_year, 7, 1).timestamp()
 
-def fetch_month(season_end_year: int, month: str, session: requests.Session, retries: int = 5) -> pd.DataFrame | None:
-    url = BASE_URL.format(season=season_end_year, month=month)
+
+def fetched_before_close(fetched_at: Optional[float], season_end_year: int) -> bool:
+    """Whether a page stored at ``fetched_at`` may predate its season's final results."""
+
+    closed_at = season_closed_at(season_end_year)
+    return fetched_at is not None and fetched_at < closed_at <= time.time()
+
+
+def _get(
+    session: requests.Session,
+    url: str,
+    headers: Dict[str, str],
+    retries: int,
+    limiter: Optional[TokenBucket],
+) -> requests.Response:
     for attempt in range(retries):
-        resp = session.get(url, timeout=30)
-        if resp.status_code == 404:
-            return None
+        if limiter is not None:
+            limiter.acquire()
+        resp = session.get(url, timeout=30, headers=headers)
         if resp.status_code == 429:
             wait = 5 * (attempt + 1)
             print(f"Rate limited on {url}. Sleeping {wait}s before retry.")
             time.sleep(wait)
             continue
-        resp.raise_for_status()
-        break
-    else:
-        raise RuntimeError(f"Failed to fetch {url} after {retries} attempts.")
-    tables = pd.read_html(StringIO(resp.text))
-    if not tables:
+        return resp
+    raise RuntimeError(f"Failed to fetch {url} after {retries} attempts.")
+
+
+def parse_schedule(html: str, season_end_year: int, month: str) -> pd.DataFrame | None:
+    """Turn one schedule page into the collector's column layout."""
+
+    df = parse_schedule_table(html)
+    if df is None:
         return None
-    df = tables[0]
-    df = df.dropna(subset=["Visitor/Neutral"])
-    df["Season"] = f"{season_end_year-1}-{str(season_end_year)[-2:]}"
-    df["Month"] = month.title()
-    df.rename(
+    df.insert(0, "Season", f"{season_end_year-1}-{str(season_end_year)[-2:]}")
+    df.insert(1, "Month", month.title())
+    df = df.rename(
         columns={
             "Visitor/Neutral": "visitor_team",
             "Home/Neutral": "home_team",
             "Start (ET)": "start_et",
             "Attend.": "attendance",
-        },
-        inplace=True,
+        }
     )
     return df[
         [
@@ -61,22 +123,234 @@ def fetch_month(season_end_year: int, month: str, session: requests.Session, ret
     ]
 
 
-def fetch_schedule(season_end_year: int, session: requests.Session) -> pd.DataFrame:
+def _parse_page(page: Tuple[str, int, str]) -> pd.DataFrame | None:
+    return parse_schedule(*page)
+
+
+def parse_pages(
+    pages: Sequence[Tuple[str, int, str]],
+    *,
+    workers: int = 1,
+) -> List[pd.DataFrame | None]:
+    """Parse ``(html, season_end_year, month)`` pages, in a process pool when ``workers > 1``."""
+
+    if workers <= 1 or len(pages) < 2:
+        return [_parse_page(page) for page in pages]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_page, pages, chunksize=max(1, len(pages) // (workers * 4))))
+
+
+def fetch_month(
+    season_end_year: int,
+    month: str,
+    session: requests.Session,
+    retries: int = 5,
+    *,
+    base_url: str = BASE_URL,
+    limiter: Optional[TokenBucket] = None,
+    cache: Optional[ResponseCache] = None,
+    revalidate: bool = True,
+) -> pd.DataFrame | None:
+    """Fetch and parse one schedule page.
+
+    With a ``cache``, pages of finished seasons (``revalidate=False``) are
+    served from disk without any request unless they were stored before the
+    season closed; other pages are revalidated with a conditional GET, and the
+    parsed table is stored next to the body so an unchanged page is never
+    parsed twice.
+    """
+
+    url = base_url.format(season=season_end_year, month=month)
+    if cache is None:
+        resp = _get(session, url, {}, retries, limiter)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        return parse_schedule(resp.text, season_end_year, month)
+
+    if not revalidate:
+        stored = cache.get(url)
+        revalidate = stored is not None and fetched_before_close(stored.fetched_at, season_end_year)
+    entry = cache.fetch(
+        url,
+        lambda headers: _get(session, url, headers, retries, limiter),
+        revalidate=revalidate,
+    )
+    if entry.status_code == 404:
+        return None
+    if SCHEDULE_SLOT not in entry.parsed:
+        entry.parsed = {SCHEDULE_SLOT: parse_schedule(entry.text, season_end_year, month)}
+        cache.put(entry)
+    return entry.parsed[SCHEDULE_SLOT]
+
+
+def fetch_schedule(
+    season_end_year: int,
+    session: requests.Session,
+    *,
+    base_url: str = BASE_URL,
+    limiter: Optional[TokenBucket] = None,
+    cache: Optional[ResponseCache] = None,
+) -> pd.DataFrame:
     frames: List[pd.DataFrame] = []
+    revalidate = season_end_year >= current_season_end_year()
     for month in MONTHS:
-        data = fetch_month(season_end_year, month, session)
+        data = fetch_month(
+            season_end_year,
+            month,
+            session,
+            base_url=base_url,
+            limiter=limiter,
+            cache=cache,
+            revalidate=revalidate,
+        )
         if data is not None:
             frames.append(data)
-            time.sleep(2.0)
+            if limiter is None:
+                time.sleep(DEFAULT_SLEEP)
     if not frames:
         raise RuntimeError(f"No data fetched for season ending {season_end_year}")
     return pd.concat(frames, ignore_index=True)
 
 
+def fetch_seasons(
+    seasons: List[int],
+    *,
+    base_url: str = BASE_URL,
+    session_factory: Callable[[], requests.Session] = build_session,
+    sleep: float = DEFAULT_SLEEP,
+    workers: int = DEFAULT_WORKERS,
+    checkpoint_dir: Path = CHECKPOINT_DIR,
+    cache_dir: Optional[Path] = RESPONSE_CACHE_DIR,
+    current_season: Optional[int] = None,
+) -> pd.DataFrame:
+    """Fetch every (season, month) page concurrently, resuming from checkpoints.
+
+    Requests from all workers share one token bucket (one request per
+    ``sleep`` seconds); each worker thread keeps its own session. Months of
+    ``current_season`` and later, and months checkpointed before their season
+    closed, are refetched through the response cache's conditional GETs, so
+    refreshing them costs a 304 per unchanged page.
+    """
+
+    current_season = current_season or current_season_end_year()
+    cache = ResponseCache(cache_dir) if cache_dir is not None else None
+
+    limiter = TokenBucket(rate=1.0 / sleep) if sleep > 0 else None
+    local = threading.local()
+
+    def session() -> requests.Session:
+        if not hasattr(local, "session"):
+            local.session = session_factory()
+        return local.session
+
+    def unit(season: int, month: str) -> FetchUnit:
+        def fetch() -> Optional[pd.DataFrame]:
+            return fetch_month(
+                season,
+                month,
+                session(),
+                base_url=base_url,
+                limiter=limiter,
+                cache=cache,
+                revalidate=season >= current_season,
+            )
+
+        return FetchUnit(key=f"{season}-{month}", fetch=fetch)
+
+    checkpoints = CheckpointStore(checkpoint_dir)
+    refresh = [
+        f"{season}-{month}"
+        for season in seasons
+        for month in MONTHS
+        if season >= current_season
+        or fetched_before_close(checkpoints.saved_at(f"{season}-{month}"), season)
+    ]
+    results = run_fetch_units(
+        [unit(season, month) for season in seasons for month in MONTHS],
+        checkpoints,
+        workers=workers,
+        refresh=refresh,
+    )
+    if cache is not None:
+        logging.getLogger(__name__).info("Response cache: %s", cache.report())
+    for season in seasons:
+        if all(results[f"{season}-{month}"] is None for month in MONTHS):
+            raise RuntimeError(f"No data fetched for season ending {season}")
+    return merge_frames(list(results.values()))
+
+
+def parse_cached_seasons(
+    seasons: List[int],
+    *,
+    base_url: str = BASE_URL,
+    cache_dir: Path = RESPONSE_CACHE_DIR,
+    workers: int = 1,
+) -> pd.DataFrame:
+    """Rebuild the attendance table from cached pages only, without any request."""
+
+    cache = ResponseCache(cache_dir)
+    pages = []
+    for season in seasons:
+        for month in MONTHS:
+            entry = cache.get(base_url.format(season=season, month=month))
+            if entry is None:
+                logging.getLogger(__name__).warning("No cached page for %s-%s.", season, month)
+            elif entry.status_code == 200:
+                pages.append((entry.text, season, month))
+    return merge_frames(parse_pages(pages, workers=workers))
+
+
+def _save(compiled: pd.DataFrame, output: Path) -> None:
+    compiled["attendance"] = pd.to_numeric(compiled["attendance"], errors="coerce").astype("Int64")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    compiled.to_csv(output, index=False)
+    print(f"Saved {len(compiled):,} rows to {output}")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Download attendance by game from Basketball-Reference.")
     parser.add_argument("--start", type=int, default=2019, help="First season end year (e.g., 2019 for 2018-19).")
     parser.add_argument("--end", type=int, default=2025, help="Last season end year (non-inclusive).")
+    parser.add_argument("--sleep", type=float, default=DEFAULT_SLEEP, help="Minimum seconds between requests.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent page downloads.")
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help="Schedule page template with {season} and {month} placeholders (e.g. a local stand-in server).",
+    )
+    parser.add_argument("--home-url", default=HOME_URL, help="Page used to warm up sessions; empty to skip.")
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=CHECKPOINT_DIR,
+        help="Where finished months are stored so reruns skip them.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=RESPONSE_CACHE_DIR,
+        help="On-disk response cache; finished seasons are served from here.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache.")
+    parser.add_argument(
+        "--current-season",
+        type=int,
+        default=None,
+        help="Season end year still in progress (revalidated on every run); defaults to today's season.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Rebuild the CSV from the response cache without network access.",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=1,
+        help="Processes used to parse cached pages with --offline.",
+    )
+    parser.add_argument("--fresh", action="store_true", help="Ignore existing checkpoints.")
     parser.add_argument(
         "--output",
         type=Path,
@@ -84,27 +358,31 @@ def main() -> None:
         help="Where to save the compiled CSV.",
     )
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    frames: List[pd.DataFrame] = []
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36",
-            "Referer": "https://www.basketball-reference.com/",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-    )
-    session.get("https://www.basketball-reference.com/", timeout=30)
-    for season in range(args.start, args.end):
-        print(f"Fetching season ending {season}…")
-        frames.append(fetch_schedule(season, session))
+    if args.offline:
+        compiled = parse_cached_seasons(
+            list(range(args.start, args.end)),
+            base_url=args.base_url,
+            cache_dir=args.cache_dir,
+            workers=args.parse_workers,
+        )
+        _save(compiled, args.output)
+        return
 
-    compiled = pd.concat(frames, ignore_index=True)
-    compiled["attendance"] = pd.to_numeric(compiled["attendance"], errors="coerce").astype("Int64")
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    compiled.to_csv(args.output, index=False)
-    print(f"Saved {len(compiled):,} rows to {args.output}")
+    if args.fresh:
+        CheckpointStore(args.checkpoint_dir).clear()
+    compiled = fetch_seasons(
+        list(range(args.start, args.end)),
+        base_url=args.base_url,
+        session_factory=lambda: build_session(args.home_url or None),
+        sleep=args.sleep,
+        workers=args.workers,
+        checkpoint_dir=args.checkpoint_dir,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        current_season=args.current_season,
+    )
+    _save(compiled, args.output)
 
 
 if __name__ == "__main__":
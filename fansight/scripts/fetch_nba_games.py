@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import argparse
-import time
+import logging
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional
 
 import pandas as pd
 from nba_api.stats.endpoints import leaguegamelog
 
+from fansight.config import DEFAULT_CONFIG
+from fansight.utils.fetching import (
+    CheckpointStore,
+    FetchUnit,
+    TokenBucket,
+    merge_frames,
+    run_fetch_units,
+)
+
 DEFAULT_SLEEP = 1.2  # seconds between API calls to avoid rate limiting
+DEFAULT_WORKERS = 2
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CHECKPOINT_DIR = DEFAULT_CONFIG.paths.cache / "fetch" / "nba_games"
 
 
 def season_strings(start: int, end: int) -> List[str]:
@@ -25,19 +36,51 @@ def season_strings(start: int, end: int) -> List[str]:
     return seasons
 
 
-def fetch_season(season: str, timeout: int = 30) -> pd.DataFrame:
-    """Call the NBA API for a single season."""
+def fetch_season(
+    season: str,
+    timeout: int = 30,
+    endpoint: Callable[..., object] = leaguegamelog.LeagueGameLog,
+) -> pd.DataFrame:
+    """Call the NBA API (or a stand-in with the same interface) for a single season."""
 
-    endpoint = leaguegamelog.LeagueGameLog(
+    response = endpoint(
         season=season,
         timeout=timeout,
         season_type_all_star="Regular Season",
     )
-    df = endpoint.get_data_frames()[0]
+    df = response.get_data_frames()[0]
     df["SEASON"] = season
     return df
 
 
+def fetch_seasons(
+    seasons: List[str],
+    *,
+    sleep: float = DEFAULT_SLEEP,
+    workers: int = DEFAULT_WORKERS,
+    checkpoint_dir: Path = CHECKPOINT_DIR,
+    endpoint: Callable[..., object] = leaguegamelog.LeagueGameLog,
+) -> pd.DataFrame:
+    """Fetch seasons concurrently at most one call per ``sleep`` seconds, resuming from checkpoints."""
+
+    limiter = TokenBucket(rate=1.0 / sleep) if sleep > 0 else None
+
+    def unit(season: str) -> FetchUnit:
+        def fetch() -> Optional[pd.DataFrame]:
+            if limiter is not None:
+                limiter.acquire()
+            return fetch_season(season, endpoint=endpoint)
+
+        return FetchUnit(key=season, fetch=fetch)
+
+    results = run_fetch_units(
+        [unit(season) for season in seasons],
+        CheckpointStore(checkpoint_dir),
+        workers=workers,
+    )
+    return merge_frames(list(results.values()))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Download NBA game logs and save them to data/raw/.")
     parser.add_argument("--start", type=int, default=2018, help="First season start year (e.g., 2018 for 2018-19).")
@@ -46,8 +89,16 @@ def main() -> None:
         "--sleep",
         type=float,
         default=DEFAULT_SLEEP,
-        help="Seconds to sleep between API calls to stay under rate limits.",
+        help="Minimum seconds between API calls (across all workers) to stay under rate limits.",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent season downloads.")
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=CHECKPOINT_DIR,
+        help="Where finished seasons are stored so reruns skip them.",
     )
+    parser.add_argument("--fresh", action="store_true", help="Ignore existing checkpoints.")
     parser.add_argument(
         "--output",
         type=Path,
@@ -55,15 +106,16 @@ def main() -> None:
         help="Where to save the compiled CSV.",
     )
     args = parser.parse_args()
-
-    frames = []
-    for season in season_strings(args.start, args.end):
-        print(f"Fetching {season}…")
-        df = fetch_season(season)
-        frames.append(df)
-        time.sleep(args.sleep)
-
-    compiled = pd.concat(frames, ignore_index=True)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.fresh:
+        CheckpointStore(args.checkpoint_dir).clear()
+    compiled = fetch_seasons(
+        season_strings(args.start, args.end),
+        sleep=args.sleep,
+        workers=args.workers,
+        checkpoint_dir=args.checkpoint_dir,
+    )
     args.output.parent.mkdir(parents=True, exist_ok=True)
     compiled.to_csv(args.output, index=False)
     print(f"Saved {len(compiled):,} rows to {args.output}")
@@ -0,0 +1,410 @@
+"""Asyncio HTTP/JSON endpoint that serves attendance predictions with micro-batching.
+
+Run with ``python -m fansight.serving --model fansight_artifacts/attendance_model.joblib``.
+
+Endpoints:
+
+- ``POST /predict`` with a JSON record or ``{"records": [...]}``; returns
+  ``{"predictions": [...]}`` in request order.
+- ``GET /health`` and ``GET /stats`` (batching counters).
+
+Records arriving while a batch is being scored are queued and coalesced into
+a single ``AttendanceForecaster.score_records`` call, so the per-call overhead
+of walking the trees is shared by every request in the batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fansight.config import DEFAULT_CONFIG, ProjectConfig
+from fansight.models.forecasting import AttendanceForecaster
+from fansight.models.registry import ModelRegistry
+
+LOGGER = logging.getLogger(__name__)
+
+Records = List[Mapping[str, Any]]
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class RequestError(Exception):
+    """A client error reported back as an HTTP status and JSON message."""
+
+    def __init__(self, status: int, message: str, *, close: bool = False) -> None:
+        super().__init__(message)
+        self.status = status
+        # The connection can't be reused once the request framing is unknown.
+        self.close = close
+
+
+@dataclass
+class BatchStats:
+    requests: int = 0
+    records: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = asdict(self)
+        stats["mean_batch"] = round(self.records / self.batches, 2) if self.batches else 0.0
+        return stats
+
+
+def forecaster_scorer(model: AttendanceForecaster) -> Callable[[Records], Sequence[float]]:
+    """Score a batch with the forecaster's compiled arrays (no DataFrame per batch)."""
+
+    def score(records: Records) -> Sequence[float]:
+        return model.score_records(records).tolist()
+
+    return score
+
+
+# Raw fields behind the derived features in ``add_behavioral_features``.
+_DERIVED_INPUTS = (
+    "attendance",
+    "capacity",
+    "lifetime_value",
+    "loyalty_score",
+    "avg_spend",
+    "ticket_price",
+    "price_sensitivity",
+)
+
+
+def record_coercer(config: ProjectConfig = DEFAULT_CONFIG) -> Callable[[Records], Records]:
+    """Check and coerce request records against the model's feature config.
+
+    Numeric fields must be numbers, numeric strings or null and become
+    floats; categorical fields must be scalars. Anything else is a 400, raised
+    before the request joins a batch, so it cannot fail other clients' records.
+    """
+
+    numeric = set(config.features.numerical) | set(_DERIVED_INPUTS)
+    categorical = set(config.features.categorical)
+
+    def coerce(records: Records) -> Records:
+        coerced = []
+        for i, record in enumerate(records):
+            row = dict(record)
+            for column in numeric.intersection(row):
+                value = row[column]
+                if value is None:
+                    continue
+                try:
+                    if isinstance(value, (dict, list)):
+                        raise TypeError
+                    row[column] = float(value)
+                except (TypeError, ValueError):
+                    raise RequestError(
+                        400, f"records[{i}].{column}: expected a number, got {value!r}."
+                    ) from None
+            for column in categorical.intersection(row):
+                if isinstance(row[column], (dict, list)):
+                    raise RequestError(
+                        400, f"records[{i}].{column}: expected a string or number, got {row[column]!r}."
+                    )
+            coerced.append(row)
+        return coerced
+
+    return coerce
+
+
+@dataclass
+class MicroBatcher:
+    """Coalesces concurrent ``submit`` calls into batched ``score`` calls.
+
+    A batch is dispatched once it holds ``max_batch_size`` records or
+    ``max_wait`` seconds after its first request, whichever comes first.
+    Scoring runs on a single background thread so the event loop keeps
+    accepting requests (and filling the next batch) meanwhile. A request
+    larger than ``max_batch_size`` is scored as one batch on its own. If a
+    coalesced batch fails, its requests are rescored one by one so only the
+    offending request sees the error.
+    """
+
+    score: Callable[[Records], Sequence[float]]
+    max_batch_size: int = 256
+    max_wait: float = 0.001
+    stats: BatchStats = field(default_factory=BatchStats)
+    _queue: Optional[asyncio.Queue] = field(default=None, init=False, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fansight-score")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def submit(self, records: Records) -> List[float]:
+        if self._queue is None:
+            raise RuntimeError("MicroBatcher.start must be awaited before submit.")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((records, future))
+        self.stats.requests += 1
+        return await future
+
+    async def _collect(self) -> List[Tuple[Records, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        batch = [first]
+        size = len(first[0])
+        deadline = loop.time() + self.max_wait
+        while size < self.max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            if size + len(item[0]) > self.max_batch_size:
+                # Too big to join this batch; it starts the next one.
+                self._queue.put_nowait(item)
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            records = [record for request, _ in batch for record in request]
+            self.stats.batches += 1
+            self.stats.records += len(records)
+            self.stats.largest_batch = max(self.stats.largest_batch, len(records))
+            try:
+                predictions = await loop.run_in_executor(self._executor, self.score, records)
+            except Exception as exc:  # noqa: BLE001 - isolated per request below
+                if len(batch) == 1:
+                    self._resolve(batch[0][1], exc)
+                    continue
+                LOGGER.warning("Batch of %d requests failed (%s); rescoring them one by one.", len(batch), exc)
+                for request, future in batch:
+                    try:
+                        result = await loop.run_in_executor(self._executor, self.score, request)
+                    except Exception as request_exc:  # noqa: BLE001 - surfaced to this request only
+                        self._resolve(future, request_exc)
+                    else:
+                        self._resolve(future, [float(p) for p in result])
+                continue
+            start = 0
+            for request, future in batch:
+                self._resolve(future, [float(p) for p in predictions[start : start + len(request)]])
+                start += len(request)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, outcome: Any) -> None:
+        if future.done():
+            return
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+
+def _parse_records(body: bytes) -> Records:
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise RequestError(400, f"Invalid JSON: {exc}") from None
+    if isinstance(payload, dict) and "records" in payload:
+        payload = payload["records"]
+    records = [payload] if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+        raise RequestError(400, "Expected a JSON object or a non-empty list of objects under 'records'.")
+    return records
+
+
+@dataclass
+class ScoringServer:
+    """HTTP/1.1 front end (keep-alive, JSON bodies) over a :class:`MicroBatcher`."""
+
+    batcher: MicroBatcher
+    max_body_bytes: int = 8 * 1024**2
+    # Validates parsed records before they are queued (see record_coercer).
+    coerce: Optional[Callable[[Records], Records]] = None
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise RequestError(400, "Malformed request line.", close=True) from None
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            raise RequestError(400, "Invalid Content-Length.", close=True) from None
+        if length > self.max_body_bytes:
+            raise RequestError(413, f"Body exceeds {self.max_body_bytes} bytes.", close=True)
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0], headers, body
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Dict[str, Any]:
+        if path == "/predict":
+            if method != "POST":
+                raise RequestError(405, "Use POST /predict.")
+            records = _parse_records(body)
+            if self.coerce is not None:
+                records = self.coerce(records)
+            return {"predictions": await self.batcher.submit(records)}
+        if path == "/health":
+            return {"status": "ok"}
+        if path == "/stats":
+            return self.batcher.stats.as_dict()
+        raise RequestError(404, f"No route for {path}.")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                keep_alive = True
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    status, payload = 200, await self._dispatch(method, path, body)
+                except RequestError as exc:
+                    status, payload = exc.status, {"error": str(exc)}
+                    keep_alive = keep_alive and not exc.close
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception as exc:  # noqa: BLE001 - one bad batch must not kill the server
+                    LOGGER.exception("Scoring request failed")
+                    status, payload = 500, {"error": str(exc)}
+                data = json.dumps(payload).encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode()
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        await self.batcher.start()
+        server = await asyncio.start_server(self.handle, host, port)
+        LOGGER.info("Serving predictions on http://%s:%d", host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+
+def build_server(
+    model: AttendanceForecaster,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+) -> ScoringServer:
+    """Wire a fitted forecaster to a server using ``config.serving`` batching limits.
+
+    Records are validated against the features the model was trained with.
+    """
+
+    settings = config.serving
+    batcher = MicroBatcher(
+        forecaster_scorer(model),
+        max_batch_size=settings.max_batch_size,
+        max_wait=settings.max_wait_ms / 1000,
+    )
+    return ScoringServer(
+        batcher, max_body_bytes=settings.max_body_bytes, coerce=record_coercer(model.config)
+    )
+
+
+def serve(
+    model_path: Optional[Path] = None,
+    *,
+    config: ProjectConfig = DEFAULT_CONFIG,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> None:
+    """Load the forecaster once and serve it until interrupted.
+
+    Without ``model_path`` the registry's promoted version is served, falling
+    back to the unversioned artifact. Arrays are memory-mapped, so several
+    server processes on one host share a single copy.
+    """
+
+    registry = ModelRegistry.from_config(config)
+    if model_path is None and registry.current_version() is not None:
+        model_path = registry.get().model_path
+    model_path = model_path or config.paths.artifacts / "attendance_model.joblib"
+    model = AttendanceForecaster.load(model_path, mmap_mode="r")
+    LOGGER.info("Loaded attendance model from %s", model_path)
+    server = build_server(model, config=config)
+    try:
+        asyncio.run(server.serve(host or config.serving.host, port or config.serving.port))
+    except KeyboardInterrupt:
+        LOGGER.info("Shutting down.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve attendance predictions over HTTP.")
+    parser.add_argument("--model", type=Path, default=None, help="Saved forecaster (defaults to the registry's promoted version).")
+    parser.add_argument("--host", default=DEFAULT_CONFIG.serving.host)
+    parser.add_argument("--port", type=int, default=DEFAULT_CONFIG.serving.port)
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_CONFIG.serving.max_batch_size)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_CONFIG.serving.max_wait_ms)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    serving = replace(
+        DEFAULT_CONFIG.serving, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+    )
+    config = replace(DEFAULT_CONFIG, serving=serving)
+    serve(args.model, config=config, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Content-addressed on-disk cache for materialized FanSight datasets."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+_HASH_CHUNK = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 digest of a file's contents."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def frame_fingerprint(*frames: Union[pd.DataFrame, pd.Series]) -> str:
+    """SHA-256 of the frames' values, column names and dtypes (not their index)."""
+
+    digest = hashlib.sha256()
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+        dtypes = frame.dtypes.items() if isinstance(frame, pd.DataFrame) else [(frame.name, frame.dtype)]
+        digest.update(json.dumps([[str(c), str(t)] for c, t in dtypes]).encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+@dataclass
+class DatasetCache:
+    """Stores dataframes under a fingerprint of their inputs.
+
+    Entries are pickled so dtypes survive round trips. Hits refresh the entry's
+    modification time, and the oldest entries are evicted once the directory
+    grows beyond ``max_bytes``. Hit/miss counters are kept both for this
+    instance (``stats``) and cumulatively in ``stats.json``.
+    """
+
+    root: Path
+    max_bytes: int = 2 * 1024**3
+    stats: CacheStats = field(default_factory=CacheStats)
+
+    def __post_init__(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def _stats_path(self) -> Path:
+        return self.root / "stats.json"
+
+    @property
+    def _hash_index_path(self) -> Path:
+        return self.root / "file_hashes.json"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.pkl"
+
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text())
+        except json.JSONDecodeError:
+            LOGGER.warning("Ignoring corrupt cache metadata at %s", path)
+            return {}
+
+    def file_digest(self, path: Path) -> str:
+        """Hash a file, reusing the previous digest when size and mtime match."""
+
+        if not path.exists():
+            raise FileNotFoundError(f"Expected dataset at {path}")
+        index = self._read_json(self._hash_index_path)
+        stat = path.stat()
+        entry = index.get(str(path))
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+        digest = hash_file(path)
+        index[str(path)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        self._hash_index_path.write_text(json.dumps(index, indent=2))
+        return digest
+
+    def fingerprint(self, files: Iterable[Path], params: Dict[str, Any]) -> str:
+        """Build a cache key from input file contents and JSON-able parameters."""
+
+        digest = hashlib.sha256()
+        for path in sorted(Path(p) for p in files):
+            digest.update(path.name.encode())
+            digest.update(self.file_digest(path).encode())
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        path = self._entry_path(key)
+        if not path.exists():
+            self._record("misses")
+            return None
+        try:
+            df = pd.read_pickle(path)
+        except Exception:  # pragma: no cover - defensive against partial writes
+            LOGGER.warning("Dropping unreadable cache entry %s", path)
+            path.unlink(missing_ok=True)
+            self._record("misses")
+            return None
+        os.utime(path)
+        self._record("hits")
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> Path:
+        path = self._entry_path(key)
+        tmp = path.with_suffix(".tmp")
+        df.to_pickle(tmp)
+        os.replace(tmp, path)
+        self.evict()
+        return path
+
+    def entries(self) -> List[Path]:
+        """Return cache entries ordered from least to most recently used."""
+
+        return sorted(self.root.glob("*.pkl"), key=lambda p: p.stat().st_mtime_ns)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the size bound holds."""
+
+        entries = self.entries()
+        total = sum(p.stat().st_size for p in entries)
+        removed = 0
+        # Always keep the most recent entry, even if it alone exceeds the bound.
+        for path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            removed += 1
+        if removed:
+            self._record("evictions", removed)
+        return removed
+
+    def _record(self, counter: str, amount: int = 1) -> None:
+        setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+        totals = self._read_json(self._stats_path)
+        totals[counter] = totals.get(counter, 0) + amount
+        self._stats_path.write_text(json.dumps(totals, indent=2))
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize this session's and cumulative cache activity."""
+
+        entries = self.entries()
+        totals = self._read_json(self._stats_path)
+        return {
+            "session": self.stats.as_dict(),
+            "cumulative": {k: totals.get(k, 0) for k in ("hits", "misses", "evictions")},
+            "entries": len(entries),
+            "bytes": sum(p.stat().st_size for p in entries),
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,96 @@
+"""Memory-compact dtype conversion for FanSight tables."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+ID_COLUMNS = ("fan_id", "game_id")
+
+# Object columns with fewer distinct values than this share of rows become categoricals.
+CATEGORY_RATIO = 0.5
+
+_INT_LADDER = (
+    (np.int8, "Int8"),
+    (np.int16, "Int16"),
+    (np.int32, "Int32"),
+    (np.int64, "Int64"),
+)
+
+
+def _smallest_int(series: pd.Series, nullable: bool) -> str:
+    values = series.dropna()
+    low, high = (values.min(), values.max()) if len(values) else (0, 0)
+    for numpy_type, nullable_name in _INT_LADDER:
+        info = np.iinfo(numpy_type)
+        if info.min <= low and high <= info.max:
+            return nullable_name if nullable else np.dtype(numpy_type).name
+    return "Int64" if nullable else "int64"
+
+
+def _is_integral(series: pd.Series) -> bool:
+    values = series.dropna().to_numpy()
+    return bool(np.all(np.mod(values, 1) == 0))
+
+
+def compact_dtypes(
+    df: pd.DataFrame,
+    *,
+    categorical: Iterable[str] = (),
+    ids: Iterable[str] = ID_COLUMNS,
+) -> pd.DataFrame:
+    """Return ``df`` with smaller, lossless dtypes.
+
+    * ``categorical`` string columns and other low-cardinality strings become
+      ``category``; numeric flags listed as categorical are just downcast.
+    * ``ids`` become the smallest nullable integer that holds them.
+    * Other integers are downcast; floats become float32 only when every value
+      round-trips exactly, so model inputs never change.
+    """
+
+    categorical = set(categorical)
+    ids = set(ids)
+    converted = {}
+    for column in df.columns:
+        series = df[column]
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+            continue
+        if column in ids and pd.api.types.is_numeric_dtype(dtype):
+            if pd.api.types.is_float_dtype(dtype) and not _is_integral(series):
+                continue
+            converted[column] = series.astype(_smallest_int(series, nullable=True))
+        elif column in categorical and not pd.api.types.is_numeric_dtype(dtype):
+            converted[column] = series.astype("category")
+        elif pd.api.types.is_integer_dtype(dtype):
+            nullable = pd.api.types.is_extension_array_dtype(dtype)
+            target = _smallest_int(series, nullable=nullable)
+            if target != str(dtype):
+                converted[column] = series.astype(target)
+        elif pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+            narrowed = series.astype(np.float32)
+            if np.array_equal(narrowed.to_numpy(np.float64), series.to_numpy(np.float64), equal_nan=True):
+                converted[column] = narrowed
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if len(series) and series.nunique(dropna=True) < CATEGORY_RATIO * len(series):
+                converted[column] = series.astype("category")
+    if not converted:
+        return df
+    return df.assign(**converted)
+
+
+def dtype_savings(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Per-column memory (deep bytes) before and after :func:`compact_dtypes`."""
+
+    report = pd.DataFrame(
+        {
+            "dtype_before": before.dtypes.astype(str),
+            "dtype_after": after.dtypes.reindex(before.columns).astype(str),
+            "bytes_before": before.memory_usage(index=False, deep=True),
+            "bytes_after": after.memory_usage(index=False, deep=True).reindex(before.columns),
+        }
+    )
+    report["bytes_saved"] = report["bytes_before"] - report["bytes_after"]
+    return report.sort_values("bytes_saved", ascending=False)
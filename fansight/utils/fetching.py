@@ -0,0 +1,142 @@
+"""Rate-limited, resumable fetch engine shared by the data collector scripts."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CheckpointStore:
+    """One pickle per completed fetch unit; ``None`` records an empty unit (e.g. a 404)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: str) -> Path:
+        return self.root / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.pkl"
+
+    def has(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def saved_at(self, key: str) -> Optional[float]:
+        """Modification time of ``key``'s checkpoint, or ``None`` if absent."""
+
+        path = self.path(key)
+        return path.stat().st_mtime if path.exists() else None
+
+    def save(self, key: str, frame: Optional[pd.DataFrame]) -> None:
+        path = self.path(key)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as handle:
+            pickle.dump(frame, handle)
+        tmp.replace(path)
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        with self.path(key).open("rb") as handle:
+            return pickle.load(handle)
+
+    def clear(self) -> None:
+        for path in self.root.glob("*.pkl"):
+            path.unlink()
+
+
+@dataclass(frozen=True)
+class FetchUnit:
+    """A named, independently retryable piece of a larger download."""
+
+    key: str
+    fetch: Callable[[], Optional[pd.DataFrame]]
+
+
+def run_fetch_units(
+    units: Sequence[FetchUnit],
+    checkpoints: CheckpointStore,
+    *,
+    workers: int = 4,
+    refresh: Iterable[str] = (),
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """Fetch every unit not already checkpointed, using a bounded thread pool.
+
+    Each completed unit is checkpointed immediately, so a failure only loses
+    the units that failed; rerunning resumes from the remaining ones. Units
+    named in ``refresh`` are fetched even when checkpointed. Results are
+    returned keyed by unit in the order given.
+    """
+
+    refresh = set(refresh)
+    pending = [
+        unit for unit in units if unit.key in refresh or not checkpoints.has(unit.key)
+    ]
+    if len(pending) < len(units):
+        LOGGER.info("Skipping %d checkpointed units.", len(units) - len(pending))
+
+    failures: Dict[str, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(unit.fetch): unit for unit in pending}
+        for future in as_completed(futures):
+            unit = futures[future]
+            try:
+                frame = future.result()
+            except Exception as exc:
+                LOGGER.warning("Fetching %s failed: %s", unit.key, exc)
+                failures[unit.key] = exc
+                continue
+            checkpoints.save(unit.key, frame)
+            rows = 0 if frame is None else len(frame)
+            LOGGER.info("Fetched %s (%d rows).", unit.key, rows)
+
+    if failures:
+        keys = ", ".join(sorted(failures))
+        raise RuntimeError(
+            f"{len(failures)} of {len(units)} units failed ({keys}); "
+            "completed units are checkpointed, rerun to resume."
+        )
+    return {unit.key: checkpoints.load(unit.key) for unit in units}
+
+
+def merge_frames(frames: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Concatenate fetched frames in order, skipping empty units."""
+
+    present = [frame for frame in frames if frame is not None]
+    if not present:
+        raise RuntimeError("No data fetched.")
+    return pd.concat(present, ignore_index=True)
@@ -0,0 +1,115 @@
+"""On-disk HTTP response cache with conditional revalidation."""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+
+@dataclass
+class CachedResponse:
+    """A stored response plus anything derived from its body (e.g. a parsed table)."""
+
+    url: str
+    status_code: int
+    text: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+    parsed: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.text.encode()).hexdigest()
+
+    def validators(self) -> Dict[str, str]:
+        """Headers for a conditional GET against this entry."""
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Stores one pickle per URL under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+
+    def _path(self, url: str) -> Path:
+        return self.root / f"{hashlib.sha256(url.encode()).hexdigest()}.pkl"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        path = self._path(url)
+        if not path.exists():
+            return None
+        with path.open("rb") as handle:
+            return pickle.load(handle)
+
+    def put(self, entry: CachedResponse) -> None:
+        path = self._path(entry.url)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as handle:
+            pickle.dump(entry, handle)
+        tmp.replace(path)
+
+    def fetch(
+        self,
+        url: str,
+        request: Callable[[Dict[str, str]], requests.Response],
+        *,
+        revalidate: bool = True,
+    ) -> CachedResponse:
+        """Return the response for ``url``, touching the network only when needed.
+
+        ``request`` performs the GET with the given extra headers. Without
+        ``revalidate`` a cached entry is returned as-is; with it, a conditional
+        GET is issued and a 304 keeps the cached body (and its parsed data),
+        stamping it as fetched now.
+        Responses other than 200, 304 and 404 are raised, not cached.
+        """
+
+        entry = self.get(url)
+        if entry is not None and not revalidate:
+            self.hits += 1
+            return entry
+
+        resp = request(entry.validators() if entry is not None else {})
+        if resp.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            entry.fetched_at = time.time()
+            self.put(entry)
+            return entry
+        if resp.status_code not in (200, 404):
+            resp.raise_for_status()
+            raise requests.HTTPError(f"Unexpected status {resp.status_code} for {url}", response=resp)
+
+        self.downloads += 1
+        fresh = CachedResponse(
+            url=url,
+            status_code=resp.status_code,
+            text=resp.text if resp.status_code == 200 else "",
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        if entry is not None and entry.digest == fresh.digest:
+            # Same body without validators: keep previously parsed data.
+            fresh.parsed = entry.parsed
+        self.put(fresh)
+        return fresh
+
+    def report(self) -> Dict[str, int]:
+        return {"hits": self.hits, "revalidated": self.revalidated, "downloads": self.downloads}
@@ -2,13 +2,104 @@
 
 from __future__ import annotations
 
+import operator
+import os
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
 from fansight.config import DEFAULT_CONFIG, ProjectConfig
 
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pa_ds = pq = None
+
+FORMAT_SUFFIXES: Dict[str, str] = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
+# (column, operator, value) triples combined with AND, mirroring pyarrow filters.
+Filter = Tuple[str, str, Any]
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+CSV_CHUNKSIZE = 250_000
+
+
+def _require_pyarrow() -> None:
+    if pa_ds is None:  # pragma: no cover - optional dependency
+        raise ImportError("pyarrow is required for Parquet/Feather storage. Install via `pip install pyarrow`.")
+
+
+def format_from_path(path: Path) -> str:
+    """Infer the storage format from a file suffix."""
+
+    for fmt, suffix in FORMAT_SUFFIXES.items():
+        if path.suffix == suffix:
+            return fmt
+    raise ValueError(f"Unsupported storage format for {path}")
+
+
+def apply_filters(df: pd.DataFrame, filters: Optional[Sequence[Filter]]) -> pd.DataFrame:
+    """Keep rows matching every (column, op, value) filter."""
+
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if op == "in":
+            mask &= df[column].isin(value)
+        elif op == "not in":
+            mask &= ~df[column].isin(value)
+        elif op in _OPERATORS:
+            mask &= _OPERATORS[op](df[column], value)
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+    return df.loc[mask]
+
+
+def _arrow_expression(filters: Sequence[Filter]):
+    expression = None
+    for column, op, value in filters:
+        field_ = pa_ds.field(column)
+        if op == "in":
+            term = field_.isin(list(value))
+        elif op == "not in":
+            term = ~field_.isin(list(value))
+        elif op in _OPERATORS:
+            term = _OPERATORS[op](field_, value)
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        expression = term if expression is None else expression & term
+    return expression
+
+
+def _coerce_dtypes(
+    df: pd.DataFrame,
+    parse_dates: Iterable[str],
+    dtype: Optional[dict],
+) -> pd.DataFrame:
+    for column in parse_dates:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = pd.to_datetime(df[column])
+    for column, target in (dtype or {}).items():
+        if column in df.columns and df[column].dtype != pd.api.types.pandas_dtype(target):
+            df[column] = df[column].astype(target)
+    return df
+
 
 def load_csv(
     path: Path,
@@ -22,16 +113,214 @@ def load_csv(
     return pd.read_csv(path, parse_dates=list(parse_dates or ()), dtype=dtype)
 
 
+def _read_csv_table(
+    path: Path,
+    columns: Optional[List[str]],
+    filters: Optional[Sequence[Filter]],
+    parse_dates: List[str],
+    dtype: Optional[dict],
+) -> pd.DataFrame:
+    # Filter columns must be read even when they are projected away afterwards.
+    if columns is not None:
+        usecols = list(dict.fromkeys(columns + [f[0] for f in filters or ()]))
+        present = usecols
+    else:
+        usecols = None
+        present = list(pd.read_csv(path, nrows=0).columns)
+    read_kwargs = dict(
+        usecols=usecols,
+        parse_dates=[c for c in parse_dates if c in present],
+        dtype={k: v for k, v in (dtype or {}).items() if k in present} or None,
+    )
+    if filters:
+        chunks = [
+            apply_filters(chunk, filters)
+            for chunk in pd.read_csv(path, chunksize=CSV_CHUNKSIZE, **read_kwargs)
+        ]
+        df = pd.concat(chunks, ignore_index=True)
+    else:
+        df = pd.read_csv(path, **read_kwargs)
+    return df[columns] if columns is not None else df
+
+
+def _read_arrow_table(
+    path: Path,
+    fmt: str,
+    columns: Optional[List[str]],
+    filters: Optional[Sequence[Filter]],
+) -> pd.DataFrame:
+    _require_pyarrow()
+    dataset = pa_ds.dataset(path, format="ipc" if fmt == "feather" else fmt)
+    table = dataset.to_table(
+        columns=columns,
+        filter=_arrow_expression(filters) if filters else None,
+    )
+    return table.to_pandas()
+
+
+def load_table(
+    path: Path,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+    parse_dates: Optional[Iterable[str]] = None,
+    dtype: Optional[dict] = None,
+) -> pd.DataFrame:
+    """Load a CSV, Parquet or Feather table with projection and row filters.
+
+    Parquet and Feather push ``columns`` and ``filters`` down into pyarrow so
+    skipped columns and row groups are never materialized; CSV reads only the
+    projected columns and filters chunk by chunk.
+    """
+
+    if not path.exists():
+        raise FileNotFoundError(f"Expected dataset at {path}")
+    fmt = format_from_path(path)
+    parse_dates = list(parse_dates or ())
+    columns = list(columns) if columns is not None else None
+    if fmt == "csv":
+        df = _read_csv_table(path, columns, filters, parse_dates, dtype)
+    else:
+        df = _read_arrow_table(path, fmt, columns, filters)
+    return _coerce_dtypes(df.reset_index(drop=True), parse_dates, dtype)
+
+
+def iter_table(
+    path: Path,
+    *,
+    chunksize: int = CSV_CHUNKSIZE,
+    columns: Optional[Sequence[str]] = None,
+    parse_dates: Optional[Iterable[str]] = None,
+    dtype: Optional[dict] = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a table in chunks of at most ``chunksize`` rows."""
+
+    if not path.exists():
+        raise FileNotFoundError(f"Expected dataset at {path}")
+    fmt = format_from_path(path)
+    parse_dates = list(parse_dates or ())
+    columns = list(columns) if columns is not None else None
+    if fmt == "csv":
+        present = columns if columns is not None else list(pd.read_csv(path, nrows=0).columns)
+        chunks = pd.read_csv(
+            path,
+            chunksize=chunksize,
+            usecols=columns,
+            parse_dates=[c for c in parse_dates if c in present],
+            dtype={k: v for k, v in (dtype or {}).items() if k in present} or None,
+        )
+    else:
+        _require_pyarrow()
+        dataset = pa_ds.dataset(path, format="ipc" if fmt == "feather" else fmt)
+        chunks = (
+            batch.to_pandas()
+            for batch in dataset.to_batches(columns=columns, batch_size=chunksize)
+        )
+    for chunk in chunks:
+        yield _coerce_dtypes(chunk, parse_dates, dtype)
+
+
+def _widen_null_fields(schema: "pa.Schema") -> "pa.Schema":
+    # An all-None object column infers as ``null``, which later pieces with
+    # real values cannot be cast to.
+    for index, field_ in enumerate(schema):
+        if pa.types.is_null(field_.type):
+            schema = schema.set(index, field_.with_type(pa.string()))
+    return schema
+
+
+class TableWriter:
+    """Append dataframes to a CSV, Parquet or Feather file piece by piece.
+
+    Arrow-backed formats fix their schema from ``schema`` or the first piece
+    and cast later pieces to it, so partitions with all-missing columns still
+    line up. Columns the first piece leaves untyped (all ``None``) are widened
+    to strings rather than frozen as ``null``.
+    """
+
+    def __init__(self, path: Path, create_dirs: bool = True, schema: Optional["pa.Schema"] = None) -> None:
+        self.path = path
+        self.fmt = format_from_path(path)
+        self.rows = 0
+        self._writer = None
+        self._schema = schema
+        self._header_written = False
+        if create_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fmt != "csv":
+            _require_pyarrow()
+        path.unlink(missing_ok=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.fmt == "csv":
+            df.to_csv(self.path, mode="a", header=not self._header_written, index=False)
+            self._header_written = True
+        else:
+            if self._schema is None:
+                self._schema = _widen_null_fields(pa.Schema.from_pandas(df, preserve_index=False))
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            if self._writer is None:
+                if self.fmt == "parquet":
+                    self._writer = pq.ParquetWriter(self.path, self._schema)
+                else:
+                    self._writer = pa.ipc.new_file(str(self.path), self._schema)
+            self._writer.write_table(table)
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
 def save_dataframe(
     df: pd.DataFrame,
     path: Path,
     create_dirs: bool = True,
 ) -> None:
-    """Persist a dataframe as CSV."""
+    """Persist a dataframe in the format implied by the path suffix."""
 
     if create_dirs:
         path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(path, index=False)
+    fmt = format_from_path(path)
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+        return
+    _require_pyarrow()
+    if fmt == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(path)
+
+
+def append_table(df: pd.DataFrame, path: Path) -> pd.DataFrame:
+    """Append rows to an existing table and return them aligned to its columns.
+
+    Columns the table lacks are dropped and columns ``df`` lacks are left
+    empty, so what is returned is exactly what a later load reads back. CSV
+    rows are appended in place; Parquet and Feather files are rewritten whole
+    and swapped in atomically.
+    """
+
+    if not path.exists():
+        raise FileNotFoundError(f"Expected dataset at {path}")
+    fmt = format_from_path(path)
+    if fmt == "csv":
+        rows = df.reindex(columns=list(pd.read_csv(path, nrows=0).columns))
+        rows.to_csv(path, mode="a", header=False, index=False)
+        return rows
+    existing = load_table(path)
+    rows = df.reindex(columns=list(existing.columns))
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    save_dataframe(pd.concat([existing, rows], ignore_index=True), tmp, create_dirs=False)
+    os.replace(tmp, path)
+    return rows
 
 
 def get_processed_path(
@@ -40,4 +329,5 @@ def get_processed_path(
 ) -> Path:
     """Return a canonical processed-data path for a given dataset name."""
 
-    return config.paths.processed / f"{name}.csv"
+    suffix = FORMAT_SUFFIXES[config.paths.format_for(name)]
+    return config.paths.processed / f"{name}{suffix}"
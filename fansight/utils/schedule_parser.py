@@ -0,0 +1,92 @@
+"""Targeted lxml parser for Basketball-Reference schedule tables."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+from lxml import etree
+
+
+def _to_int(text: str) -> Optional[int]:
+    digits = text.replace(",", "")
+    return int(digits) if digits.isdigit() else None
+
+
+# Header text -> converter applied to each cell's text while parsing.
+SCHEDULE_COLUMNS: Dict[str, Callable[[str], object]] = {
+    "Date": lambda text: text or None,
+    "Start (ET)": lambda text: text or None,
+    "Visitor/Neutral": lambda text: text or None,
+    "Home/Neutral": lambda text: text or None,
+    "Attend.": _to_int,
+    "Notes": lambda text: text or None,
+}
+DATE_FORMAT = "%a, %b %d, %Y"
+# Bump whenever parsed output changes so cached parse results are rebuilt.
+PARSER_VERSION = 1
+
+_PARSER = etree.HTMLParser()
+
+
+def _find_table(html: str, table_id: str):
+    """Parse only the ``<table id=table_id>`` fragment; fall back to the first table."""
+
+    for marker in (f'id="{table_id}"', f"id='{table_id}'"):
+        found = html.find(marker)
+        start = html.rfind("<table", 0, found) if found != -1 else -1
+        end = html.find("</table>", found) if start != -1 else -1
+        if end != -1:
+            html = html[start : end + len("</table>")]
+            break
+    root = etree.fromstring(html, _PARSER)
+    tables = root.xpath("//table") if root is not None else []
+    return tables[0] if tables else None
+
+
+def _cell_text(cell) -> str:
+    return "".join(cell.itertext()).strip()
+
+
+def parse_schedule_table(
+    html: str,
+    *,
+    table_id: str = "schedule",
+    required: str = "Visitor/Neutral",
+) -> Optional[pd.DataFrame]:
+    """Extract the :data:`SCHEDULE_COLUMNS` of one schedule page.
+
+    Only the schedule table is parsed and only the needed cells are read;
+    attendance becomes ``Int64`` and dates ``datetime64`` (unparseable dates
+    become ``NaT``). Repeated header rows and rows without ``required`` are
+    skipped. Returns ``None`` when the page has no table.
+    """
+
+    table = _find_table(html, table_id)
+    if table is None:
+        return None
+    header_rows = table.xpath("./thead/tr") or table.xpath(".//tr[th][1]")
+    if not header_rows:
+        return None
+    headers = [_cell_text(cell) for cell in header_rows[-1]]
+    positions = {name: headers.index(name) for name in SCHEDULE_COLUMNS if name in headers}
+    if required not in positions:
+        return None
+
+    values: Dict[str, List[object]] = {name: [] for name in SCHEDULE_COLUMNS}
+    body = table.xpath("./tbody/tr") or table.xpath(".//tr")[len(header_rows) :]
+    for row in body:
+        if "thead" in (row.get("class") or ""):
+            continue
+        cells = list(row)
+        if len(cells) <= positions[required] or not _cell_text(cells[positions[required]]):
+            continue
+        for name, convert in SCHEDULE_COLUMNS.items():
+            position = positions.get(name)
+            text = _cell_text(cells[position]) if position is not None and position < len(cells) else ""
+            values[name].append(convert(text))
+
+    df = pd.DataFrame({name: pd.Series(column, dtype=object) for name, column in values.items()})
+    df["Date"] = pd.to_datetime(df["Date"], format=DATE_FORMAT, errors="coerce")
+    df["Attend."] = pd.array(values["Attend."], dtype="Int64")
+    return df